@@ -0,0 +1,10 @@
+import pytest
+
+
+@pytest.fixture()
+def installed_directory(request, directory):
+    """
+    Sets directory fixture of the test module to its DIRECTORY_HOLDER for the test
+    """
+    with request.module.DIRECTORY_HOLDER.using(directory):
+        yield directory
@@ -0,0 +1,161 @@
+import struct
+
+import pytest
+from pydantic import ValidationError
+
+from tests.payment_order.testdata import VALID_BIC
+from vitya.payment_order.directories.bic import (
+    BICDirectory,
+    BICInfo,
+    bic_directory_holder,
+    build_bic_index,
+    build_bic_index_from_file,
+    get_bic_directory,
+    iter_bic_dbf,
+    iter_ed807,
+)
+from vitya.payment_order.errors import (
+    ReceiverBICValidationInactiveError,
+    ReceiverBICValidationNotFoundError,
+)
+from vitya.payment_order.fields import ReceiverBIC
+from vitya.payment_order.payments.checkers import (
+    BaseModelChecker,
+    ReceiverBICDirectoryChecker,
+)
+from vitya.payment_order.payments.checks import check_receiver_bic_in_directory
+
+ED807 = '''<?xml version="1.0" encoding="UTF-8"?>
+<ED807 xmlns="urn:cbr-ru:ed:v2.0" EDNo="1" EDDate="2024-01-01" EDAuthor="4583001999">
+  <BICDirectoryEntry BIC="045004864">
+    <ParticipantInfo NameP="ФИЛИАЛ БАНКА" ParticipantStatus="PSAC" PtType="20"/>
+    <Accounts Account="30101810000000000999" RegulationAccountType="CRSA" AccountStatus="ACDL"/>
+    <Accounts Account="30101810150040000864" RegulationAccountType="CRSA" AccountStatus="ACAC"/>
+    <Accounts Account="30102810150040000864" RegulationAccountType="CBRA" AccountStatus="ACAC"/>
+  </BICDirectoryEntry>
+  <BICDirectoryEntry BIC="044525000">
+    <ParticipantInfo NameP="ГУ БАНКА РОССИИ" ParticipantStatus="PSAC" PtType="52"/>
+  </BICDirectoryEntry>
+  <BICDirectoryEntry BIC="044525999">
+    <ParticipantInfo NameP="ЗАКРЫТЫЙ БАНК" ParticipantStatus="PSDL" PtType="20"/>
+    <Accounts Account="30101810400000000999" RegulationAccountType="CRSA" AccountStatus="ACDL"/>
+  </BICDirectoryEntry>
+</ED807>
+'''
+
+EXPECTED = [
+    BICInfo('045004864', 'ФИЛИАЛ БАНКА', 'PSAC', '30101810150040000864'),
+    BICInfo('044525000', 'ГУ БАНКА РОССИИ', 'PSAC', None),
+    BICInfo('044525999', 'ЗАКРЫТЫЙ БАНК', 'PSDL', '30101810400000000999'),
+]
+
+DIRECTORY_HOLDER = bic_directory_holder
+
+
+def write_dbf(path, records, deleted=()):
+    fields = [('NEWNUM', 9), ('NAMEP', 45), ('KSNP', 20)]
+    record_len = 1 + sum(length for _, length in fields)
+    header_len = 32 + 32 * len(fields) + 1
+    with open(path, 'wb') as f:
+        f.write(struct.pack('<B3xIHH20x', 3, len(records), header_len, record_len))
+        for name, length in fields:
+            f.write(struct.pack('<11sc4xBB14x', name.encode(), b'C', length, 0))
+        f.write(b'\x0D')
+        for index, record in enumerate(records):
+            f.write(b'*' if index in deleted else b' ')
+            for value, (_, length) in zip(record, fields):
+                f.write(value.encode('cp866').ljust(length))
+        f.write(b'\x1A')
+
+
+@pytest.fixture()
+def ed807_path(tmp_path):
+    path = tmp_path / 'ed807.xml'
+    path.write_text(ED807, encoding='utf-8')
+    return path
+
+
+@pytest.fixture()
+def directory(ed807_path, tmp_path):
+    index_path = tmp_path / 'bic.idx'
+    assert build_bic_index_from_file(ed807_path, index_path) == 3
+    with BICDirectory(index_path) as directory:
+        yield directory
+
+
+def test_iter_ed807(ed807_path):
+    assert list(iter_ed807(ed807_path)) == EXPECTED
+
+
+def test_iter_bic_dbf(tmp_path):
+    path = tmp_path / 'bnkseek.dbf'
+    write_dbf(
+        path,
+        [('045004864', 'ФИЛИАЛ БАНКА', '30101810150040000864'), ('044525999', 'УДАЛЕН', ''), ('044525000', 'ГУ', '')],
+        deleted={1},
+    )
+    assert list(iter_bic_dbf(path)) == [
+        BICInfo('045004864', 'ФИЛИАЛ БАНКА', 'PSAC', '30101810150040000864'),
+        BICInfo('044525000', 'ГУ', 'PSAC', None),
+    ]
+
+    index_path = tmp_path / 'bic.idx'
+    assert build_bic_index_from_file(path, index_path) == 2
+    with BICDirectory(index_path) as directory:
+        assert directory.get('044525000') == BICInfo('044525000', 'ГУ', 'PSAC', None)
+
+
+def test_directory_lookup(directory):
+    assert len(directory) == 3
+    for info in EXPECTED:
+        assert directory.get(info.bic) == info
+        assert info.bic in directory
+    assert directory.is_active('045004864')
+    assert not directory.is_active('044525999')
+    assert not directory.is_active('044525001')
+    assert directory.get('044525001') is None
+    assert directory.get('04452500') is None
+    assert directory.get('04452500a') is None
+    assert 44525000 not in directory
+
+
+def test_directory_many_entries(tmp_path):
+    entries = [BICInfo(f'04{i:07d}', f'bank {i}', 'PSAC', f'30101810{i:012d}') for i in range(0, 50000, 7)]
+    build_bic_index(entries, tmp_path / 'bic.idx')
+    with BICDirectory(tmp_path / 'bic.idx') as directory:
+        assert len(directory) == len(entries)
+        assert all(directory.get(entry.bic) == entry for entry in entries)
+        assert directory.get('040000001') is None
+
+
+def test_not_an_index(tmp_path):
+    path = tmp_path / 'bic.idx'
+    path.write_bytes(b'garbage' * 10)
+    with pytest.raises(ValueError):
+        BICDirectory(path)
+
+
+def test_check_receiver_bic_without_directory():
+    assert get_bic_directory() is None
+    assert check_receiver_bic_in_directory('044525001') == '044525001'
+
+
+def test_check_receiver_bic_in_directory(installed_directory):
+    assert check_receiver_bic_in_directory(VALID_BIC) == VALID_BIC
+    with pytest.raises(ReceiverBICValidationNotFoundError):
+        check_receiver_bic_in_directory('044525001')
+    with pytest.raises(ReceiverBICValidationInactiveError):
+        check_receiver_bic_in_directory('044525999')
+
+
+class BICDirectoryModel(BaseModelChecker):
+    bic: ReceiverBIC
+
+    __extra_wired_checkers__ = [(ReceiverBICDirectoryChecker, ['bic'])]
+
+
+def test_receiver_bic_directory_checker(installed_directory):
+    assert BICDirectoryModel(bic=VALID_BIC).bic == VALID_BIC
+    with pytest.raises(ValidationError) as exc_info:
+        BICDirectoryModel(bic='044525001')
+    assert isinstance(exc_info.value.raw_errors[0].exc.errors[0], ReceiverBICValidationNotFoundError)
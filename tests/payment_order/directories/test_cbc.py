@@ -0,0 +1,123 @@
+import pytest
+
+from tests.payment_order.testdata import VALID_CBC
+from vitya.payment_order.directories.cbc import (
+    CBCDirectory,
+    cbc_directory_holder,
+    get_cbc_directory,
+    iter_cbc_file,
+)
+from vitya.payment_order.enums import PaymentType
+from vitya.payment_order.errors import (
+    CBCValidationAdministratorNotFoundError,
+    CBCValidationCustomsAdministratorError,
+    CBCValidationFNSAdministratorError,
+    CBCValidationNotFoundError,
+)
+from vitya.payment_order.fields import CBC
+from vitya.payment_order.payments.checkers import BaseModelChecker, CBCDirectoryChecker
+from vitya.payment_order.payments.checks import check_cbc_with_directory
+
+CUSTOMS_CBC = '15310101000010000110'
+OTHER_CBC = '32111603132010000140'
+
+CBC_FILE = '''Код бюджетной классификации;Наименование
+182 1 01 02010 01 1000 110;НДФЛ
+18201061201010000510;Единый налоговый платеж
+15310101000010000110;Таможенные платежи
+
+32111603132010000140;Штрафы
+not a code;-
+'''
+
+DIRECTORY_HOLDER = cbc_directory_holder
+
+
+@pytest.fixture()
+def directory(tmp_path):
+    path = tmp_path / 'cbc.csv'
+    path.write_text(CBC_FILE, encoding='utf-8')
+    return CBCDirectory.from_file(path)
+
+
+def test_iter_cbc_file(tmp_path):
+    path = tmp_path / 'cbc.csv'
+    path.write_text(CBC_FILE, encoding='utf-8')
+    assert list(iter_cbc_file(path)) == ['18210102010011000110', VALID_CBC, CUSTOMS_CBC, OTHER_CBC]
+
+
+def test_directory(directory):
+    assert len(directory) == 4
+    assert VALID_CBC in directory
+    assert CUSTOMS_CBC in directory
+    assert '18210102010011000111' not in directory
+    assert '99910102010011000110' not in directory
+    assert '1821010201001100011' not in directory
+    assert 18210102010011000110 not in directory
+    assert directory.has_administrator('182')
+    assert not directory.has_administrator('999')
+    assert sorted(directory.administrators) == ['153', '182', '321']
+
+
+def test_directory_dedup():
+    assert len(CBCDirectory([VALID_CBC, VALID_CBC, CUSTOMS_CBC])) == 2
+
+
+@pytest.mark.parametrize(
+    'value, payment_type, exception',
+    [
+        (None, PaymentType.FNS, None),
+        (OTHER_CBC, PaymentType.LE, None),
+        (VALID_CBC, PaymentType.FNS, None),
+        (CUSTOMS_CBC, PaymentType.FNS, CBCValidationFNSAdministratorError),
+        (CUSTOMS_CBC, PaymentType.CUSTOMS, None),
+        (VALID_CBC, PaymentType.CUSTOMS, CBCValidationCustomsAdministratorError),
+        ('99910102010011000110', PaymentType.BUDGET_OTHER, None),
+    ]
+)
+def test_check_cbc_without_directory(value, payment_type, exception):
+    if exception is None:
+        assert check_cbc_with_directory(value, payment_type) == value
+    else:
+        with pytest.raises(exception):
+            check_cbc_with_directory(value, payment_type)
+
+
+@pytest.mark.parametrize(
+    'value, payment_type, exception',
+    [
+        (VALID_CBC, PaymentType.FNS, None),
+        (OTHER_CBC, PaymentType.BUDGET_OTHER, None),
+        ('18210102010011000111', PaymentType.FNS, CBCValidationNotFoundError),
+        ('99910102010011000110', PaymentType.BUDGET_OTHER, CBCValidationAdministratorNotFoundError),
+        ('99910102010011000110', PaymentType.LE, None),
+    ]
+)
+def test_check_cbc_with_directory(installed_directory, value, payment_type, exception):
+    if exception is None:
+        assert check_cbc_with_directory(value, payment_type) == value
+    else:
+        with pytest.raises(exception):
+            check_cbc_with_directory(value, payment_type)
+
+
+def test_cbc_directory_checker(installed_directory):
+    class Payment(BaseModelChecker):
+        cbc: CBC
+        payment_type: PaymentType
+
+        __extra_wired_checkers__ = [(CBCDirectoryChecker, ['cbc', 'payment_type'])]
+
+    assert Payment(cbc=VALID_CBC, payment_type=PaymentType.FNS).cbc == VALID_CBC
+    with pytest.raises(ValueError):
+        Payment(cbc='18210102010011000111', payment_type=PaymentType.FNS)
+
+
+def test_directory_holder_using(directory):
+    assert cbc_directory_holder.get() is None
+    with cbc_directory_holder.using(directory):
+        assert get_cbc_directory() is directory
+        with cbc_directory_holder.using(None):
+            assert get_cbc_directory() is None
+        assert get_cbc_directory() is directory
+    assert get_cbc_directory() is None
@@ -0,0 +1,102 @@
+import pickle
+
+import pytest
+
+from tests.payment_order.testdata import VALID_OKTMO
+from vitya.payment_order.directories.oktmo import (
+    OKTMODirectory,
+    get_oktmo_ancestors,
+    iter_oktmo_file,
+    oktmo_directory_holder,
+)
+from vitya.payment_order.enums import PaymentType
+from vitya.payment_order.errors import OKTMOValidationNotFoundError
+from vitya.payment_order.payments.checkers import (
+    BaseModelChecker,
+    OKTMODirectoryChecker,
+)
+from vitya.payment_order.payments.checks import check_oktmo_in_directory
+from vitya.pydantic_fields import OKTMO
+
+OKTMO_FILE = '''"Код1";"Код2";"Код3";"Код4";"КЧ";"Раздел";"Наименование"
+"45";"000";"000";"000";"1";"1";"Москва"
+"45";"328";"000";"000";"5";"1";"муниципальный округ Мещанский"
+"25";"000";"000";"000";"2";"1";"Иркутская область"
+"25";"600";"000";"000";"8";"1";"Нижнеудинский муниципальный район"
+"25";"600";"101";"000";"1";"1";"Алзамайское"
+"25";"600";"101";"051";"1";"2";"г Алзамай"
+"25";"600";"101";"052";"1";"2";"с Аршан"
+'''
+
+DIRECTORY_HOLDER = oktmo_directory_holder
+
+
+@pytest.fixture()
+def directory(tmp_path):
+    path = tmp_path / 'oktmo.csv'
+    path.write_text(OKTMO_FILE, encoding='cp1251')
+    return OKTMODirectory.from_file(path)
+
+
+def test_iter_oktmo_file(tmp_path):
+    path = tmp_path / 'oktmo.csv'
+    path.write_text(OKTMO_FILE + '"25600101053"\n"bad"\n', encoding='cp1251')
+    assert list(iter_oktmo_file(path)) == [
+        '45000000', '45328000', '25000000', VALID_OKTMO, '25600101', '25600101051', '25600101052', '25600101053',
+    ]
+
+
+def test_directory(directory):
+    assert len(directory) == 7
+    assert VALID_OKTMO in directory
+    assert '25600000000' in directory
+    assert '25600101051' in directory
+    assert '25600101053' not in directory
+    assert '2560010' not in directory
+    assert 25600000 not in directory
+
+
+def test_get_oktmo_ancestors():
+    assert get_oktmo_ancestors('25600101051') == ['25600101', '25600000', '25000000']
+    assert get_oktmo_ancestors('25600101') == ['25600000', '25000000']
+    assert get_oktmo_ancestors('45328000') == ['45000000']
+    assert get_oktmo_ancestors('45000000') == []
+    assert get_oktmo_ancestors('abc') == []
+
+
+def test_get_parent(directory):
+    assert directory.get_parent('25600101051') == '25600101'
+    assert directory.get_parent('25600101') == VALID_OKTMO
+    assert directory.get_parent('25600102051') == VALID_OKTMO
+    assert directory.get_parent('45328000') == '45000000'
+    assert directory.get_parent('45000000') is None
+    assert directory.get_parent('77100000') is None
+
+
+def test_directory_pickle(directory):
+    assert VALID_OKTMO in pickle.loads(pickle.dumps(directory))
+
+
+def test_check_oktmo_in_directory(installed_directory):
+    assert check_oktmo_in_directory(VALID_OKTMO, PaymentType.BUDGET_OTHER) == VALID_OKTMO
+    assert check_oktmo_in_directory(None, PaymentType.FNS) is None
+    assert check_oktmo_in_directory('0', PaymentType.FNS) == '0'
+    assert check_oktmo_in_directory('77100000', PaymentType.LE) == '77100000'
+    with pytest.raises(OKTMOValidationNotFoundError):
+        check_oktmo_in_directory('77100000', PaymentType.FNS)
+
+
+def test_check_oktmo_without_directory():
+    assert check_oktmo_in_directory('77100000', PaymentType.FNS) == '77100000'
+
+
+def test_oktmo_directory_checker(installed_directory):
+    class Payment(BaseModelChecker):
+        oktmo: OKTMO
+        payment_type: PaymentType
+
+        __extra_wired_checkers__ = [(OKTMODirectoryChecker, ['oktmo', 'payment_type'])]
+
+    assert Payment(oktmo=VALID_OKTMO, payment_type=PaymentType.FNS).oktmo == VALID_OKTMO
+    with pytest.raises(ValueError):
+        Payment(oktmo='77100000', payment_type=PaymentType.FNS)
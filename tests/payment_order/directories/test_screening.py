@@ -0,0 +1,110 @@
+import random
+from typing import Optional
+
+import pytest
+from pydantic import ValidationError
+
+from tests.payment_order.testdata import IP_INN, LE_INN
+from vitya.payment_order.directories.screening import (
+    INNBloomFilter,
+    INNScreeningList,
+    build_inn_bloom_filter,
+    build_inn_screening_list,
+    inn_screening_holder,
+    iter_inn_file,
+    open_inn_screening,
+)
+from vitya.payment_order.errors import ReceiverINNValidationScreeningError
+from vitya.payment_order.fields import ReceiverINN
+from vitya.payment_order.payments.checkers import (
+    BaseModelChecker,
+    ReceiverINNScreeningChecker,
+)
+from vitya.payment_order.payments.checks import check_receiver_inn_screening
+
+LISTED = [LE_INN, '01234', '7707083893']
+NOT_LISTED = [IP_INN, '0000001234', '000000001234', '7707083894', 'abc', '']
+
+DIRECTORY_HOLDER = inn_screening_holder
+
+
+@pytest.fixture(params=[build_inn_screening_list, build_inn_bloom_filter])
+def directory(request, tmp_path):
+    path = tmp_path / 'inn.bin'
+    assert request.param(LISTED + ['bad', '123'], path) == 3
+    with open_inn_screening(path) as screening:
+        yield screening
+
+
+def test_iter_inn_file(tmp_path):
+    path = tmp_path / 'inn.csv'
+    path.write_text(f'ИНН;Наименование\n{LE_INN};ООО\n 01234 ;КИО\nbad;\n', encoding='utf-8')
+    assert list(iter_inn_file(path)) == [LE_INN, '01234']
+
+
+def test_contains(directory):
+    assert len(directory) == 3
+    for inn in LISTED:
+        assert directory.contains(inn)
+        assert inn in directory
+    for inn in NOT_LISTED:
+        assert not directory.contains(inn)
+    assert None not in directory
+
+
+def test_contains_many(directory):
+    inns = NOT_LISTED + LISTED + NOT_LISTED[::-1] + LISTED[::-1]
+    assert directory.contains_many(inns) == [inn in LISTED for inn in inns]
+
+
+def test_open_detects_format(tmp_path):
+    build_inn_screening_list(LISTED, tmp_path / 'sorted.bin')
+    build_inn_bloom_filter(LISTED, tmp_path / 'bloom.bin')
+    with open_inn_screening(tmp_path / 'sorted.bin') as screening:
+        assert isinstance(screening, INNScreeningList)
+    with open_inn_screening(tmp_path / 'bloom.bin') as screening:
+        assert isinstance(screening, INNBloomFilter)
+    with pytest.raises(ValueError):
+        INNBloomFilter(tmp_path / 'sorted.bin')
+    with pytest.raises(ValueError):
+        INNScreeningList(tmp_path / 'bloom.bin')
+
+
+def test_empty_list(tmp_path):
+    build_inn_screening_list([], tmp_path / 'empty.bin')
+    with INNScreeningList(tmp_path / 'empty.bin') as screening:
+        assert screening.contains_many(LISTED) == [False] * len(LISTED)
+
+
+def test_bloom_filter_error_rate(tmp_path):
+    rnd = random.Random(0)
+    inns = {str(rnd.randrange(10 ** 9, 10 ** 10)) for _ in range(20000)}
+    others = [str(rnd.randrange(10 ** 11, 10 ** 12)) for _ in range(20000)]
+    build_inn_bloom_filter(inns, tmp_path / 'bloom.bin', error_rate=0.01)
+    with INNBloomFilter(tmp_path / 'bloom.bin') as screening:
+        assert all(screening.contains_many(inns))
+        assert sum(screening.contains_many(others)) < len(others) * 0.02
+    with pytest.raises(ValueError):
+        build_inn_bloom_filter(inns, tmp_path / 'bloom.bin', error_rate=0)
+
+
+def test_check_without_list():
+    assert check_receiver_inn_screening(LE_INN) == LE_INN
+
+
+def test_check(installed_directory):
+    assert check_receiver_inn_screening(None) is None
+    assert check_receiver_inn_screening(IP_INN) == IP_INN
+    with pytest.raises(ReceiverINNValidationScreeningError):
+        check_receiver_inn_screening(LE_INN)
+
+
+def test_checker(installed_directory):
+    class Payment(BaseModelChecker):
+        receiver_inn: Optional[ReceiverINN]
+
+        __extra_wired_checkers__ = [(ReceiverINNScreeningChecker, ['receiver_inn'])]
+
+    Payment(receiver_inn=IP_INN)
+    with pytest.raises(ValidationError):
+        Payment(receiver_inn=LE_INN)
@@ -0,0 +1,101 @@
+import io
+import json
+from decimal import Decimal
+
+import pytest
+
+from tests.payment_order.ingest.test_xml_messages import XMLPayment
+from tests.payment_order.testdata import IP_ACCOUNT, IP_INN, VALID_BIC
+from vitya.payment_order.ingest.jsonl import (
+    get_json_decoder,
+    iter_validate_jsonl,
+    stdlib_json_decoder,
+)
+from vitya.payment_order.ingest.mapping import IngestResult
+from vitya.payment_order.payments.batch import ProcessPoolBatchValidator
+
+ROW = {
+    'amount': '1000.50',
+    'receiver_account_number': IP_ACCOUNT,
+    'receiver_bic': VALID_BIC,
+    'receiver_inn': IP_INN,
+    'purpose': 'Оплата по счету 1',
+    'payment_type': 'ip',
+}
+
+LINES = [
+    json.dumps(ROW),
+    '',
+    json.dumps({**ROW, 'receiver_bic': '045004861'}),
+    '{"amount": ',
+    '[1, 2]',
+    json.dumps({**ROW, 'amount': 0}),
+    json.dumps(ROW),
+]
+
+EXPECTED = [
+    IngestResult(1, None, ()),
+    IngestResult(3, None, ('ReceiverAccountValidationBICValueError',)),
+    IngestResult(4, None, ('JSONDecodeError',)),
+    IngestResult(5, None, ('JSONNotObjectError',)),
+    IngestResult(6, None, ('AmountValidationLessOrEqualZeroError',)),
+    IngestResult(7, None, ()),
+]
+
+
+def test_get_json_decoder():
+    assert get_json_decoder('json') is stdlib_json_decoder
+    assert stdlib_json_decoder('{"amount": 10.10}') == {'amount': Decimal('10.10')}
+    assert get_json_decoder() is stdlib_json_decoder
+    with pytest.raises(ValueError):
+        get_json_decoder('unknown')
+
+
+@pytest.mark.parametrize('batch_size', [1, 2, 1000])
+@pytest.mark.parametrize('decoder', [None, stdlib_json_decoder])
+def test_iter_validate_jsonl(batch_size, decoder):
+    source = io.BytesIO('\n'.join(LINES).encode())
+    assert list(iter_validate_jsonl(XMLPayment, source, decoder, batch_size)) == EXPECTED
+
+
+def test_iter_validate_jsonl_from_file(tmp_path):
+    path = tmp_path / 'payments.jsonl'
+    path.write_text('\n'.join(LINES), encoding='utf-8')
+    assert list(iter_validate_jsonl(XMLPayment, path)) == EXPECTED
+
+
+def test_iter_validate_jsonl_is_lazy():
+    def lines():
+        yield json.dumps(ROW)
+        yield json.dumps(ROW)
+        raise AssertionError('must not be read')
+
+    results = iter_validate_jsonl(XMLPayment, lines(), batch_size=2)
+    assert next(results) == IngestResult(1, None, ())
+
+
+def test_default_decoder_keeps_amount_exact():
+    results = list(iter_validate_jsonl(XMLPayment, [json.dumps(ROW).replace('"1000.50"', '0.1')], keep_models=True))
+    assert results[0].errors == ()
+    assert results[0].model.amount == Decimal('0.1')
+
+
+def test_orjson_decoder():
+    orjson = pytest.importorskip('orjson')
+    assert get_json_decoder('orjson') is orjson.loads
+
+
+def test_keep_models():
+    results = list(iter_validate_jsonl(XMLPayment, LINES, keep_models=True))
+    assert [(result.position, result.errors) for result in results] == [
+        (result.position, result.errors) for result in EXPECTED
+    ]
+    assert isinstance(results[0].model, XMLPayment)
+    assert results[1].model is None
+
+
+def test_in_pool():
+    with ProcessPoolBatchValidator(XMLPayment, max_workers=1) as validator:
+        assert list(iter_validate_jsonl(XMLPayment, LINES, batch_size=3, validator=validator)) == EXPECTED
+        with pytest.raises(ValueError):
+            next(iter_validate_jsonl(XMLPayment, LINES, validator=validator, keep_models=True))
@@ -0,0 +1,15 @@
+import pytest
+
+from vitya.payment_order.ingest.mapping import kopecks_to_rubles
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        ('100050', '1000.50'),
+        ('1', '0.01'),
+        ('10.5', '10.5'),
+    ],
+)
+def test_kopecks_to_rubles(value, expected):
+    assert kopecks_to_rubles(value) == expected
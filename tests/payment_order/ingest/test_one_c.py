@@ -0,0 +1,152 @@
+import io
+from typing import Optional
+
+import pytest
+
+from tests.payment_order.testdata import IP_ACCOUNT, IP_INN, VALID_BIC
+from vitya.payment_order.enums import PaymentType
+from vitya.payment_order.fields import (
+    Amount,
+    Purpose,
+    ReceiverAccountNumber,
+    ReceiverBIC,
+    ReceiverINN,
+    ReceiverKPP,
+)
+from vitya.payment_order.ingest.mapping import IngestResult
+from vitya.payment_order.ingest.one_c import (
+    OneCDocument,
+    OneCFormatError,
+    iter_one_c_documents,
+    iter_validate_one_c,
+)
+from vitya.payment_order.payments.checkers import BaseModelChecker
+
+
+class OneCPayment(BaseModelChecker):
+    amount: Amount
+    receiver_account_number: ReceiverAccountNumber
+    receiver_bic: ReceiverBIC
+    receiver_inn: Optional[ReceiverINN]
+    receiver_kpp: Optional[ReceiverKPP]
+    purpose: Optional[Purpose]
+    payment_type: PaymentType
+
+
+DOCUMENT = f'''СекцияДокумент=Платежное поручение
+Номер=1
+Сумма=1000.50
+ПолучательСчет={IP_ACCOUNT}
+ПолучательБИК={VALID_BIC}
+ПолучательИНН={IP_INN}
+ПолучательКПП=
+НазначениеПлатежа=Оплата по счету 1
+КонецДокумента
+'''
+
+FILE = f'''1CClientBankExchange
+ВерсияФормата=1.03
+Кодировка=Windows
+СекцияРасчСчет
+РасчСчет={IP_ACCOUNT}
+КонецРасчСчет
+{DOCUMENT}{DOCUMENT.replace(VALID_BIC, '045004861')}{DOCUMENT.replace('Сумма=1000.50', 'Сумма=0')}КонецФайла
+'''
+
+
+def test_iter_one_c_documents():
+    documents = list(iter_one_c_documents(io.BytesIO(FILE.encode('cp1251'))))
+    assert [document.line for document in documents] == [7, 16, 25]
+    assert documents[0] == OneCDocument(7, 'Платежное поручение', {
+        'Номер': '1',
+        'Сумма': '1000.50',
+        'ПолучательСчет': IP_ACCOUNT,
+        'ПолучательБИК': VALID_BIC,
+        'ПолучательИНН': IP_INN,
+        'ПолучательКПП': '',
+        'НазначениеПлатежа': 'Оплата по счету 1',
+    })
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        FILE.replace('\n', '\r\n').encode('cp1251'),
+        FILE.replace('Кодировка=Windows', 'Кодировка=DOS').encode('cp866'),
+        b'\xef\xbb\xbf' + FILE.encode('utf-8'),
+    ],
+)
+def test_encodings(data):
+    documents = list(iter_one_c_documents(io.BytesIO(data)))
+    assert len(documents) == 3
+    assert documents[0].values['НазначениеПлатежа'] == 'Оплата по счету 1'
+
+
+def test_file(tmp_path):
+    path = tmp_path / 'kl_to_1c.txt'
+    path.write_bytes(FILE.encode('cp1251'))
+    assert len(list(iter_one_c_documents(path, encoding='cp1251'))) == 3
+
+
+def test_header_error():
+    with pytest.raises(OneCFormatError) as e:
+        list(iter_one_c_documents(io.BytesIO('Заголовок\n'.encode('cp1251'))))
+    assert e.value.line == 1
+
+
+@pytest.mark.parametrize(
+    'data, line',
+    [
+        ('1CClientBankExchange\nСекцияДокумент=Платежное поручение\nНомер=1\n', 2),
+        ('1CClientBankExchange\nСекцияДокумент=Платежное поручение\nНомер\nКонецДокумента\n', 3),
+        ('1CClientBankExchange\nСекцияДокумент=Платежное поручение\nСекцияДокумент=Платежное поручение\n', 3),
+    ],
+)
+def test_format_errors(data, line):
+    document = next(iter_one_c_documents(io.BytesIO(data.encode('cp1251'))))
+    assert document.line == 2
+    assert isinstance(document.error, OneCFormatError)
+    assert document.error.line == line
+
+
+BROKEN_DOCUMENT = DOCUMENT.replace('Номер=1\n', 'Номер\n')
+BROKEN_FILE = f'''1CClientBankExchange
+{BROKEN_DOCUMENT}{DOCUMENT}СекцияДокумент=Платежное поручение
+Номер=3
+{DOCUMENT}КонецФайла
+'''
+
+
+def test_format_errors_resume_at_next_document():
+    documents = list(iter_one_c_documents(io.BytesIO(BROKEN_FILE.encode('cp1251'))))
+    assert [(document.line, document.error and document.error.line) for document in documents] == [
+        (2, 3), (11, None), (20, 22), (22, None),
+    ]
+    assert documents[0].values == {}
+    assert documents[1].values['НазначениеПлатежа'] == 'Оплата по счету 1'
+    assert documents[2].values == {'Номер': '3'}
+
+
+def test_iter_validate_one_c_format_errors():
+    results = list(iter_validate_one_c(OneCPayment, io.BytesIO(BROKEN_FILE.encode('cp1251'))))
+    assert [(result.position, result.errors) for result in results] == [
+        (2, ('OneCFormatError',)), (11, ()), (20, ('OneCFormatError',)), (22, ()),
+    ]
+
+
+def test_empty_file():
+    assert list(iter_one_c_documents(io.BytesIO(b''))) == []
+
+
+def test_iter_validate_one_c():
+    results = list(iter_validate_one_c(OneCPayment, io.BytesIO(FILE.encode('cp1251'))))
+
+    assert results[0].position == 7
+    assert results[0].errors == ()
+    assert isinstance(results[0].model, OneCPayment)
+    assert results[0].model.payment_type == PaymentType.IP
+    assert results[0].model.receiver_kpp is None
+    assert results[1:] == [
+        IngestResult(16, None, ('ReceiverAccountValidationBICValueError',)),
+        IngestResult(25, None, ('AmountValidationLessOrEqualZeroError',)),
+    ]
@@ -0,0 +1,84 @@
+import pytest
+
+from tests.payment_order.ingest.test_xml_messages import XMLPayment
+from tests.payment_order.testdata import IP_ACCOUNT, IP_INN, VALID_BIC
+from vitya.payment_order.enums import PaymentType
+from vitya.payment_order.ingest.mapping import IngestResult
+from vitya.payment_order.ingest.qr import (
+    QRFormatError,
+    parse_qr_payload,
+    validate_qr_payloads,
+)
+
+PAYLOAD = (
+    f'ST00012|Name=ИП Получатель|PersonalAcc={IP_ACCOUNT}|BankName=БАНК|BIC={VALID_BIC}'
+    f'|CorrespAcc=30101810100000000864|PayeeINN={IP_INN}|Sum=100050|Purpose=Оплата по счету 1'
+)
+
+
+def test_parse_qr_payload():
+    assert parse_qr_payload(PAYLOAD) == {
+        'name': 'ИП Получатель',
+        'personalacc': IP_ACCOUNT,
+        'bankname': 'БАНК',
+        'bic': VALID_BIC,
+        'correspacc': '30101810100000000864',
+        'payeeinn': IP_INN,
+        'sum': '1000.50',
+        'purpose': 'Оплата по счету 1',
+    }
+
+
+@pytest.mark.parametrize(
+    'payload',
+    [
+        PAYLOAD.encode('utf-8'),
+        PAYLOAD.replace('ST00012', 'ST00011').encode('cp1251'),
+        PAYLOAD.replace('ST00012', 'ST00013').encode('koi8-r'),
+        PAYLOAD.replace('|', '#'),
+        PAYLOAD + '|',
+        PAYLOAD.replace('PayeeINN', 'payeeInn'),
+    ],
+)
+def test_parse_qr_payload_variants(payload):
+    values = parse_qr_payload(payload)
+    assert values['payeeinn'] == IP_INN
+    assert values['name'] == 'ИП Получатель'
+
+
+@pytest.mark.parametrize(
+    'payload',
+    [
+        '',
+        'ST0001',
+        'ST00014|Name=Получатель',
+        'ST00022|Name=Получатель',
+        b'ST00015|Name=',
+        'ST00012|Name=Получатель|bad',
+        'ИП Получатель'.encode('cp1251'),
+        b'ST00012|Name=\xff',
+    ],
+)
+def test_parse_qr_payload_errors(payload):
+    with pytest.raises(QRFormatError):
+        parse_qr_payload(payload)
+
+
+def test_validate_qr_payloads():
+    results = validate_qr_payloads(XMLPayment, [
+        PAYLOAD,
+        'bad',
+        PAYLOAD.replace(VALID_BIC, '045004861'),
+        PAYLOAD.replace('Sum=100050', 'Sum=0').encode(),
+    ])
+
+    assert results[0].position == 1
+    assert results[0].errors == ()
+    assert results[0].model is not None
+    assert results[0].model.payment_type == PaymentType.IP
+    assert str(results[0].model.amount) == '1000.50'
+    assert results[1:] == [
+        IngestResult(2, None, ('QRFormatError',)),
+        IngestResult(3, None, ('ReceiverAccountValidationBICValueError',)),
+        IngestResult(4, None, ('AmountValidationLessOrEqualZeroError',)),
+    ]
@@ -0,0 +1,133 @@
+import io
+from decimal import Decimal
+from typing import Optional
+
+from tests.payment_order.testdata import IP_ACCOUNT, IP_INN, VALID_BIC
+from vitya.payment_order.enums import PaymentType
+from vitya.payment_order.fields import (
+    Amount,
+    Purpose,
+    ReceiverAccountNumber,
+    ReceiverBIC,
+    ReceiverINN,
+)
+from vitya.payment_order.ingest.mapping import IngestResult
+from vitya.payment_order.ingest.xml_messages import (
+    PACS008_FIELDS,
+    PACS008_RECORD,
+    _iter_records,
+    iter_validate_xml,
+    iter_xml_documents,
+)
+from vitya.payment_order.payments.batch import ProcessPoolBatchValidator
+from vitya.payment_order.payments.checkers import BaseModelChecker
+
+
+class XMLPayment(BaseModelChecker):
+    amount: Amount
+    receiver_account_number: ReceiverAccountNumber
+    receiver_bic: ReceiverBIC
+    receiver_inn: Optional[ReceiverINN]
+    purpose: Optional[Purpose]
+    payment_type: PaymentType
+
+
+ED101 = f'''
+  <ED101 EDNo="1" EDDate="2024-01-01" EDAuthor="4525545000" Sum="{{sum}}" Priority="5" TransKind="01">
+    <AccDoc AccDocNo="15" AccDocDate="2024-01-01"/>
+    <Payer PersonalAcc="40702810900000000001" INN="7707083893">
+      <Name>ООО Плательщик</Name>
+      <Bank BIC="044525225" CorrespAcc="30101810400000000225"/>
+    </Payer>
+    <Payee PersonalAcc="{IP_ACCOUNT}" INN="{IP_INN}">
+      <Name>ИП Получатель</Name>
+      <Bank BIC="{{bic}}" CorrespAcc="30101810100000000864"/>
+    </Payee>
+    <Purpose>Оплата по счету 1</Purpose>
+  </ED101>'''
+
+PACKET = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<PacketEPD xmlns="urn:cbr-ru:ed:v2.0" EDNo="10" EDDate="2024-01-01" EDQuantity="3">'
+    + ED101.format(sum='100050', bic=VALID_BIC)
+    + ED101.format(sum='100000', bic='045004861')
+    + ED101.format(sum='0', bic=VALID_BIC)
+    + '\n</PacketEPD>\n'
+)
+
+PACS008 = f'''<?xml version="1.0" encoding="UTF-8"?>
+<Document xmlns="urn:iso:std:iso:20022:tech:xsd:pacs.008.001.08">
+  <FIToFICstmrCdtTrf>
+    <GrpHdr><MsgId>1</MsgId><NbOfTxs>1</NbOfTxs></GrpHdr>
+    <CdtTrfTxInf>
+      <PmtId><EndToEndId>15</EndToEndId></PmtId>
+      <IntrBkSttlmAmt Ccy="RUB">1000.50</IntrBkSttlmAmt>
+      <CdtrAgt><FinInstnId><ClrSysMmbId><MmbId>{VALID_BIC}</MmbId></ClrSysMmbId></FinInstnId></CdtrAgt>
+      <Cdtr><Nm>ИП Получатель</Nm><Id><PrvtId><Othr><Id>{IP_INN}</Id></Othr></PrvtId></Id></Cdtr>
+      <CdtrAcct><Id><Othr><Id>{IP_ACCOUNT}</Id></Othr></Id></CdtrAcct>
+      <RmtInf><Ustrd>Оплата по счету 1</Ustrd></RmtInf>
+    </CdtTrfTxInf>
+  </FIToFICstmrCdtTrf>
+</Document>
+'''
+
+EXPECTED_ERRORS = [
+    IngestResult(2, None, ('ReceiverAccountValidationBICValueError',)),
+    IngestResult(3, None, ('AmountValidationLessOrEqualZeroError',)),
+]
+
+
+def test_iter_xml_documents():
+    documents = list(iter_xml_documents(io.BytesIO(PACKET.encode())))
+    assert len(documents) == 3
+    assert documents[0] == {
+        'AccDoc/@AccDocNo': '15',
+        '@Sum': '1000.50',
+        '@Priority': '5',
+        'Payer/@PersonalAcc': '40702810900000000001',
+        'Payer/@INN': '7707083893',
+        'Payer/Name': 'ООО Плательщик',
+        'Payee/@PersonalAcc': IP_ACCOUNT,
+        'Payee/@INN': IP_INN,
+        'Payee/Name': 'ИП Получатель',
+        'Payee/Bank/@BIC': VALID_BIC,
+        'Purpose': 'Оплата по счету 1',
+    }
+
+
+def test_processed_records_are_released():
+    records = _iter_records(io.BytesIO(PACKET.encode()), 'ED101')
+    first = next(records)
+    assert len(first) == 4
+    next(records)
+    assert len(first) == 0
+
+
+def test_iter_validate_ed101(tmp_path):
+    path = tmp_path / 'packet.xml'
+    path.write_text(PACKET, encoding='utf-8')
+
+    results = list(iter_validate_xml(XMLPayment, path))
+
+    assert results[0].errors == ()
+    assert isinstance(results[0].model, XMLPayment)
+    assert results[0].model.amount == Decimal('1000.50')
+    assert results[0].model.payment_type == PaymentType.IP
+    assert results[1:] == EXPECTED_ERRORS
+
+
+def test_iter_validate_pacs008():
+    results = list(iter_validate_xml(XMLPayment, io.BytesIO(PACS008.encode()), PACS008_RECORD, PACS008_FIELDS))
+
+    assert len(results) == 1
+    assert results[0].errors == ()
+    assert results[0].model is not None
+    assert results[0].model.receiver_inn == IP_INN
+    assert results[0].model.amount == Decimal('1000.50')
+
+
+def test_iter_validate_in_pool():
+    with ProcessPoolBatchValidator(XMLPayment, max_workers=1) as validator:
+        results = list(iter_validate_xml(XMLPayment, io.BytesIO(PACKET.encode()), validator=validator, batch_size=2))
+
+    assert results == [IngestResult(1, None, ())] + EXPECTED_ERRORS
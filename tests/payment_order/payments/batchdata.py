@@ -0,0 +1,19 @@
+from typing import Optional
+
+from tests.payment_order.testdata import IP_ACCOUNT, IP_INN, VALID_BIC
+from vitya.payment_order.enums import PaymentType
+from vitya.payment_order.fields import ReceiverAccountNumber, ReceiverBIC, ReceiverINN
+from vitya.payment_order.payments.checkers import BaseModelChecker
+
+
+class BatchPayment(BaseModelChecker):
+    account_number: ReceiverAccountNumber
+    bic: ReceiverBIC
+    receiver_inn: Optional[ReceiverINN]
+    payment_type: PaymentType
+
+
+VALID_ROW = {'account_number': IP_ACCOUNT, 'bic': VALID_BIC, 'receiver_inn': IP_INN, 'payment_type': PaymentType.IP}
+INVALID_BIC_ROW = {**VALID_ROW, 'bic': '045004861'}
+INVALID_INN_ROW = {**VALID_ROW, 'receiver_inn': None}
+MISSING_ACCOUNT_ROW = {'bic': VALID_BIC, 'receiver_inn': IP_INN, 'payment_type': 'ip'}
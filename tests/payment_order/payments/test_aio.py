@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from pydantic import ValidationError
+
+from tests.payment_order.payments.batchdata import (
+    INVALID_BIC_ROW,
+    VALID_ROW,
+    BatchPayment,
+)
+from vitya.payment_order.payments.aio import (
+    AsyncValidator,
+    iter_validate_payments_async,
+    validate_payment_async,
+)
+
+
+def test_validate_payment_async():
+    payment = asyncio.run(validate_payment_async(BatchPayment, VALID_ROW))
+    assert payment == BatchPayment(**VALID_ROW)
+
+    with pytest.raises(ValidationError):
+        asyncio.run(validate_payment_async(BatchPayment, INVALID_BIC_ROW))
+
+
+def test_validate_payment_async_process_pool():
+    async def run():
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            payment = await validate_payment_async(BatchPayment, VALID_ROW, executor)
+            with pytest.raises(ValidationError):
+                await validate_payment_async(BatchPayment, INVALID_BIC_ROW, executor)
+        return payment
+
+    assert asyncio.run(run()) == BatchPayment(**VALID_ROW)
+
+
+@pytest.mark.parametrize('max_concurrency', [1, 3, 100])
+def test_iter_validate_keeps_order(max_concurrency):
+    rows = [VALID_ROW, INVALID_BIC_ROW] * 5
+
+    async def run():
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            return [
+                result
+                async for result in iter_validate_payments_async(BatchPayment, rows, executor, max_concurrency)
+            ]
+
+    results = asyncio.run(run())
+    assert [result.row for result in results] == list(range(10))
+    assert [result.model is not None for result in results] == [True, False] * 5
+    assert [result.error is not None for result in results] == [False, True] * 5
+
+
+def test_iter_validate_async_source_backpressure():
+    pulled = []
+
+    async def source():
+        for i in range(10):
+            pulled.append(i)
+            yield VALID_ROW
+
+    async def run():
+        iterator = AsyncValidator(BatchPayment, max_concurrency=2).iter_validate(source())
+        first = await iterator.__anext__()
+        pulled_after_first = len(pulled)
+        rest = [result async for result in iterator]
+        return first, pulled_after_first, rest
+
+    first, pulled_after_first, rest = asyncio.run(run())
+    assert first.row == 0
+    assert pulled_after_first == 3
+    assert len(rest) == 9
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def submit(self, fn, *args, **kwargs):
+        def wrapped():
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                time.sleep(0.001)
+                return fn(*args, **kwargs)
+            finally:
+                with self.lock:
+                    self.in_flight -= 1
+        return super().submit(wrapped)
+
+
+def test_validate_bounded_concurrency():
+    async def run():
+        with CountingExecutor(max_workers=8) as executor:
+            validator = AsyncValidator(BatchPayment, executor, max_concurrency=2)
+            results = await asyncio.gather(*[validator.validate(VALID_ROW) for _ in range(20)])
+        return results, executor.max_in_flight
+
+    results, max_in_flight = asyncio.run(run())
+    assert len(results) == 20
+    assert max_in_flight <= 2
+
+
+def test_validate_and_iter_validate_share_concurrency():
+    async def run():
+        with CountingExecutor(max_workers=8) as executor:
+            validator = AsyncValidator(BatchPayment, executor, max_concurrency=2)
+
+            async def iterate():
+                return [result async for result in validator.iter_validate([VALID_ROW] * 20)]
+
+            results = await asyncio.gather(iterate(), *[validator.validate(VALID_ROW) for _ in range(20)])
+        return results, executor.max_in_flight
+
+    results, max_in_flight = asyncio.run(run())
+    assert len(results[0]) == 20
+    assert max_in_flight <= 2
+
+
+def test_max_concurrency_must_be_positive():
+    with pytest.raises(ValueError):
+        AsyncValidator(BatchPayment, max_concurrency=0)
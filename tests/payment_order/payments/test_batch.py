@@ -0,0 +1,126 @@
+import subprocess
+import sys
+import time
+from datetime import date
+from typing import Any
+
+import pytest
+
+from tests.payment_order.payments.batchdata import (
+    INVALID_BIC_ROW,
+    INVALID_INN_ROW,
+    MISSING_ACCOUNT_ROW,
+    VALID_ROW,
+    BatchPayment,
+)
+from tests.payment_order.testdata import IP_ACCOUNT, IP_INN, VALID_BIC
+from vitya.payment_order.payments.batch import (
+    BatchRowError,
+    ProcessPoolBatchValidator,
+    decode_rows,
+    encode_rows,
+    measure_scaling,
+    validate_batch,
+)
+from vitya.payment_order.payments.checkers import BaseModelChecker
+from vitya.pydantic_fields import FieldMixin
+
+ROWS = [VALID_ROW, INVALID_BIC_ROW, VALID_ROW, INVALID_INN_ROW, MISSING_ACCOUNT_ROW] * 3
+EXPECTED_ERRORS = [
+    error
+    for offset in range(0, len(ROWS), 5)
+    for error in [
+        BatchRowError(offset + 1, ('ReceiverAccountValidationBICValueError',)),
+        BatchRowError(offset + 3, ('ReceiverINNValidationNonEmptyError',)),
+        BatchRowError(offset + 4, ('MissingError',)),
+    ]
+]
+
+
+def test_encode_decode_rows():
+    field_names = list(BatchPayment.__fields__)
+    payload, errors = encode_rows(field_names, [VALID_ROW, MISSING_ACCOUNT_ROW])
+    assert errors == []
+    assert decode_rows(field_names, payload) == [
+        {'account_number': IP_ACCOUNT, 'bic': VALID_BIC, 'receiver_inn': IP_INN, 'payment_type': 'ip'},
+        {'bic': VALID_BIC, 'receiver_inn': IP_INN, 'payment_type': 'ip'},
+    ]
+
+
+def test_encode_decode_empty_object_value():
+    field_names = ['a', 'b', 'c']
+    rows = [{'a': {}, 'c': None}, {'b': []}]
+    payload, errors = encode_rows(field_names, rows)
+    assert errors == []
+    assert decode_rows(field_names, payload) == rows
+
+
+def test_encode_rows_with_not_json_value():
+    field_names = ['a']
+    payload, errors = encode_rows(field_names, [{'a': 1}, {'a': date(2024, 1, 1)}, {'a': 2}], start=10)
+    assert errors == [BatchRowError(11, ('RowEncodingError',))]
+    assert decode_rows(field_names, payload) == [{'a': 1}, None, {'a': 2}]
+
+
+class SlowOrFailingValue(FieldMixin, str):
+    @classmethod
+    def _validate(cls, value: Any) -> str:
+        if value == 'slow':
+            time.sleep(0.5)
+        elif value == 'fail':
+            raise RuntimeError(value)
+        return str(value)
+
+
+class SlowOrFailingPayment(BaseModelChecker):
+    value: SlowOrFailingValue
+
+
+def test_process_pool_batch_validator_waits_for_chunks_on_error():
+    with ProcessPoolBatchValidator(SlowOrFailingPayment, max_workers=2, chunk_size=1) as validator:
+        started = time.perf_counter()
+        with pytest.raises(RuntimeError):
+            validator.validate([{'value': 'fail'}, {'value': 'slow'}])
+        # shared memory is unlinked only after the slow chunk is done with it
+        assert time.perf_counter() - started >= 0.5
+        assert validator.validate([{'value': 'ok'}]) == []
+
+
+def test_process_pool_batch_validator_does_not_leak_shared_memory():
+    code = (
+        'from tests.payment_order.payments.batchdata import VALID_ROW, BatchPayment\n'
+        'from vitya.payment_order.payments.batch import ProcessPoolBatchValidator\n'
+        'with ProcessPoolBatchValidator(BatchPayment, max_workers=2, chunk_size=1) as validator:\n'
+        '    validator.validate([VALID_ROW] * 10)\n'
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert 'leaked' not in result.stderr
+
+
+def test_validate_batch():
+    assert validate_batch(BatchPayment, ROWS) == EXPECTED_ERRORS
+
+
+@pytest.mark.parametrize('chunk_size', [1, 4, 1000])
+def test_process_pool_batch_validator(chunk_size):
+    with ProcessPoolBatchValidator(BatchPayment, max_workers=2, chunk_size=chunk_size) as validator:
+        assert validator.validate(ROWS) == EXPECTED_ERRORS
+        assert validator.validate([]) == []
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 1000])
+def test_process_pool_batch_validator_reports_not_encoded_rows(chunk_size):
+    rows = [INVALID_BIC_ROW, {**VALID_ROW, 'receiver_inn': date(2024, 1, 1)}, VALID_ROW, INVALID_INN_ROW]
+    with ProcessPoolBatchValidator(BatchPayment, max_workers=2, chunk_size=chunk_size) as validator:
+        assert validator.validate(rows) == [
+            BatchRowError(0, ('ReceiverAccountValidationBICValueError',)),
+            BatchRowError(1, ('RowEncodingError',)),
+            BatchRowError(3, ('ReceiverINNValidationNonEmptyError',)),
+        ]
+
+
+def test_measure_scaling():
+    points = measure_scaling(BatchPayment, ROWS, max_workers=2, chunk_size=5)
+    assert [point.workers for point in points] == [1, 2]
+    assert points[0].speedup == 1.0
+    assert points[0].efficiency == 1.0
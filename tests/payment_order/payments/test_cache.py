@@ -0,0 +1,242 @@
+from typing import ClassVar, Iterator, List, Optional
+
+import pytest
+from pydantic import ValidationError
+
+from tests.payment_order.testdata import IP_ACCOUNT, IP_INN, LE_INN, VALID_BIC
+from vitya.payment_order.directories.screening import (
+    build_inn_screening_list,
+    open_inn_screening,
+    set_inn_screening,
+)
+from vitya.payment_order.enums import PaymentType
+from vitya.payment_order.fields import (
+    ForThirdPerson,
+    PayerStatus,
+    ReceiverAccountNumber,
+    ReceiverBIC,
+    ReceiverINN,
+    ReceiverKPP,
+)
+from vitya.payment_order.payments.batch import get_error_codes
+from vitya.payment_order.payments.cache import CacheStats, CounterpartyCache
+from vitya.payment_order.payments.checkers import (
+    BaseModelChecker,
+    CounterpartyVerdict,
+    PayerStatusChecker,
+    ReceiverAccountChecker,
+    ReceiverBICDirectoryChecker,
+    ReceiverINNChecker,
+    ReceiverINNScreeningChecker,
+    is_counterparty_checker,
+)
+from vitya.payment_order.payments.constants import FNS_KPP
+from vitya.payment_order.payments.reference import (
+    DEFAULT_REFERENCE_DATA,
+    pin_reference_data,
+    reference_registry,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+clock = FakeClock()
+
+
+class CachedPayment(BaseModelChecker):
+    account_number: ReceiverAccountNumber
+    bic: ReceiverBIC
+    receiver_inn: Optional[ReceiverINN]
+    payment_type: PaymentType
+
+    __counterparty_cache__: ClassVar[CounterpartyCache[CounterpartyVerdict]] = CounterpartyCache(
+        maxsize=2, ttl=60, clock=clock,
+    )
+
+
+VALID_ROW = {'account_number': IP_ACCOUNT, 'bic': VALID_BIC, 'receiver_inn': IP_INN, 'payment_type': PaymentType.IP}
+INVALID_ROW = {**VALID_ROW, 'bic': '045004861', 'receiver_inn': None}
+
+
+@pytest.fixture(autouse=True)
+def reset_cache() -> Iterator[None]:
+    cache = CachedPayment.__counterparty_cache__
+    cache.invalidate()
+    cache.reset_stats()
+    clock.now = 0.0
+    yield
+    reference_registry.reset()
+
+
+def validate_codes(row: dict) -> List[str]:
+    try:
+        CachedPayment(**row)
+    except ValidationError as e:
+        return list(get_error_codes(e))
+    return []
+
+
+def test_is_counterparty_checker() -> None:
+    assert is_counterparty_checker(ReceiverAccountChecker)
+    assert is_counterparty_checker(ReceiverINNChecker)
+    assert not is_counterparty_checker(PayerStatusChecker)
+    assert not is_counterparty_checker(ReceiverBICDirectoryChecker)
+    assert not is_counterparty_checker(ReceiverINNScreeningChecker)
+
+
+def test_counterparty_fields() -> None:
+    assert CachedPayment.__counterparty_checkers__ == [True, True, True]
+    assert CachedPayment.__counterparty_fields__ == ['account_number', 'bic', 'payment_type', 'receiver_inn']
+
+
+@pytest.mark.parametrize('row', [VALID_ROW, INVALID_ROW])
+def test_cached_verdict_is_the_same(row: dict) -> None:
+    first = validate_codes(row)
+    second = validate_codes(row)
+
+    assert first == second
+    assert CachedPayment.__counterparty_cache__.stats() == CacheStats(
+        hits=1, misses=1, evictions=0, expirations=0, size=1,
+    )
+
+
+def test_invalid_verdict() -> None:
+    assert validate_codes(INVALID_ROW) == [
+        'ReceiverAccountValidationBICValueError',
+        'ReceiverINNValidationNonEmptyError',
+    ]
+    assert validate_codes(INVALID_ROW) == [
+        'ReceiverAccountValidationBICValueError',
+        'ReceiverINNValidationNonEmptyError',
+    ]
+
+
+def test_cached_errors_are_new_instances() -> None:
+    with pytest.raises(ValidationError) as first:
+        CachedPayment(**INVALID_ROW)
+    with pytest.raises(ValidationError) as second:
+        CachedPayment(**INVALID_ROW)
+
+    assert CachedPayment.__counterparty_cache__.stats().hits == 1
+    first_errors = first.value.raw_errors[0].exc.errors
+    second_errors = second.value.raw_errors[0].exc.errors
+    assert [type(error) for error in first_errors] == [type(error) for error in second_errors]
+    assert all(a is not b for a, b in zip(first_errors, second_errors))
+    assert [str(error) for error in first_errors] == [str(error) for error in second_errors]
+
+
+def test_directory_checkers_are_not_cached(tmp_path) -> None:
+    class ScreenedPayment(BaseModelChecker):
+        account_number: ReceiverAccountNumber
+        bic: ReceiverBIC
+        receiver_inn: Optional[ReceiverINN]
+        payment_type: PaymentType
+
+        __extra_wired_checkers__ = [(ReceiverINNScreeningChecker, ['receiver_inn'])]
+        __counterparty_cache__: ClassVar[CounterpartyCache[CounterpartyVerdict]] = CounterpartyCache()
+
+    row = {**VALID_ROW, 'receiver_inn': LE_INN, 'payment_type': PaymentType.LE}
+    ScreenedPayment(**row)
+
+    path = tmp_path / 'inn.bin'
+    build_inn_screening_list([LE_INN], path)
+    with open_inn_screening(path) as screening:
+        set_inn_screening(screening)
+        try:
+            with pytest.raises(ValidationError) as e:
+                ScreenedPayment(**row)
+        finally:
+            set_inn_screening(None)
+    assert 'ReceiverINNValidationScreeningError' in get_error_codes(e.value)
+    assert ScreenedPayment.__counterparty_cache__.stats().hits == 1
+
+
+def test_ttl() -> None:
+    validate_codes(VALID_ROW)
+    clock.now = 61
+    validate_codes(VALID_ROW)
+
+    stats = CachedPayment.__counterparty_cache__.stats()
+    assert stats.hits == 0
+    assert stats.expirations == 1
+
+
+def test_maxsize() -> None:
+    rows = [VALID_ROW, INVALID_ROW, {**VALID_ROW, 'receiver_inn': None}]
+    for row in rows:
+        validate_codes(row)
+    validate_codes(VALID_ROW)
+
+    stats = CachedPayment.__counterparty_cache__.stats()
+    assert stats.evictions == 2
+    assert stats.size == 2
+    assert stats.hits == 0
+
+
+def test_invalidate() -> None:
+    validate_codes(VALID_ROW)
+    CachedPayment.__counterparty_cache__.invalidate()
+    validate_codes(VALID_ROW)
+    assert CachedPayment.__counterparty_cache__.stats().hits == 0
+
+
+def test_reference_data_version_is_part_of_key() -> None:
+    validate_codes(VALID_ROW)
+    reference_registry.update({'fns_kpp': '770801001'})
+    validate_codes(VALID_ROW)
+    validate_codes(VALID_ROW)
+
+    stats = CachedPayment.__counterparty_cache__.stats()
+    assert stats.hits == 1
+    assert stats.misses == 2
+    assert stats.hit_rate == 1 / 3
+
+
+def test_pinned_reference_data_is_part_of_key() -> None:
+    class KPPPayment(BaseModelChecker):
+        receiver_kpp: Optional[ReceiverKPP]
+        payment_type: PaymentType
+
+        __counterparty_cache__: ClassVar[CounterpartyCache[CounterpartyVerdict]] = CounterpartyCache()
+
+    row = {'receiver_kpp': FNS_KPP, 'payment_type': PaymentType.FNS}
+    KPPPayment(**row)
+    with pin_reference_data(DEFAULT_REFERENCE_DATA._replace(fns_kpp='770801001')):
+        with pytest.raises(ValidationError) as e:
+            KPPPayment(**row)
+    assert get_error_codes(e.value) == ('ReceiverKPPValidationFNS',)
+    KPPPayment(**row)
+    assert KPPPayment.__counterparty_cache__.stats().hits == 1
+
+
+def test_non_counterparty_checkers_are_not_cached() -> None:
+    class PayerStatusPayment(BaseModelChecker):
+        account_number: ReceiverAccountNumber
+        payment_type: PaymentType
+        payer_status: Optional[PayerStatus]
+        for_third_person: Optional[ForThirdPerson]
+
+        __counterparty_cache__: ClassVar[CounterpartyCache[CounterpartyVerdict]] = CounterpartyCache()
+
+    assert PayerStatusPayment.__counterparty_fields__ == ['account_number', 'payment_type']
+    row = {'account_number': IP_ACCOUNT, 'payment_type': PaymentType.FNS, 'payer_status': None, 'for_third_person': False}
+    with pytest.raises(ValidationError):
+        PayerStatusPayment(**row)
+    with pytest.raises(ValidationError) as e:
+        PayerStatusPayment(**row)
+    assert 'PayerStatusValidationNullNotAllowedError' in get_error_codes(e.value)
+    assert PayerStatusPayment.__counterparty_cache__.stats().hits == 1
+
+
+def test_cache_arguments() -> None:
+    with pytest.raises(ValueError):
+        CounterpartyCache(maxsize=0)
+    with pytest.raises(ValueError):
+        CounterpartyCache(ttl=0)
+    assert CounterpartyCache().stats().hit_rate == 0.0
@@ -1,5 +1,7 @@
 from typing import Optional, Union
 
+import pytest
+
 from vitya.payment_order.enums import PaymentType
 from vitya.payment_order.fields import (
     CBC,
@@ -50,6 +52,12 @@ from vitya.payment_order.payments.checkers import (
     ReceiverKPPChecker,
     TaxPeriodChecker,
     UINChecker,
+    clear_wiring_plans,
+    dump_wiring_plans,
+    export_wiring_plans,
+    get_checker_parameters,
+    load_wiring_plans,
+    load_wiring_plans_file,
 )
 from vitya.pydantic_fields import OKTMO
 
@@ -316,3 +324,74 @@ def test_extra_wired_checkers_and_auto_wiring_disabling():
     assert Payment.__final_wired_checkers__ == [
         (MyChecker, ['bic', 'operation_kind']),
     ]
+
+
+class WiringPayment(BaseModelChecker):
+    account_number: ReceiverAccountNumber
+    bic: ReceiverBIC
+    payment_type: PaymentType
+    purpose: Optional[Purpose]
+
+
+WIRING_PAYMENT_CHECKERS = [
+    (ReceiverAccountChecker, ['account_number', 'bic', 'payment_type']),
+    (ReceiverAccountCheckerWithPaymentType, ['account_number', 'payment_type']),
+    (PurposeChecker, ['purpose', 'payment_type']),
+]
+
+
+@pytest.fixture
+def wiring_plans():
+    clear_wiring_plans()
+    yield
+    clear_wiring_plans()
+
+
+def _define_wiring_payment_variant():
+    class PaymentVariant(BaseModelChecker):
+        account_number: ReceiverAccountNumber
+        bic: ReceiverBIC
+        payment_type: PaymentType
+        purpose: Optional[Purpose]
+
+    return PaymentVariant
+
+
+def test_checker_parameters():
+    assert get_checker_parameters(PurposeChecker) == (('purpose', Optional[Purpose]), ('payment_type', PaymentType))
+    assert get_checker_parameters(PurposeChecker) is get_checker_parameters(PurposeChecker)
+
+
+def test_wiring_is_shared_by_model_variants(wiring_plans, monkeypatch):
+    assert WiringPayment.__final_wired_checkers__ == WIRING_PAYMENT_CHECKERS
+    first = _define_wiring_payment_variant()
+
+    def fail(cls, auto_checkers):
+        raise AssertionError('must not be wired again')
+
+    monkeypatch.setattr(BaseModelChecker, '_resolve_auto_checkers', classmethod(fail))
+    second = _define_wiring_payment_variant()
+    assert first.__final_wired_checkers__ == second.__final_wired_checkers__ == WIRING_PAYMENT_CHECKERS
+
+
+def test_wiring_plans_export_and_load(wiring_plans, monkeypatch, tmp_path):
+    plans = export_wiring_plans([WiringPayment, _define_wiring_payment_variant()])
+    assert len(plans) == 1
+    assert plans[0]['wired_checkers'][2] == [
+        'vitya.payment_order.payments.checkers:PurposeChecker', ['purpose', 'payment_type'],
+    ]
+    path = tmp_path / 'wiring.json'
+    dump_wiring_plans([WiringPayment], path)
+
+    for load in (lambda: load_wiring_plans(plans), lambda: load_wiring_plans_file(path)):
+        clear_wiring_plans()
+        load()
+        with monkeypatch.context() as m:
+            m.setattr(BaseModelChecker, '_resolve_auto_checkers', classmethod(lambda cls, auto_checkers: []))
+            assert _define_wiring_payment_variant().__final_wired_checkers__ == WIRING_PAYMENT_CHECKERS
+
+    class OtherPayment(BaseModelChecker):  # other fields are wired as usual
+        purpose: Purpose
+        payment_type: PaymentType
+
+    assert OtherPayment.__final_wired_checkers__ == [(PurposeChecker, ['purpose', 'payment_type'])]
@@ -1,3 +1,5 @@
+import random
+import re
 from contextlib import nullcontext
 from datetime import datetime
 from typing import ContextManager, Optional, Type
@@ -22,6 +24,7 @@ from tests.payment_order.testdata import (
     VALID_OKTMO,
     VALID_UIN,
 )
+from vitya.errors import INNValidationControlSumError
 from vitya.payment_order.enums import PaymentType
 from vitya.payment_order.errors import (
     AccountValidationBICValueError,
@@ -102,7 +105,9 @@ from vitya.payment_order.fields import (
     TaxPeriod,
 )
 from vitya.payment_order.payments.checks import (
+    ThirdPersonPurpose,
     check_account_by_bic,
+    check_account_by_bic_many,
     check_cbc,
     check_document_date,
     check_document_date_with_reason,
@@ -125,6 +130,7 @@ from vitya.payment_order.payments.checks import (
     check_receiver_kpp,
     check_tax_period,
     check_uin,
+    parse_third_person_purpose,
 )
 from vitya.payment_order.payments.constants import (
     CHANGE_YEAR,
@@ -201,6 +207,49 @@ def test_check_account_by_bic(
         check_account_by_bic(account_number=account_number, bic=bic)
 
 
+TREASURY_BIC = '004525988'
+TREASURY_SINGLE_ACCOUNT = '40102810545370000003'
+
+
+def test_check_account_by_bic_rkc() -> None:
+    check_account_by_bic(account_number=TREASURY_SINGLE_ACCOUNT, bic=TREASURY_BIC, rkc=True)
+    with pytest.raises(AccountValidationBICValueError):
+        check_account_by_bic(account_number=TREASURY_SINGLE_ACCOUNT, bic=TREASURY_BIC)
+
+
+def test_check_account_by_bic_many() -> None:
+    non_ascii_account = IP_ACCOUNT[:-1] + '\u0662'  # arabic-indic digit two
+    accounts = [IP_ACCOUNT, IP_ACCOUNT[:-1] + '0', TREASURY_SINGLE_ACCOUNT, IP_ACCOUNT, IP_ACCOUNT[:-1], non_ascii_account]
+    bics = [VALID_BIC, VALID_BIC, TREASURY_BIC, VALID_BIC + '0', VALID_BIC, VALID_BIC]
+    assert check_account_by_bic_many(accounts, bics) == [True, False, False, False, False, False]
+    assert check_account_by_bic_many(accounts, bics, rkc=[False, False, True, False, False, False]) == [
+        True, False, True, False, False, False,
+    ]
+    assert check_account_by_bic_many([], []) == []
+    with pytest.raises(ValueError):
+        check_account_by_bic_many(accounts, bics[:-1])
+
+
+def test_check_account_by_bic_many_matches_check_account_by_bic() -> None:
+    accounts = [
+        f'{prefix}810{i:012d}'
+        for prefix in ('40702', '40817', '03100')
+        for i in range(0, 10 ** 12, 10 ** 12 // 97)
+    ]
+    bics = ['045004864', '044525225', '004525988', '040173745']
+    for bic in bics:
+        for rkc in (False, True):
+            expected = []
+            for account in accounts:
+                try:
+                    check_account_by_bic(account_number=account, bic=bic, rkc=rkc)
+                except AccountValidationBICValueError:
+                    expected.append(False)
+                else:
+                    expected.append(True)
+            assert check_account_by_bic_many(accounts, [bic] * len(accounts), rkc=rkc) == expected
+
+
 @pytest.mark.parametrize(
     'value, payment_type, exception_handler, expected_value',
     [
@@ -1010,3 +1059,54 @@ def test_check_payment_type_and_for_third_person(
             payment_type=payment_type,
             for_third_person=for_third_person,
         )
+
+
+@pytest.mark.parametrize(
+    'value, expected_value',
+    [
+        (f'{VALID_INN}//Иванов Иван//Оплата', ThirdPersonPurpose(VALID_INN, 'Иванов Иван', 'Оплата')),
+        (f'{VALID_INN}//Иванов Иван//', ThirdPersonPurpose(VALID_INN, 'Иванов Иван', '')),
+        (f'{VALID_INN}//Иванов//Иван//Оплата//НДФЛ', ThirdPersonPurpose(VALID_INN, 'Иванов', 'Иван//Оплата//НДФЛ')),
+        (f'{VALID_INN}//Иванов_Иван//Оплата', None),
+        (f'{VALID_INN}//Иванов Иван', None),
+        ('//Иванов Иван//Оплата', None),
+        ('12a//Иванов Иван//Оплата', None),
+        ('', None),
+    ]
+)
+def test_parse_third_person_purpose(value: str, expected_value: Optional[ThirdPersonPurpose]) -> None:
+    assert parse_third_person_purpose(value) == expected_value
+
+
+def test_parse_third_person_purpose_check_inn() -> None:
+    assert parse_third_person_purpose(f'{VALID_INN}//Иванов//', check_inn=True) == ThirdPersonPurpose(VALID_INN, 'Иванов', '')
+    with pytest.raises(INNValidationControlSumError):
+        parse_third_person_purpose(f'{VALID_INN[:-1]}0//Иванов//', check_inn=True)
+
+
+_THIRD_PERSON_PURPOSE_REFERENCE_RE = re.compile(r'^\d+\/\/[a-zA-Zа-яА-ЯёЁ\s\W]+\/\/[а-яА-ЯёЁ\s!-~№]*$')
+
+
+def test_parse_third_person_purpose_matches_regex() -> None:
+    alphabet = ['1', '٣', '/', '//', '///', 'я', 'Ё', 'z', ' ', '\n', '_', '№', '的', 'é', '!', '\x00']
+    for seed in range(5000):
+        rnd = random.Random(seed)
+        value = ''.join(rnd.choices(alphabet, k=rnd.randrange(12)))
+        if rnd.random() < 0.5:
+            value = rnd.choice(['1', '12', '٣']) + '//' + value
+        expected = _THIRD_PERSON_PURPOSE_REFERENCE_RE.match(value) is not None
+        assert (parse_third_person_purpose(value) is not None) == expected, value
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        '1//' + '//' * 100_000 + '的',
+        '1//' + 'я//' * 100_000 + '_的',
+        '1' * 100_000 + '/',
+    ],
+    ids=['separators', 'names', 'digits'],
+)
+def test_parse_third_person_purpose_adversarial(value: str) -> None:
+    # the regex takes minutes on these, parsing is linear
+    assert parse_third_person_purpose(value) is None
@@ -0,0 +1,117 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+import pytest
+
+from vitya.payment_order.enums import PaymentType
+from vitya.payment_order.errors import ReceiverKPPValidationFNS
+from vitya.payment_order.fields import ReceiverKPP
+from vitya.payment_order.payments.batch import (
+    BatchRowError,
+    ProcessPoolBatchValidator,
+    validate_batch,
+)
+from vitya.payment_order.payments.checkers import BaseModelChecker
+from vitya.payment_order.payments.checks import check_receiver_kpp
+from vitya.payment_order.payments.constants import CUSTOMS_REASONS, FNS_KPP
+from vitya.payment_order.payments.reference import (
+    get_reference_data,
+    pin_reference_data,
+    reference_registry,
+)
+
+NEW_FNS_KPP = '770801001'
+
+
+class KPPPayment(BaseModelChecker):
+    receiver_kpp: Optional[ReceiverKPP]
+    payment_type: PaymentType
+
+
+@pytest.fixture(autouse=True)
+def reset_registry() -> Iterator[None]:
+    yield
+    reference_registry.reset()
+
+
+def test_default_snapshot_matches_constants() -> None:
+    data = get_reference_data()
+    assert data.fns_kpp == FNS_KPP
+    assert data.customs_reasons == frozenset(CUSTOMS_REASONS)
+
+
+def test_update_changes_checks() -> None:
+    version = reference_registry.current.version
+    data = reference_registry.update({'fns_kpp': NEW_FNS_KPP})
+
+    assert data.version == version + 1
+    assert get_reference_data() is data
+    assert check_receiver_kpp(NEW_FNS_KPP, PaymentType.FNS) == NEW_FNS_KPP
+    with pytest.raises(ReceiverKPPValidationFNS):
+        check_receiver_kpp(FNS_KPP, PaymentType.FNS)
+
+
+def test_reload_from_file(tmp_path: Path) -> None:
+    path = tmp_path / 'reference.json'
+    path.write_text(json.dumps({'fns_kpp': NEW_FNS_KPP, 'customs_reasons': ['ПК']}), encoding='utf-8')
+
+    data = reference_registry.reload(path)
+
+    assert data.fns_kpp == NEW_FNS_KPP
+    assert data.customs_reasons == frozenset({'ПК'})
+    assert data.document_numbers == reference_registry.current.document_numbers
+
+
+@pytest.mark.parametrize(
+    'values',
+    [
+        {'unknown': 'value'},
+        {'version': 10},
+        {'fns_kpp': 770801001},
+        {'customs_reasons': 'ПК'},
+    ],
+)
+def test_update_rejects_invalid_values(values: Dict[str, Any]) -> None:
+    current = reference_registry.current
+    with pytest.raises(ValueError):
+        reference_registry.update(values)
+    assert reference_registry.current is current
+
+
+def test_pinned_snapshot_ignores_swap() -> None:
+    with pin_reference_data() as data:
+        reference_registry.update({'fns_kpp': NEW_FNS_KPP})
+        assert get_reference_data() is data
+        with pin_reference_data() as nested:
+            assert nested is data
+        check_receiver_kpp(FNS_KPP, PaymentType.FNS)
+
+    assert get_reference_data().fns_kpp == NEW_FNS_KPP
+
+
+def test_batch_uses_one_snapshot() -> None:
+    def rows() -> Iterator[Dict[str, Any]]:
+        yield {'receiver_kpp': FNS_KPP, 'payment_type': PaymentType.FNS}
+        reference_registry.update({'fns_kpp': NEW_FNS_KPP})
+        yield {'receiver_kpp': FNS_KPP, 'payment_type': PaymentType.FNS}
+        yield {'receiver_kpp': NEW_FNS_KPP, 'payment_type': PaymentType.FNS}
+
+    assert validate_batch(KPPPayment, rows()) == [BatchRowError(2, ('ReceiverKPPValidationFNS',))]
+    assert validate_batch(KPPPayment, [{'receiver_kpp': FNS_KPP, 'payment_type': PaymentType.FNS}]) == [
+        BatchRowError(0, ('ReceiverKPPValidationFNS',)),
+    ]
+
+
+def test_process_pool_uses_parent_snapshot() -> None:
+    rows = [
+        {'receiver_kpp': FNS_KPP, 'payment_type': PaymentType.FNS},
+        {'receiver_kpp': NEW_FNS_KPP, 'payment_type': PaymentType.FNS},
+    ]
+    with ProcessPoolBatchValidator(KPPPayment, max_workers=1) as validator:
+        reference_registry.update({'fns_kpp': NEW_FNS_KPP})
+        assert validator.validate(rows) == validate_batch(KPPPayment, rows) == [
+            BatchRowError(0, ('ReceiverKPPValidationFNS',)),
+        ]
+        with pin_reference_data(reference_registry.reset()):
+            assert validator.validate(rows) == [BatchRowError(1, ('ReceiverKPPValidationFNS',))]
@@ -0,0 +1,119 @@
+from itertools import product
+
+import pytest
+
+from tests.payment_order.testdata import (
+    IP_ACCOUNT,
+    OTHER_RECEIVER_ACCOUNT_NUMBER,
+    VALID_BIC,
+    VALID_KPP,
+)
+from vitya.payment_order.enums import AccountKind, PaymentType
+from vitya.payment_order.payments.constants import (
+    CUSTOMS_RECEIVER_ACCOUNT_NUMBER,
+    FNS_KPP,
+    FNS_RECEIVER_ACCOUNT_NUMBER,
+    FTS_KPP,
+)
+from vitya.payment_order.payments.tools import (
+    ACCOUNT_KIND_TABLE,
+    PREFIX_3_TO_ACCOUNT_KIND,
+    PREFIX_5_TO_ACCOUNT_KIND,
+    get_account_kind,
+    get_account_kind_many,
+    infer_payment_type,
+    infer_payment_type_many,
+)
+
+TOFK_BIC = '004525988'
+OTHER_TAX_ACCOUNT = '03100643000000017300'
+
+
+def get_account_kind_by_dicts(account_number):
+    try:
+        return PREFIX_5_TO_ACCOUNT_KIND[account_number[:5]]
+    except KeyError:
+        return PREFIX_3_TO_ACCOUNT_KIND.get(account_number[:3], AccountKind.LE)
+
+
+@pytest.mark.parametrize(
+    'account_number, expected',
+    [
+        (IP_ACCOUNT, AccountKind.IP),
+        ('40817810000000000001', AccountKind.FL),
+        ('42301810000000000001', AccountKind.FL),
+        ('45401810000000000001', AccountKind.CHAMELEON),
+        ('40827810000000000001', AccountKind.CHAMELEON),
+        ('40702810000000000001', AccountKind.LE),
+        ('03100643000000018500', AccountKind.LE),
+        ('423', AccountKind.FL),
+        ('4_230', AccountKind.LE),
+        ('423_0000', AccountKind.FL),
+        ('4230 ', AccountKind.FL),
+        (' 4230', AccountKind.LE),
+        ('+4230', AccountKind.LE),
+        ('４２３０１', AccountKind.LE),
+        ('', AccountKind.LE),
+    ]
+)
+def test_get_account_kind(account_number, expected):
+    assert get_account_kind(account_number) == expected
+    assert get_account_kind_many([account_number]) == [expected]
+
+
+def test_account_kind_table_matches_dicts():
+    assert len(ACCOUNT_KIND_TABLE) == 100_000
+    for prefix in map(''.join, product('0123456789', repeat=5)):
+        assert get_account_kind(prefix + '0' * 15) == get_account_kind_by_dicts(prefix), prefix
+
+
+def test_get_account_kind_many():
+    accounts = [IP_ACCOUNT, '40817810000000000001', '40702810000000000001']
+    assert get_account_kind_many(accounts) == [AccountKind.IP, AccountKind.FL, AccountKind.LE]
+    assert get_account_kind_many(iter(accounts + ['423'])) == [
+        AccountKind.IP, AccountKind.FL, AccountKind.LE, AccountKind.FL,
+    ]
+    assert get_account_kind_many(accounts + ['4081a']) == [
+        AccountKind.IP, AccountKind.FL, AccountKind.LE, AccountKind.LE,
+    ]
+    assert get_account_kind_many(accounts + ['423_0000']) == [
+        AccountKind.IP, AccountKind.FL, AccountKind.LE, AccountKind.FL,
+    ]
+    assert get_account_kind_many([]) == []
+
+
+@pytest.mark.parametrize(
+    'receiver_account, receiver_bic, receiver_kpp, expected',
+    [
+        (FNS_RECEIVER_ACCOUNT_NUMBER, TOFK_BIC, None, PaymentType.FNS),
+        (FNS_RECEIVER_ACCOUNT_NUMBER, TOFK_BIC, FTS_KPP, PaymentType.FNS),
+        (CUSTOMS_RECEIVER_ACCOUNT_NUMBER, TOFK_BIC, FTS_KPP, PaymentType.CUSTOMS),
+        (OTHER_TAX_ACCOUNT, TOFK_BIC, FNS_KPP, PaymentType.FNS),
+        (OTHER_TAX_ACCOUNT, TOFK_BIC, FTS_KPP, PaymentType.CUSTOMS),
+        (OTHER_TAX_ACCOUNT, TOFK_BIC, VALID_KPP, PaymentType.BUDGET_OTHER),
+        (OTHER_RECEIVER_ACCOUNT_NUMBER, TOFK_BIC, FNS_KPP, PaymentType.BUDGET_OTHER),
+        ('03234643000000000000', None, None, PaymentType.BUDGET_OTHER),
+        ('40102810545370000003', TOFK_BIC, None, PaymentType.BUDGET_OTHER),
+        (IP_ACCOUNT, VALID_BIC, None, PaymentType.IP),
+        ('40817810000000000001', VALID_BIC, None, PaymentType.FL),
+        ('42301810000000000001', None, None, PaymentType.FL),
+        ('45401810000000000001', VALID_BIC, VALID_KPP, PaymentType.CHAMELEON),
+        ('40702810000000000001', VALID_BIC, VALID_KPP, PaymentType.LE),
+        ('423', None, None, PaymentType.FL),
+        ('423_0000', None, None, PaymentType.FL),
+        ('4230 ', None, None, PaymentType.FL),
+        ('+4230', None, None, PaymentType.LE),
+    ]
+)
+def test_infer_payment_type(receiver_account, receiver_bic, receiver_kpp, expected):
+    assert infer_payment_type(receiver_account, receiver_bic, receiver_kpp) == expected
+    assert infer_payment_type_many([receiver_account], [receiver_bic], [receiver_kpp]) == [expected]
+
+
+def test_infer_payment_type_many():
+    assert infer_payment_type_many([FNS_RECEIVER_ACCOUNT_NUMBER, IP_ACCOUNT, OTHER_TAX_ACCOUNT]) == [
+        PaymentType.FNS, PaymentType.IP, PaymentType.BUDGET_OTHER,
+    ]
+    assert infer_payment_type_many(
+        [OTHER_TAX_ACCOUNT, OTHER_TAX_ACCOUNT], receiver_kpps=[FTS_KPP, None],
+    ) == [PaymentType.CUSTOMS, PaymentType.BUDGET_OTHER]
@@ -10,6 +10,7 @@ from vitya.payment_order.errors import (
     AccountNumberValidationDigitsOnlyError,
     AccountNumberValidationSizeError,
     AccountNumberValidationTypeError,
+    AmountNotANumber,
     AmountValidationLengthError,
     AmountValidationLessOrEqualZeroError,
     NumberValidationLenError,
@@ -31,6 +32,7 @@ from vitya.payment_order.fields import (
     UIN,
     AccountNumber,
     Amount,
+    AmountKopecks,
     Number,
     OperationKind,
     Payer,
@@ -87,6 +89,34 @@ def test_amount(
         assert isinstance(e.raw_errors[0].exc, exception)
 
 
+class TestAmountKopecksModel(BaseModel):
+    field: AmountKopecks
+
+
+@pytest.mark.parametrize(
+    'value, exception, expected',
+    [
+        ('1000.50', None, 100050),
+        ('1' * 19, AmountValidationLengthError, None),
+        ('-0.01', AmountValidationLessOrEqualZeroError, None),
+        (True, AmountNotANumber, None),
+    ]
+)
+def test_amount_kopecks(
+    value: str,
+    exception: Type[Exception],
+    expected: int,
+) -> None:
+    try:
+        field = TestAmountKopecksModel(field=value).field
+    except ValidationError as e:
+        assert isinstance(e.raw_errors[0].exc, exception)
+    else:
+        assert isinstance(field, AmountKopecks)
+        assert field == expected
+        assert field.rubles == Decimal('1000.50')
+
+
 class TestPayerModel(BaseModel):
     field: Payer
 
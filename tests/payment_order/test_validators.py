@@ -1,6 +1,8 @@
+import random
+import re
 from contextlib import nullcontext
 from decimal import Decimal
-from typing import ContextManager, Optional
+from typing import Callable, ContextManager, Optional
 
 import pytest
 
@@ -9,8 +11,10 @@ from vitya.payment_order.errors import (
     AccountNumberValidationDigitsOnlyError,
     AccountNumberValidationSizeError,
     AccountNumberValidationTypeError,
+    AmountNotANumber,
     AmountValidationLengthError,
     AmountValidationLessOrEqualZeroError,
+    AmountValidationScaleError,
     CBCValidationTypeError,
     CBCValidationValueCannotZerosOnly,
     CBCValidationValueDigitsOnlyError,
@@ -40,9 +44,19 @@ from vitya.payment_order.errors import (
     UINValidationOnlyZeroError,
     UINValidationTypeError,
 )
+from vitya.payment_order.payments.constants import (
+    CHARS_FOR_PURPOSE,
+    REPLACE_CHARS_FOR_SPACE,
+)
 from vitya.payment_order.validators import (
+    find_account_in_name,
+    find_account_in_name_many,
+    sanitize_purpose,
+    sanitize_purpose_many,
     validate_account_number,
     validate_amount,
+    validate_amount_kopecks,
+    validate_amount_kopecks_many,
     validate_cbc,
     validate_document_date,
     validate_document_number,
@@ -59,6 +73,7 @@ from vitya.payment_order.validators import (
     validate_type_of_income,
     validate_uin,
     validate_uin_control_sum,
+    validate_uin_control_sum_many,
 )
 
 
@@ -80,6 +95,71 @@ def test_validate_amount(
         assert validate_amount(amount=value) == expected_value
 
 
+@pytest.mark.parametrize(
+    'value, exception_handler, expected_value',
+    [
+        ('000001', nullcontext(), 100),
+        ('1000.5', nullcontext(), 100050),
+        ('1000,50', nullcontext(), 100050),
+        ('+0.01', nullcontext(), 1),
+        ('1.500', nullcontext(), 150),
+        ('9' * 18, nullcontext(), int('9' * 18) * 100),
+        (7, nullcontext(), 700),
+        (0.1, nullcontext(), 10),
+        (Decimal('2.30'), nullcontext(), 230),
+        ('1' * 19, pytest.raises(AmountValidationLengthError), None),
+        ('0', pytest.raises(AmountValidationLessOrEqualZeroError), None),
+        ('-0.01', pytest.raises(AmountValidationLessOrEqualZeroError), None),
+        ('1.005', pytest.raises(AmountValidationScaleError), None),
+        (Decimal('0.001'), pytest.raises(AmountValidationScaleError), None),
+        ('1e3', pytest.raises(AmountNotANumber), None),
+        (' 1', pytest.raises(AmountNotANumber), None),
+        ('1.', pytest.raises(AmountNotANumber), None),
+        ('١', pytest.raises(AmountNotANumber), None),
+        ('', pytest.raises(AmountNotANumber), None),
+        (Decimal('NaN'), pytest.raises(AmountNotANumber), None),
+        (None, pytest.raises(AmountNotANumber), None),
+        (True, pytest.raises(AmountNotANumber), None),
+        (False, pytest.raises(AmountNotANumber), None),
+    ]
+)
+def test_validate_amount_kopecks(
+    value: str,
+    exception_handler: ContextManager,
+    expected_value: Optional[int]
+) -> None:
+    with exception_handler:
+        assert validate_amount_kopecks(amount=value) == expected_value
+
+
+def test_validate_amount_kopecks_matches_validate_amount() -> None:
+    for seed in range(2000):
+        rnd = random.Random(seed)
+        value = rnd.choice(['', '-']) + str(rnd.randrange(10 ** rnd.randrange(1, 18))).zfill(rnd.randrange(4))
+        if rnd.random() < 0.7:
+            value += '.' + str(rnd.randrange(10 ** 4)).zfill(rnd.randrange(1, 5))
+        try:
+            expected = validate_amount(value) * 100
+        except (AmountValidationLengthError, AmountValidationLessOrEqualZeroError) as e:
+            with pytest.raises(type(e)):
+                validate_amount_kopecks(value)
+            continue
+        if expected == int(expected):
+            assert validate_amount_kopecks(value) == expected, value
+        else:
+            with pytest.raises(AmountValidationScaleError):
+                validate_amount_kopecks(value)
+
+
+def test_validate_amount_kopecks_many() -> None:
+    kopecks, errors = validate_amount_kopecks_many(['1.5', '0', 'x', 2])
+    assert kopecks == [150, 0, 0, 200]
+    assert {index: type(error) for index, error in errors.items()} == {
+        1: AmountValidationLessOrEqualZeroError,
+        2: AmountNotANumber,
+    }
+
+
 @pytest.mark.parametrize(
     'value, exception_handler, expected_value',
     [
@@ -115,6 +195,37 @@ def test_validate_receiver(
         assert validate_receiver(value=value) == expected_value
 
 
+ACCOUNT_IN_NAME_VALUES = [
+    ('with 40802810722200035222', 5),
+    ('ООО "Ромашка" р/с 40702810900000000001 ИНН 7707083893', 18),
+    ('4' * 160, 0),
+    ('1' * 160, -1),
+    (('4' * 19 + ' ') * 8, -1),
+    ('x\n40802810722200035222', -1),
+    ('4080281072220003522٢', -1),
+    ('', -1),
+]
+
+
+def test_find_account_in_name() -> None:
+    reference_re = re.compile('(.*)(4)[0-9]{19}')
+    for value, position in ACCOUNT_IN_NAME_VALUES:
+        assert find_account_in_name(value) == position
+        assert (position != -1) == bool(reference_re.match(value))
+    for seed in range(2000):
+        rnd = random.Random(seed)
+        value = ''.join(rnd.choices('40123456789 \n', weights=[20, 10, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1], k=rnd.randrange(60)))
+        assert (find_account_in_name(value) != -1) == bool(reference_re.match(value)), value
+
+
+def test_find_account_in_name_many() -> None:
+    assert find_account_in_name_many(value for value, _ in ACCOUNT_IN_NAME_VALUES) == [
+        position for _, position in ACCOUNT_IN_NAME_VALUES
+    ]
+    assert find_account_in_name_many(['Ashot Ashot', '1' * 160]) == [-1, -1]
+    assert find_account_in_name_many([]) == []
+
+
 @pytest.mark.parametrize(
     'value, exception_handler, expected_value',
     [
@@ -229,6 +340,27 @@ def test_validate_purpose(
         assert validate_purpose(value=value) == expected_value
 
 
+def _sanitize_purpose_reference(value: str) -> str:
+    table = str.maketrans({char: ' ' for char in REPLACE_CHARS_FOR_SPACE})
+    return ''.join(c for c in value.translate(table) if c in CHARS_FOR_PURPOSE)
+
+
+PURPOSE_ALPHABET = ''.join(sorted(CHARS_FOR_PURPOSE | REPLACE_CHARS_FOR_SPACE)) + '的\x00\x7f€«»—\u200b\U0001f600'
+PURPOSE_VALUES = [
+    '',
+    'Оплата по счету №1\tот 01.01.2024\r\n',
+    'Payment for invoice 1',
+    *(''.join(random.Random(seed).choices(PURPOSE_ALPHABET, k=seed % 250)) for seed in range(500)),
+]
+
+
+def test_sanitize_purpose() -> None:
+    for value in PURPOSE_VALUES:
+        assert sanitize_purpose(value) == _sanitize_purpose_reference(value)
+    assert sanitize_purpose_many(PURPOSE_VALUES) == [_sanitize_purpose_reference(value) for value in PURPOSE_VALUES]
+    assert sanitize_purpose_many(iter(['a', 'b'])) == ['a', 'b']
+
+
 @pytest.mark.parametrize(
     'value, exception_handler, expected_value',
     [
@@ -264,6 +396,73 @@ def test_validate_uin_control_sum(
         validate_uin_control_sum(value=value)
 
 
+def _validate_uin_control_sum_reference(value: str) -> None:
+    # implementation before the single-pass one
+    if not value.isascii() or not value.isdigit():
+        raise UINValidationDigitsOnlyError
+    if len(value) != 20 and len(value) != 25:
+        return
+
+    count = 1
+    sum_ = 0
+    for c in value[:-1:]:
+        if count > 10:
+            count = 1
+        sum_ += int(c) * count
+        count += 1
+
+    if sum_ == 0:
+        raise UINValidationOnlyZeroError
+
+    mod_11 = sum_ % 11
+    if mod_11 != 10:
+        if mod_11 != int(value[-1]):
+            raise UINValidationControlSumError
+        return
+
+    count = 3
+    sum_ = 0
+    for c in value[:-1:]:
+        if count > 10:
+            count = 1
+        sum_ += int(c) * count
+        count += 1
+    mod_11 = sum_ % 11
+    mod_11 = 0 if mod_11 == 10 else mod_11
+    if mod_11 != int(value[-1]):
+        raise UINValidationControlSumError
+
+
+def _get_uin_control_sum_error(validator: Callable[[str], None], value: str) -> Optional[type]:
+    try:
+        validator(value)
+    except Exception as e:
+        return type(e)
+    return None
+
+
+# random values cover both weights of the control digit, about 1 of 11 needs the second ones
+UIN_CONTROL_SUM_VALUES = [
+    *(str(random.Random(seed).randrange(10 ** length)).zfill(length) for seed in range(3000) for length in (20, 25)),
+    *(str(value).zfill(20) for value in range(200)),
+    *(str(value).zfill(25) for value in range(200)),
+    '0' * 20, '0' * 25, '0' * 19 + '1', '11111', '1234', '', 'a', 'a' * 20, '1' * 19 + 'a', '١' * 20, '1' * 19 + '²',
+]
+
+
+def test_validate_uin_control_sum_equivalence():
+    for value in UIN_CONTROL_SUM_VALUES:
+        expected = _get_uin_control_sum_error(_validate_uin_control_sum_reference, value)
+        assert _get_uin_control_sum_error(validate_uin_control_sum, value) is expected, value
+
+
+def test_validate_uin_control_sum_many():
+    assert validate_uin_control_sum_many(UIN_CONTROL_SUM_VALUES) == [
+        _get_uin_control_sum_error(validate_uin_control_sum, value) is None for value in UIN_CONTROL_SUM_VALUES
+    ]
+    assert validate_uin_control_sum_many([]) == []
+
+
 @pytest.mark.parametrize(
     'value, exception_handler, expected_value',
     [
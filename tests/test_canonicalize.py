@@ -0,0 +1,86 @@
+import pytest
+
+from vitya import validate_kpp, validate_snils
+from vitya.canonicalize import (
+    ACCOUNT,
+    INN,
+    KINDS,
+    KPP,
+    SNILS,
+    CanonicalizationResult,
+    canonicalize,
+    canonicalize_many,
+    canonicalize_row,
+    canonicalize_rows,
+    canonicalize_with_report,
+    get_translate_table,
+)
+
+
+@pytest.mark.parametrize(
+    'kind, value, expected',
+    [
+        (SNILS, '112-233-445 95', '11223344595'),
+        (INN, ' 7707083893\n', '7707083893'),
+        (INN, '7707\xa0083 893', '7707083893'),
+        (INN, '７７０７０８３８９３', '7707083893'),
+        (INN, '​7707083893﻿', '7707083893'),
+        (INN, '7707–083–893', '7707083893'),
+        (KPP, '7707ab001', '7707AB001'),
+        (KPP, '７７０７ＡＢ００１', '7707AB001'),
+        (ACCOUNT, '40802.810.7.2220.0035222', '40802810722200035222'),
+        (INN, '7707.083893', '7707.083893'),
+        (INN, '7707083893', '7707083893'),
+        (INN, '', ''),
+        (INN, None, None),
+    ],
+)
+def test_canonicalize(kind, value, expected):
+    assert canonicalize(kind, value) == expected
+
+
+def test_canonicalized_values_pass_validators():
+    validate_snils(canonicalize(SNILS, '112-233-445 95'))
+    assert validate_kpp(canonicalize(KPP, '7707ab001')) == '7707AB001'
+
+
+def test_canonicalize_with_report():
+    assert canonicalize_with_report(INN, ' ７７07083893') == CanonicalizationResult('7707083893', ' ７７07083893', 1, 2)
+    assert canonicalize_with_report(INN, '7707083893') == CanonicalizationResult('7707083893', '7707083893', 0, 0)
+    assert not canonicalize_with_report(INN, 'abc').changed
+    assert canonicalize_with_report(KPP, '7707ab001').changed
+
+
+def test_canonicalize_many():
+    results = canonicalize_many(SNILS, ['11223344595', '112-233-445 95'])
+    assert [result.value for result in results] == ['11223344595', '11223344595']
+    assert [result.changed for result in results] == [False, True]
+
+
+def test_canonicalize_rows():
+    rows = [{'inn': ' 7707083893', 'kpp': '770701001', 'name': ' ООО '}, {'kpp': '7707ab001'}]
+    assert canonicalize_rows(rows, {'inn': INN, 'kpp': KPP, 'snils': SNILS}) == [
+        (
+            {'inn': '7707083893', 'kpp': '770701001', 'name': ' ООО '},
+            {'inn': CanonicalizationResult('7707083893', ' 7707083893', 1, 0)},
+        ),
+        ({'kpp': '7707AB001'}, {'kpp': CanonicalizationResult('7707AB001', '7707ab001', 0, 2)}),
+    ]
+    assert canonicalize_row({}, {'inn': INN}) == ({}, {})
+
+
+def test_translate_tables():
+    for kind in KINDS:
+        assert get_translate_table(kind) is get_translate_table(kind)
+    with pytest.raises(ValueError):
+        get_translate_table('unknown')
+
+
+@pytest.mark.parametrize('value', ['7707083893', '77 07', None, 7707083893])
+def test_unknown_kind(value):
+    with pytest.raises(ValueError):
+        canonicalize('unknown', value)
+    with pytest.raises(ValueError):
+        canonicalize_with_report('unknown', value)
+    with pytest.raises(ValueError):
+        canonicalize_many('unknown', [value])
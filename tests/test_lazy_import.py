@@ -0,0 +1,49 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import vitya
+import vitya.payment_order
+
+
+def _imported_modules(code: str) -> list:
+    output = subprocess.check_output([
+        sys.executable,
+        '-c',
+        f'import json, sys; {code}; print(json.dumps(sorted(sys.modules)))',
+    ])
+    return json.loads(output)
+
+
+def test_import_vitya_imports_nothing():
+    modules = _imported_modules('import vitya')
+    assert [module for module in modules if module.startswith('vitya')] == ['vitya', 'vitya.lazy_import']
+    assert 'pydantic' not in modules
+
+
+def test_payment_order_validators_imports_only_dependencies():
+    modules = _imported_modules('import vitya.payment_order.validators')
+    for module in (
+        'vitya.validators',
+        'vitya.payment_order.directories.bic',
+        'vitya.payment_order.fields',
+        'vitya.payment_order.payments.checkers',
+        'vitya.payment_order.payments.checks',
+        'xml.etree.ElementTree',
+    ):
+        assert module not in modules
+
+
+def test_lazy_attributes():
+    from vitya.validators import validate_inn
+
+    assert vitya.validate_inn is validate_inn
+    assert vitya.payment_order.directories.bic.__name__ == 'vitya.payment_order.directories.bic'
+    assert {'validate_inn', 'payment_order', 'validators'} <= set(dir(vitya))
+    assert 'payments' in dir(vitya.payment_order)
+    with pytest.raises(AttributeError):
+        vitya.unknown
+    with pytest.raises(AttributeError):
+        vitya.payment_order.unknown
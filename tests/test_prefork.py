@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import vitya
+from vitya.canonicalize import get_translate_table
+from vitya.payment_order.payments.checkers import get_checker_parameters
+from vitya.prefork import warmup
+
+# validates a payment in a forked worker and prints how much private memory the worker got
+FORK_SCRIPT = '''
+import gc
+import os
+import sys
+from typing import Optional
+
+import vitya
+from vitya.canonicalize import INN, canonicalize
+from vitya.payment_order.enums import PaymentType
+from vitya.payment_order.fields import Purpose, ReceiverAccountNumber, ReceiverBIC, ReceiverINN
+from vitya.payment_order.payments.checkers import BaseModelChecker
+
+
+class Payment(BaseModelChecker):
+    receiver_account_number: ReceiverAccountNumber
+    receiver_bic: ReceiverBIC
+    receiver_inn: Optional[ReceiverINN]
+    purpose: Optional[Purpose]
+    payment_type: PaymentType
+
+
+def get_private_kb():
+    with open('/proc/self/smaps_rollup') as f:
+        return sum(int(line.split()[1]) for line in f if line.startswith(('Private_Clean:', 'Private_Dirty:')))
+
+
+if sys.argv[1] == 'warmup':
+    vitya.warmup([Payment])
+read_fd, write_fd = os.pipe()
+pid = os.fork()
+if pid == 0:
+    before = get_private_kb()
+    canonicalize(INN, ' 598092767948')
+    Payment(
+        receiver_account_number='40802810722200035222',
+        receiver_bic='045004864',
+        receiver_inn='598092767948',
+        purpose='Оплата по счету 1',
+        payment_type='ip',
+    )
+    gc.collect()
+    os.write(write_fd, str(get_private_kb() - before).encode())
+    os._exit(0)
+os.close(write_fd)
+os.waitpid(pid, 0)
+print(os.read(read_fd, 100).decode())
+'''
+
+
+def test_warmup():
+    get_translate_table.cache_clear()
+    get_checker_parameters.cache_clear()
+    warmup(freeze=False)
+    assert get_translate_table.cache_info().currsize > 0
+    assert get_checker_parameters.cache_info().currsize > 0
+    assert vitya.warmup is warmup
+
+
+def _get_worker_private_kb(mode: str) -> int:
+    output = subprocess.check_output([sys.executable, '-c', FORK_SCRIPT, mode])
+    return int(output)
+
+
+@pytest.mark.skipif(not os.path.exists('/proc/self/smaps_rollup'), reason='requires linux /proc')
+def test_warmup_reduces_worker_private_memory():
+    cold = _get_worker_private_kb('cold')
+    warm = _get_worker_private_kb('warmup')
+    assert warm < cold / 2
@@ -0,0 +1,158 @@
+import random
+from itertools import islice
+from typing import Optional
+
+import pytest
+
+from vitya.payment_order.enums import PaymentType
+from vitya.payment_order.errors import (
+    ReceiverAccountValidationBICValueError,
+    ReceiverINNValidationIPLenError,
+)
+from vitya.payment_order.fields import (
+    CBC,
+    UIN,
+    Amount,
+    DocumentDate,
+    DocumentNumber,
+    ForThirdPerson,
+    OperationKind,
+    PayerINN,
+    PayerKPP,
+    PayerStatus,
+    Purpose,
+    Reason,
+    ReceiverAccountNumber,
+    ReceiverBIC,
+    ReceiverINN,
+    ReceiverKPP,
+    TaxPeriod,
+)
+from vitya.payment_order.payments.batch import validate_rows
+from vitya.payment_order.payments.checkers import BaseModelChecker
+from vitya.payment_order.payments.checks import check_account_by_bic
+from vitya.payment_order.validators import validate_uin
+from vitya.pydantic_fields import OKTMO
+from vitya.testing import (
+    PAYMENT_BREAKERS,
+    iter_payments,
+    make_account,
+    make_bic,
+    make_inn,
+    make_ogrn,
+    make_snils,
+    make_uin,
+)
+from vitya.validators import (
+    ValidationError,
+    validate_inn,
+    validate_ogrn,
+    validate_snils,
+)
+
+
+class GeneratedPayment(BaseModelChecker):
+    payment_type: PaymentType
+    amount: Amount
+    receiver_account_number: ReceiverAccountNumber
+    receiver_bic: ReceiverBIC
+    receiver_inn: Optional[ReceiverINN]
+    receiver_kpp: Optional[ReceiverKPP]
+    payer_inn: Optional[PayerINN]
+    payer_kpp: Optional[PayerKPP]
+    payer_status: Optional[PayerStatus]
+    purpose: Optional[Purpose]
+    uin: Optional[UIN]
+    cbc: Optional[CBC]
+    oktmo: Optional[OKTMO]
+    reason: Optional[Reason]
+    tax_period: Optional[TaxPeriod]
+    document_number: Optional[DocumentNumber]
+    document_date: Optional[DocumentDate]
+    operation_kind: OperationKind
+    for_third_person: ForThirdPerson
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_identifiers(seed):
+    rng = random.Random(seed)
+    for _ in range(200):
+        validate_inn(make_inn(rng, 10))
+        validate_inn(make_inn(rng, 12))
+        validate_ogrn(make_ogrn(rng))
+        validate_ogrn(make_ogrn(rng, is_ip=True))
+        validate_snils(make_snils(rng))
+        validate_uin(make_uin(rng))
+        bic = make_bic(rng)
+        check_account_by_bic(make_account(rng, bic, '40802'), bic)
+
+        with pytest.raises(ValueError):
+            validate_inn(make_inn(rng, rng.choice([10, 12]), valid=False))
+        with pytest.raises(ValidationError):
+            validate_ogrn(make_ogrn(rng, is_ip=rng.random() < 0.5, valid=False))
+        with pytest.raises(ValidationError):
+            validate_snils(make_snils(rng, valid=False))
+        with pytest.raises(ValueError):
+            validate_uin(make_uin(rng, valid=False))
+        with pytest.raises(ValueError):
+            check_account_by_bic(make_account(rng, bic, valid=False), bic)
+
+
+class FixedRandom(random.Random):
+    def __init__(self, *values: int) -> None:
+        super().__init__()
+        self.values = list(values)
+
+    def randint(self, a: int, b: int) -> int:
+        return self.values.pop(0)
+
+
+@pytest.mark.parametrize('shift', [1, 99])
+def test_broken_snils_with_checksum_100(shift):
+    # 001-019-989 has checksum 100, written as '00'
+    snils = make_snils(FixedRandom(1019989, shift), valid=False)
+    assert snils[:9] == '001019989'
+    with pytest.raises(ValidationError):
+        validate_snils(snils)
+
+
+def test_iter_payments_is_reproducible():
+    assert list(iter_payments(seed=1, count=50)) == list(iter_payments(seed=1, count=50))
+    assert list(iter_payments(seed=1, count=50)) != list(iter_payments(seed=2, count=50))
+    assert len(list(islice(iter_payments(seed=1), 10))) == 10
+
+
+def test_valid_payments():
+    payments = list(iter_payments(seed=0, count=1000))
+    assert {payment.values['payment_type'] for payment in payments} == {payment_type.value for payment_type in PaymentType}
+    assert len({payment.values['payer_status'] for payment in payments}) > 5
+    assert list(validate_rows(GeneratedPayment, [payment.values for payment in payments])) == []
+
+
+def test_broken_payments():
+    ratio = 0.9 / len(PAYMENT_BREAKERS)
+    payments = list(iter_payments(seed=0, error_ratios=dict.fromkeys(PAYMENT_BREAKERS, ratio), count=3000))
+    errors = {error.row: error.errors for error in validate_rows(GeneratedPayment, [p.values for p in payments])}
+    for index, payment in enumerate(payments):
+        expected = (payment.error.__name__,) if payment.error is not None else ()
+        assert errors.get(index, ()) == expected, payment
+    assert {payment.error for payment in payments} == {None, *PAYMENT_BREAKERS}
+    share = sum(payment.error is ReceiverINNValidationIPLenError for payment in payments) / len(payments)
+    assert abs(share - ratio) < 0.02
+
+
+def test_payment_types_of_errors():
+    payments = iter_payments(
+        seed=0,
+        error_ratios={ReceiverAccountValidationBICValueError: 1},
+        payment_types=[PaymentType.FNS, PaymentType.IP],
+        count=20,
+    )
+    assert {payment.values['payment_type'] for payment in payments} == {'ip'}
+
+    with pytest.raises(ValueError):
+        next(iter_payments(error_ratios={ReceiverAccountValidationBICValueError: 1}, payment_types=[PaymentType.FNS]))
+    with pytest.raises(ValueError):
+        next(iter_payments(error_ratios={ValueError: 0.1}))
+    with pytest.raises(ValueError):
+        next(iter_payments(error_ratios={ReceiverAccountValidationBICValueError: 0.6, ReceiverINNValidationIPLenError: 0.6}))
@@ -33,6 +33,7 @@ from vitya.pydantic_fields import (
     SNILS,
     FieldMixin,
 )
+from vitya.validators import get_inn_control_digits, get_snils_checksum
 
 
 class INNModel(BaseModel):
@@ -306,6 +307,33 @@ def test_wrong_snils(snils):
         SNILSModel(snils=snils)
 
 
+@pytest.mark.parametrize(
+    'snils', [
+        '11223344595',
+        '21647164763',
+        '00101998900',
+    ]
+)
+def test_get_snils_checksum(snils):
+    assert get_snils_checksum(snils[:9]) == snils[9:]
+
+
+@pytest.mark.parametrize(
+    'inn', [
+        '3664069397', '302502032671', '7707083893', '771002344404'
+    ]
+)
+def test_get_inn_control_digits(inn):
+    control_digits = 1 if len(inn) == 10 else 2
+    assert get_inn_control_digits(inn[:-control_digits]) == inn[-control_digits:]
+
+
+@pytest.mark.parametrize('inn', ['', '36640693', '30250203267'])
+def test_get_inn_control_digits_wrong_len(inn):
+    with pytest.raises(ValueError):
+        get_inn_control_digits(inn)
+
+
 @pytest.mark.parametrize(
     'oktmo', [
         '69654000',
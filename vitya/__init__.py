@@ -1,15 +1,21 @@
-from .validators import (
-    ValidationError,
-    validate_bic,
-    validate_inn,
-    validate_inn_ip,
-    validate_inn_le,
-    validate_kpp,
-    validate_ogrn,
-    validate_ogrnip,
-    validate_oktmo,
-    validate_snils,
-)
+from typing import TYPE_CHECKING
+
+from .lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .prefork import warmup
+    from .validators import (
+        ValidationError,
+        validate_bic,
+        validate_inn,
+        validate_inn_ip,
+        validate_inn_le,
+        validate_kpp,
+        validate_ogrn,
+        validate_ogrnip,
+        validate_oktmo,
+        validate_snils,
+    )
 
 __all__ = (
     'ValidationError',
@@ -22,4 +28,25 @@ __all__ = (
     'validate_ogrnip',
     'validate_oktmo',
     'validate_snils',
+    'warmup',
+)
+
+_LAZY_NAMES = {name: 'vitya.validators' for name in __all__}
+_LAZY_NAMES['warmup'] = 'vitya.prefork'
+
+# names and submodules are imported on the first access
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    _LAZY_NAMES,
+    (
+        'canonicalize',
+        'error_description',
+        'errors',
+        'errors_base',
+        'payment_order',
+        'prefork',
+        'pydantic_fields',
+        'typing_helpers',
+        'validators',
+    ),
 )
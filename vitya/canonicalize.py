@@ -0,0 +1,139 @@
+import unicodedata
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+INN = 'inn'
+KPP = 'kpp'
+BIC = 'bic'
+SNILS = 'snils'
+OGRN = 'ogrn'
+OKTMO = 'oktmo'
+ACCOUNT = 'account'
+UIN = 'uin'
+CBC = 'cbc'
+
+_ZERO_WIDTH = '\u200b\u200c\u200d\u2060\ufeff'
+_DASHES = '-\u2010\u2011\u2012\u2013\u2014\u2015\u2212\ufe58\ufe63\uff0d'
+
+# characters removed for each kind in addition to whitespace, zero-width characters and dashes
+_KIND_SEPARATORS = {
+    INN: '',
+    KPP: '',
+    BIC: '',
+    SNILS: '',
+    OGRN: '',
+    OKTMO: '',
+    ACCOUNT: '.',
+    UIN: '',
+    CBC: '',
+}
+KINDS = tuple(_KIND_SEPARATORS)
+
+
+class CanonicalizationResult(NamedTuple):
+    value: Any
+    original: Any
+    removed: int  # removed characters (spaces, dashes, ...)
+    replaced: int  # replaced characters (full-width or other unicode digits, lowercase letters)
+
+    @property
+    def changed(self) -> bool:
+        return self.removed > 0 or self.replaced > 0
+
+
+@lru_cache(maxsize=None)
+def _get_common_table() -> Dict[int, Optional[str]]:
+    table: Dict[int, Optional[str]] = {}
+    for code in range(0x80, 0x10000):
+        char = chr(code)
+        if char.isdecimal():
+            table[code] = str(unicodedata.decimal(char))
+        elif char.isspace():
+            table[code] = None
+    for char in ' \t\n\r\x0b\x0c' + _ZERO_WIDTH + _DASHES:
+        table[ord(char)] = None
+    return table
+
+
+def _check_kind(kind: str) -> None:
+    if kind not in _KIND_SEPARATORS:
+        raise ValueError(f'unknown identifier kind {kind}, must be one of {KINDS}')
+
+
+@lru_cache(maxsize=None)
+def get_translate_table(kind: str) -> Mapping[int, Optional[str]]:
+    """
+    str.translate table for kind: deletes whitespace, zero-width characters, dashes and kind separators,
+    maps unicode decimal digits (e.g. full-width) to ASCII, for KPP also maps letters to ASCII uppercase.
+    Built on the first use.
+    """
+    _check_kind(kind)
+    table = dict(_get_common_table())
+    for char in _KIND_SEPARATORS[kind]:
+        table[ord(char)] = None
+    if kind == KPP:
+        for char in 'abcdefghijklmnopqrstuvwxyz':
+            table[ord(char)] = char.upper()
+            table[ord(unicodedata.lookup(f'FULLWIDTH LATIN SMALL LETTER {char.upper()}'))] = char.upper()
+            table[ord(unicodedata.lookup(f'FULLWIDTH LATIN CAPITAL LETTER {char.upper()}'))] = char.upper()
+    return table
+
+
+def _is_canonical(kind: str, value: str) -> bool:
+    if kind == KPP:
+        return value.isascii() and value.isalnum() and not any(char.islower() for char in value)
+    return value.isascii() and value.isdigit()
+
+
+def canonicalize(kind: str, value: Any) -> Any:
+    """
+    Normalizes identifier in one str.translate pass, non-str values are returned as is
+    """
+    _check_kind(kind)
+    if not isinstance(value, str) or _is_canonical(kind, value):
+        return value
+    return value.translate(get_translate_table(kind))
+
+
+def canonicalize_with_report(kind: str, value: Any) -> CanonicalizationResult:
+    _check_kind(kind)
+    if not isinstance(value, str) or _is_canonical(kind, value):
+        return CanonicalizationResult(value, value, 0, 0)
+    table = get_translate_table(kind)
+    result = value.translate(table)
+    if result == value:
+        return CanonicalizationResult(value, value, 0, 0)
+    removed = len(value) - len(result)
+    replaced = sum(1 for char in value if table.get(ord(char), char) not in (char, None))
+    return CanonicalizationResult(result, value, removed, replaced)
+
+
+def canonicalize_many(kind: str, values: Iterable[Any]) -> List[CanonicalizationResult]:
+    _check_kind(kind)
+    return [canonicalize_with_report(kind, value) for value in values]
+
+
+def canonicalize_row(
+    row: Mapping[str, Any],
+    kinds: Mapping[str, str],
+) -> Tuple[Dict[str, Any], Dict[str, CanonicalizationResult]]:
+    """
+    Canonicalizes fields of row listed in kinds ({field name: kind}), returns new row and changes by field
+    """
+    result = dict(row)
+    changes: Dict[str, CanonicalizationResult] = {}
+    for field_name, kind in kinds.items():
+        if field_name not in result:
+            continue
+        report = canonicalize_with_report(kind, result[field_name])
+        if report.changed:
+            result[field_name] = report.value
+            changes[field_name] = report
+    return result, changes
+
+
+def canonicalize_rows(
+    rows: Iterable[Mapping[str, Any]],
+    kinds: Mapping[str, str],
+) -> List[Tuple[Dict[str, Any], Dict[str, CanonicalizationResult]]]:
+    return [canonicalize_row(row, kinds) for row in rows]
@@ -0,0 +1,29 @@
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_attributes(
+    package: str,
+    names: Dict[str, str],
+    submodules: Iterable[str] = (),
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Returns module-level __getattr__ and __dir__ for package that import names ({name: module}) and
+    submodules on the first access, so importing the package does not import its modules
+    """
+    submodules = frozenset(submodules)
+
+    def __getattr__(name: str) -> Any:
+        if name in names:
+            value = getattr(import_module(names[name]), name)
+        elif name in submodules:
+            value = import_module(f'{package}.{name}')
+        else:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}')
+        setattr(import_module(package), name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(import_module(package))) | set(names) | submodules)
+
+    return __getattr__, __dir__
@@ -0,0 +1,16 @@
+from vitya.lazy_import import lazy_attributes
+
+# submodules are imported on the first access
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {},
+    (
+        'directories',
+        'enums',
+        'errors',
+        'fields',
+        'ingest',
+        'payments',
+        'validators',
+    ),
+)
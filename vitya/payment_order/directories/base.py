@@ -0,0 +1,47 @@
+import os
+from contextlib import contextmanager
+from typing import Generic, Iterator, Optional, TypeVar, Union
+
+from vitya.typing_helpers import PathLike
+
+T = TypeVar('T')
+
+
+class DirectoryHolder(Generic[T]):
+    """
+    Holds directory used by directory checkers, None disables them.
+    Checkers read it on every check, so it can be replaced at any time without rebuilding models.
+    """
+
+    def __init__(self) -> None:
+        self._directory: Optional[T] = None
+
+    def get(self) -> Optional[T]:
+        return self._directory
+
+    def set(self, directory: Optional[T]) -> None:
+        self._directory = directory
+
+    @contextmanager
+    def using(self, directory: Optional[T]) -> Iterator[Optional[T]]:
+        """
+        Sets directory for the block and restores the previous one after it
+        """
+        previous = self._directory
+        self._directory = directory
+        try:
+            yield directory
+        finally:
+            self._directory = previous
+
+
+def write_atomically(path: PathLike, *parts: Union[bytes, bytearray]) -> None:
+    """
+    Writes parts to temporary file and moves it to path,
+    readers that already mapped the old file keep using it
+    """
+    tmp_path = f'{os.fspath(path)}.tmp'
+    with open(tmp_path, 'wb') as f:
+        for part in parts:
+            f.write(part)
+    os.replace(tmp_path, path)
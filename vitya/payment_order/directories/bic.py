@@ -0,0 +1,238 @@
+import mmap
+import os
+import struct
+from typing import BinaryIO, Iterable, Iterator, List, NamedTuple, Optional, Union
+from xml.etree.ElementTree import iterparse
+
+from vitya.payment_order.directories.base import DirectoryHolder, write_atomically
+from vitya.typing_helpers import PathLike
+
+PARTICIPANT_STATUS_ACTIVE = 'PSAC'
+PARTICIPANT_STATUS_DELETED = 'PSDL'
+CORRESPONDENT_ACCOUNT_TYPE = 'CRSA'
+ACCOUNT_STATUS_DELETED = 'ACDL'
+
+
+class BICInfo(NamedTuple):
+    bic: str
+    name: str
+    status: str  # ED807 ParticipantStatus: PSAC - active, PSDL - deleted
+    correspondent_account: Optional[str]
+
+    @property
+    def is_active(self) -> bool:
+        return self.status == PARTICIPANT_STATUS_ACTIVE
+
+
+# Index layout (little-endian):
+#   header:  magic, version, record count, hash slot count
+#   slots:   uint32 per slot, 0 - empty, otherwise record number + 1 (open addressing, linear probing)
+#   records: bic as uint32, status, correspondent account, name offset and length in the names area
+#   names:   utf-8 encoded names
+_MAGIC = b'VBIC'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHxxII')
+_SLOT = struct.Struct('<I')
+_RECORD = struct.Struct('<I4s20sII')
+
+
+def _hash(bic: int, mask: int) -> int:
+    return (bic * 2654435761) & mask
+
+
+def _slot_count(count: int) -> int:
+    slots = 8
+    while slots < count * 2:
+        slots *= 2
+    return slots
+
+
+def build_bic_index(entries: Iterable[BICInfo], path: PathLike) -> int:
+    """
+    Writes index file for BICDirectory, returns number of entries.
+    Later entries with the same BIC replace earlier ones.
+    """
+    records = {int(entry.bic): entry for entry in entries}
+    slots_count = _slot_count(len(records))
+    mask = slots_count - 1
+    slots = [0] * slots_count
+    names = bytearray()
+    packed_records = bytearray()
+    for number, (bic, entry) in enumerate(records.items()):
+        slot = _hash(bic, mask)
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = number + 1
+
+        name = entry.name.encode('utf-8')
+        packed_records += _RECORD.pack(
+            bic,
+            entry.status.encode('ascii'),
+            (entry.correspondent_account or '').encode('ascii'),
+            len(names),
+            len(name),
+        )
+        names += name
+
+    write_atomically(
+        path,
+        _HEADER.pack(_MAGIC, _VERSION, len(records), slots_count),
+        struct.pack(f'<{slots_count}I', *slots),
+        packed_records,
+        names,
+    )
+    return len(records)
+
+
+class BICDirectory:
+    """
+    Read-only BIC directory (ED807) over memory-mapped index built by build_bic_index.
+    Pages of the index are shared between all processes that open the same file.
+    """
+
+    def __init__(self, path: PathLike) -> None:
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, slots_count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._mmap.close()
+            raise ValueError(f'{os.fspath(path)} is not a bic index')
+        self._count: int = count
+        self._mask: int = slots_count - 1
+        self._slots_offset = _HEADER.size
+        self._records_offset: int = self._slots_offset + slots_count * _SLOT.size
+        self._names_offset: int = self._records_offset + self._count * _RECORD.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, bic: object) -> bool:
+        return isinstance(bic, str) and self._find(bic) is not None
+
+    def __enter__(self) -> 'BICDirectory':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def _find(self, bic: str) -> Optional[int]:
+        if len(bic) != 9 or not bic.isdigit():
+            return None
+        bic_int = int(bic)
+        slot = _hash(bic_int, self._mask)
+        while True:
+            number: int = _SLOT.unpack_from(self._mmap, self._slots_offset + slot * _SLOT.size)[0]
+            if number == 0:
+                return None
+            offset = self._records_offset + (number - 1) * _RECORD.size
+            if _SLOT.unpack_from(self._mmap, offset)[0] == bic_int:
+                return offset
+            slot = (slot + 1) & self._mask
+
+    def get(self, bic: str) -> Optional[BICInfo]:
+        offset = self._find(bic)
+        if offset is None:
+            return None
+        _, status, account, name_offset, name_len = _RECORD.unpack_from(self._mmap, offset)
+        name_start = self._names_offset + name_offset
+        return BICInfo(
+            bic=bic,
+            name=self._mmap[name_start:name_start + name_len].decode('utf-8'),
+            status=status.decode('ascii'),
+            correspondent_account=account.rstrip(b'\x00').decode('ascii') or None,
+        )
+
+    def is_active(self, bic: str) -> bool:
+        info = self.get(bic)
+        return info is not None and info.is_active
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def iter_ed807(source: Union[PathLike, BinaryIO]) -> Iterator[BICInfo]:
+    """
+    Stream-parses ED807 XML, keeping only the current BICDirectoryEntry in memory
+    """
+    events = iterparse(source, events=('start', 'end'))
+    _, root = next(events)
+    for event, element in events:
+        if event != 'end' or _local_name(element.tag) != 'BICDirectoryEntry':
+            continue
+
+        name = ''
+        status = PARTICIPANT_STATUS_ACTIVE
+        accounts: List[str] = []
+        deleted_accounts: List[str] = []
+        for child in element:
+            child_tag = _local_name(child.tag)
+            if child_tag == 'ParticipantInfo':
+                name = child.get('NameP', '')
+                status = child.get('ParticipantStatus', PARTICIPANT_STATUS_ACTIVE)
+            elif child_tag == 'Accounts' and child.get('RegulationAccountType') == CORRESPONDENT_ACCOUNT_TYPE:
+                if child.get('AccountStatus') == ACCOUNT_STATUS_DELETED:
+                    deleted_accounts.append(child.get('Account', ''))
+                else:
+                    accounts.append(child.get('Account', ''))
+        correspondent_accounts = accounts or deleted_accounts
+        yield BICInfo(
+            bic=element.get('BIC', ''),
+            name=name,
+            status=status,
+            correspondent_account=correspondent_accounts[0] if correspondent_accounts else None,
+        )
+        root.clear()
+
+
+_DBF_HEADER = struct.Struct('<B3xIHH20x')
+_DBF_FIELD = struct.Struct('<11sc4xBB14x')
+
+
+def iter_bic_dbf(path: PathLike, encoding: str = 'cp866') -> Iterator[BICInfo]:
+    """
+    Reads legacy BNKSEEK.DBF directory (fields NEWNUM, NAMEP, KSNP) record by record
+    """
+    with open(path, 'rb') as f:
+        _, records_count, header_len, record_len = _DBF_HEADER.unpack(f.read(_DBF_HEADER.size))
+        fields = {}
+        offset = 1  # deletion flag
+        while True:
+            descriptor = f.read(_DBF_FIELD.size)
+            if not descriptor or descriptor[0] == 0x0D:
+                break
+            field_name, _, field_len, _ = _DBF_FIELD.unpack(descriptor)
+            fields[field_name.split(b'\x00', 1)[0].decode('ascii')] = (offset, offset + field_len)
+            offset += field_len
+
+        def value(record: bytes, field_name: str) -> str:
+            start, end = fields[field_name]
+            return record[start:end].decode(encoding).strip()
+
+        f.seek(header_len)
+        for _ in range(records_count):
+            record = f.read(record_len)
+            if len(record) < record_len:
+                break
+            if record[:1] == b'*':
+                continue
+            yield BICInfo(
+                bic=value(record, 'NEWNUM'),
+                name=value(record, 'NAMEP'),
+                status=PARTICIPANT_STATUS_ACTIVE,
+                correspondent_account=value(record, 'KSNP') or None,
+            )
+
+
+def build_bic_index_from_file(source: PathLike, path: PathLike) -> int:
+    if os.fspath(source).lower().endswith('.dbf'):
+        return build_bic_index(iter_bic_dbf(source), path)
+    return build_bic_index(iter_ed807(source), path)
+
+
+bic_directory_holder: DirectoryHolder[BICDirectory] = DirectoryHolder()
+set_bic_directory = bic_directory_holder.set
+get_bic_directory = bic_directory_holder.get
@@ -0,0 +1,70 @@
+import csv
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, Set
+
+from vitya.payment_order.directories.base import DirectoryHolder
+from vitya.typing_helpers import PathLike
+
+CBC_LEN = 20
+ADMINISTRATOR_LEN = 3
+
+
+def iter_cbc_file(path: PathLike, delimiter: str = ';', encoding: str = 'utf-8') -> Iterator[str]:
+    """
+    Reads CBC codes from Minfin list exported as csv (code in the first column).
+    Codes may be written with spaces (182 1 01 02010 01 1000 110), header and other rows are skipped.
+    """
+    with open(path, encoding=encoding, newline='') as f:
+        for row in csv.reader(f, delimiter=delimiter):
+            if not row:
+                continue
+            code = ''.join(row[0].split())
+            if len(code) == CBC_LEN and code.isascii() and code.isdigit():
+                yield code
+
+
+class CBCDirectory:
+    """
+    CBC (КБК) directory. Codes are grouped by administrator (first 3 digits),
+    the rest 17 digits of each code are kept as uint64 in a sorted array and looked up by binary search.
+    """
+
+    def __init__(self, codes: Iterable[str]) -> None:
+        by_administrator: Dict[str, Set[int]] = {}
+        for code in codes:
+            by_administrator.setdefault(code[:ADMINISTRATOR_LEN], set()).add(int(code[ADMINISTRATOR_LEN:]))
+        self._codes: Dict[str, 'array[int]'] = {
+            administrator: array('Q', sorted(values))
+            for administrator, values in by_administrator.items()
+        }
+        self._len = sum(len(values) for values in self._codes.values())
+
+    @classmethod
+    def from_file(cls, path: PathLike, delimiter: str = ';', encoding: str = 'utf-8') -> 'CBCDirectory':
+        return cls(iter_cbc_file(path, delimiter=delimiter, encoding=encoding))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __contains__(self, cbc: object) -> bool:
+        if not isinstance(cbc, str) or len(cbc) != CBC_LEN or not cbc.isdigit():
+            return False
+        values = self._codes.get(cbc[:ADMINISTRATOR_LEN])
+        if values is None:
+            return False
+        value = int(cbc[ADMINISTRATOR_LEN:])
+        index = bisect_left(values, value)
+        return index < len(values) and values[index] == value
+
+    def has_administrator(self, administrator: str) -> bool:
+        return administrator in self._codes
+
+    @property
+    def administrators(self) -> Iterable[str]:
+        return self._codes.keys()
+
+
+cbc_directory_holder: DirectoryHolder[CBCDirectory] = DirectoryHolder()
+set_cbc_directory = cbc_directory_holder.set
+get_cbc_directory = cbc_directory_holder.get
@@ -0,0 +1,108 @@
+import csv
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, Optional
+
+from vitya.payment_order.directories.base import DirectoryHolder
+from vitya.typing_helpers import PathLike
+
+_PARTS_LEN = (2, 3, 3, 3)
+_EMPTY_LEVEL = '000'
+
+
+def _normalize(code: str) -> Optional[int]:
+    if len(code) == 8:
+        code += _EMPTY_LEVEL
+    if len(code) != 11 or not code.isascii() or not code.isdigit():
+        return None
+    return int(code)
+
+
+def _format(value: int) -> str:
+    code = f'{value:011d}'
+    return code[:8] if code.endswith(_EMPTY_LEVEL) else code
+
+
+def iter_oktmo_file(path: PathLike, delimiter: str = ';', encoding: str = 'cp1251') -> Iterator[str]:
+    """
+    Reads codes from OKTMO classifier published by Rosstat as csv:
+    either code split into columns "45";"328";"000";"000";... or whole 8/11-digit code in the first column
+    """
+    with open(path, encoding=encoding, newline='') as f:
+        for row in csv.reader(f, delimiter=delimiter):
+            cells = [cell.strip() for cell in row[:len(_PARTS_LEN)]]
+            if len(cells) == len(_PARTS_LEN) and all(
+                len(cell) == cell_len and cell.isdigit() for cell, cell_len in zip(cells, _PARTS_LEN)
+            ):
+                code = ''.join(cells)
+            elif cells:
+                code = cells[0]
+            else:
+                continue
+            value = _normalize(code)
+            if value is not None:
+                yield _format(value)
+
+
+class OKTMODirectory:
+    """
+    OKTMO directory kept as a single sorted uint64 array of 11-digit codes (8-digit codes are padded with "000").
+    The array has no per-code python objects, so after fork its pages stay shared between workers.
+    """
+
+    def __init__(self, codes: Iterable[str]) -> None:
+        values = set()
+        for code in codes:
+            value = _normalize(code)
+            if value is not None:
+                values.add(value)
+        self._codes = array('Q', sorted(values))
+
+    @classmethod
+    def from_file(cls, path: PathLike, delimiter: str = ';', encoding: str = 'cp1251') -> 'OKTMODirectory':
+        return cls(iter_oktmo_file(path, delimiter=delimiter, encoding=encoding))
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def _contains_value(self, value: int) -> bool:
+        index = bisect_left(self._codes, value)
+        return index < len(self._codes) and self._codes[index] == value
+
+    def __contains__(self, oktmo: object) -> bool:
+        if not isinstance(oktmo, str):
+            return False
+        value = _normalize(oktmo)
+        return value is not None and self._contains_value(value)
+
+    def get_parent(self, oktmo: str) -> Optional[str]:
+        """
+        Returns the closest upper territory present in the directory:
+        settlement -> municipal formation -> municipal district -> subject
+        """
+        for parent in get_oktmo_ancestors(oktmo):
+            value = _normalize(parent)
+            if value is not None and self._contains_value(value):
+                return parent
+        return None
+
+
+def get_oktmo_ancestors(oktmo: str) -> List[str]:
+    """
+    Upper levels of code by its structure (2 digits of subject, 3 + 3 digits of municipal formations,
+    3 digits of settlement), starting from the closest one
+    """
+    value = _normalize(oktmo)
+    if value is None:
+        return []
+    code = f'{value:011d}'
+    result = []
+    for level_end in (8, 5, 2):
+        if code[level_end:] != '0' * (11 - level_end):
+            result.append(_format(int(code[:level_end].ljust(11, '0'))))
+    return result
+
+
+oktmo_directory_holder: DirectoryHolder[OKTMODirectory] = DirectoryHolder()
+set_oktmo_directory = oktmo_directory_holder.set
+get_oktmo_directory = oktmo_directory_holder.get
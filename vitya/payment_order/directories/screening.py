@@ -0,0 +1,217 @@
+import csv
+import math
+import mmap
+import os
+import struct
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, Optional, Union
+
+from vitya.payment_order.directories.base import DirectoryHolder, write_atomically
+from vitya.typing_helpers import PathLike
+
+# INN is kept as uint64: its digits plus length * 10 ** 12,
+# so INNs of different length with the same digits (leading zeros) do not collide
+_INN_LENGTHS = frozenset({5, 10, 12})
+_LENGTH_BASE = 10 ** 12
+
+# File layouts (little-endian), data is aligned to 8 bytes:
+#   sorted list:  magic, version, count, then sorted uint64 keys
+#   bloom filter: magic, version, hash count, count, bit count, then bits
+_SORTED_MAGIC = b'VINS'
+_BLOOM_MAGIC = b'VINB'
+_VERSION = 1
+_SORTED_HEADER = struct.Struct('<4sHxxQ')
+_BLOOM_HEADER = struct.Struct('<4sHHQQ')
+_BLOOM_DATA_OFFSET = 32
+
+_MASK64 = (1 << 64) - 1
+
+
+def _inn_key(inn: str) -> Optional[int]:
+    if len(inn) not in _INN_LENGTHS or not inn.isascii() or not inn.isdigit():
+        return None
+    return int(inn) + len(inn) * _LENGTH_BASE
+
+
+def _mix(value: int) -> int:
+    # splitmix64 finalizer
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & _MASK64
+    return value ^ (value >> 31)
+
+
+def _bit_positions(key: int, hash_count: int, bit_count: int) -> Iterator[int]:
+    # double hashing: h1 + i * h2
+    h1 = _mix(key)
+    h2 = _mix(key ^ 0x9E3779B97F4A7C15) | 1
+    for i in range(hash_count):
+        yield (h1 + i * h2) % bit_count
+
+
+def iter_inn_file(path: PathLike, delimiter: str = ';', encoding: str = 'utf-8') -> Iterator[str]:
+    """
+    Reads INNs from the first column of csv (or plain one INN per line file), other rows are skipped
+    """
+    with open(path, encoding=encoding, newline='') as f:
+        for row in csv.reader(f, delimiter=delimiter):
+            if row and _inn_key(row[0].strip()) is not None:
+                yield row[0].strip()
+
+
+def build_inn_screening_list(inns: Iterable[str], path: PathLike) -> int:
+    """
+    Writes exact screening list (sorted uint64 array) for INNScreeningList, returns number of INNs
+    """
+    keys = sorted({key for key in map(_inn_key, inns) if key is not None})
+    write_atomically(
+        path,
+        _SORTED_HEADER.pack(_SORTED_MAGIC, _VERSION, len(keys)),
+        struct.pack(f'<{len(keys)}Q', *keys),
+    )
+    return len(keys)
+
+
+def build_inn_bloom_filter(inns: Iterable[str], path: PathLike, error_rate: float = 0.001) -> int:
+    """
+    Writes Bloom filter for INNBloomFilter, returns number of INNs.
+    Filter is ~1.8 bytes per INN for error_rate 0.001, but may answer True for an INN not in the list.
+    """
+    if not 0 < error_rate < 1:
+        raise ValueError('error_rate must be between 0 and 1')
+    keys = {key for key in map(_inn_key, inns) if key is not None}
+    bit_count = max(64, math.ceil(-len(keys) * math.log(error_rate) / math.log(2) ** 2))
+    bit_count = (bit_count + 63) // 64 * 64
+    hash_count = max(1, round(bit_count / max(len(keys), 1) * math.log(2)))
+    bits = bytearray(bit_count // 8)
+    for key in keys:
+        for position in _bit_positions(key, hash_count, bit_count):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    header = _BLOOM_HEADER.pack(_BLOOM_MAGIC, _VERSION, hash_count, len(keys), bit_count)
+    write_atomically(path, header.ljust(_BLOOM_DATA_OFFSET, b'\x00'), bytes(bits))
+    return len(keys)
+
+
+class _MappedFile(ABC):
+    def __init__(self, path: PathLike) -> None:
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self) -> '_MappedFile':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    @abstractmethod
+    def contains(self, inn: str) -> bool:  # pragma: no cover
+        pass
+
+    def __contains__(self, inn: object) -> bool:
+        return isinstance(inn, str) and self.contains(inn)
+
+    def contains_many(self, inns: Iterable[str]) -> List[bool]:
+        return [self.contains(inn) for inn in inns]
+
+
+class INNScreeningList(_MappedFile):
+    """
+    Exact INN list over memory-mapped sorted uint64 array built by build_inn_screening_list, 8 bytes per INN.
+    Pages of the file are shared between all processes that open it.
+    """
+
+    def __init__(self, path: PathLike) -> None:
+        super().__init__(path)
+        magic, version, count = _SORTED_HEADER.unpack_from(self._mmap, 0)
+        if magic != _SORTED_MAGIC or version != _VERSION:
+            self._mmap.close()
+            raise ValueError(f'{os.fspath(path)} is not an inn screening list')
+        self._count: int = count
+        self._keys = memoryview(self._mmap)[_SORTED_HEADER.size:].cast('Q')
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        self._keys.release()
+        super().close()
+
+    def _contains_key(self, key: int, lo: int = 0) -> int:
+        index = bisect_left(self._keys, key, lo)
+        return index if index < self._count and self._keys[index] == key else -1 - index
+
+    def contains(self, inn: str) -> bool:
+        key = _inn_key(inn)
+        return key is not None and self._contains_key(key) >= 0
+
+    def contains_many(self, inns: Iterable[str]) -> List[bool]:
+        """
+        Looks up INNs in sorted order, each search starts where the previous one stopped
+        """
+        keys = [_inn_key(inn) for inn in inns]
+        result = [False] * len(keys)
+        lo = 0
+        for number in sorted(range(len(keys)), key=lambda i: keys[i] or 0):
+            key = keys[number]
+            if key is None:
+                continue
+            index = self._contains_key(key, lo)
+            if index >= 0:
+                result[number] = True
+                lo = index
+            else:
+                lo = -1 - index
+        return result
+
+
+class INNBloomFilter(_MappedFile):
+    """
+    Probabilistic INN list over memory-mapped Bloom filter built by build_inn_bloom_filter.
+    False means INN is not in the list, True means it is in the list with the error rate set at build.
+    """
+
+    def __init__(self, path: PathLike) -> None:
+        super().__init__(path)
+        magic, version, hash_count, count, bit_count = _BLOOM_HEADER.unpack_from(self._mmap, 0)
+        if magic != _BLOOM_MAGIC or version != _VERSION:
+            self._mmap.close()
+            raise ValueError(f'{os.fspath(path)} is not an inn bloom filter')
+        self._hash_count: int = hash_count
+        self._count: int = count
+        self._bit_count: int = bit_count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def contains(self, inn: str) -> bool:
+        key = _inn_key(inn)
+        if key is None:
+            return False
+        bits = self._mmap
+        return all(
+            bits[_BLOOM_DATA_OFFSET + (position >> 3)] >> (position & 7) & 1
+            for position in _bit_positions(key, self._hash_count, self._bit_count)
+        )
+
+
+INNScreening = Union[INNScreeningList, INNBloomFilter]
+
+
+def open_inn_screening(path: PathLike) -> INNScreening:
+    """
+    Opens file built by build_inn_screening_list or build_inn_bloom_filter
+    """
+    with open(path, 'rb') as f:
+        magic = f.read(4)
+    if magic == _BLOOM_MAGIC:
+        return INNBloomFilter(path)
+    return INNScreeningList(path)
+
+
+inn_screening_holder: DirectoryHolder[INNScreening] = DirectoryHolder()
+set_inn_screening = inn_screening_holder.set
+get_inn_screening = inn_screening_holder.get
@@ -4,6 +4,7 @@ from typing import Any
 from pydantic.errors import PydanticTypeError, PydanticValueError
 
 from vitya.errors import (
+    BICValidationError,
     INNValidationError,
     INNValidationLenError,
     KPPValidationError,
@@ -21,7 +22,9 @@ from vitya.payment_order.payments.constants import (
     CHANGE_YEAR,
     CUSTOMS_REASONS,
     DOCUMENT_NUMBERS,
+    FNS_CBC_ADMINISTRATOR,
     FNS_KPP,
+    FTS_CBC_ADMINISTRATOR,
     FTS_KPP,
     FTS_OKTMO,
     PAYER_STATUSES,
@@ -63,6 +66,11 @@ class AmountNotANumber(AmountValidationError, IncorrectData):
     description_ru = 'должно быть числом'
 
 
+class AmountValidationScaleError(AmountValidationError, IncorrectData):
+    description = 'cannot contain fractions of kopeck'
+    description_ru = 'не может содержать долей копейки'
+
+
 class CustomerValidationError(VityaDescribedError, PydanticValueError):
     target = 'customer'
     target_ru = 'Плательщик или Получатель'
@@ -311,6 +319,11 @@ class ReceiverINNValidationNonEmptyError(ReceiverINNValidationError, NeedRequire
     description_ru = 'не может быть пустым'
 
 
+class ReceiverINNValidationScreeningError(ReceiverINNValidationError, IncorrectData):
+    description = 'found in screening list'
+    description_ru = 'найден в списке проверки контрагентов'
+
+
 class ReceiverINNValidationFLenError(ReceiverINNValidationError, ExactFieldLenError):
     required_len = 12
     description = 'for fl receiver inn must be 12'
@@ -574,6 +587,26 @@ class CBCValidationValueCannotZerosOnly(CBCValidationError, IncorrectData):
     description_ru = 'не может состоять только из нулей'
 
 
+class CBCValidationNotFoundError(CBCValidationError, IncorrectData):
+    description = 'not found in cbc directory'
+    description_ru = 'не найден в справочнике КБК'
+
+
+class CBCValidationAdministratorNotFoundError(CBCValidationError, IncorrectData):
+    description = 'administrator code (first 3 digits) not found in cbc directory'
+    description_ru = 'код главного администратора доходов (первые 3 цифры) не найден в справочнике КБК'
+
+
+class CBCValidationFNSAdministratorError(CBCValidationError, IncorrectData):
+    description = f'for fns administrator code (first 3 digits) must be {FNS_CBC_ADMINISTRATOR}'
+    description_ru = f'для платежей в ФНС код администратора (первые 3 цифры) должен быть {FNS_CBC_ADMINISTRATOR}'
+
+
+class CBCValidationCustomsAdministratorError(CBCValidationError, IncorrectData):
+    description = f'for customs administrator code (first 3 digits) must be {FTS_CBC_ADMINISTRATOR}'
+    description_ru = f'для платежей в таможню код администратора (первые 3 цифры) должен быть {FTS_CBC_ADMINISTRATOR}'
+
+
 class OKTMOValidationEmptyNotAllowed(OKTMOValidationError, NeedRequiredField):
     target = 'oktmo'
     target_ru = 'ОКТМО'
@@ -596,6 +629,11 @@ class OKTMOValidationFTS(OKTMOValidationError, IncorrectData):
     description_ru = f'для платежей в таможню октмо может быть только {FTS_OKTMO}'
 
 
+class OKTMOValidationNotFoundError(OKTMOValidationError, IncorrectData):
+    description = 'not found in oktmo directory'
+    description_ru = 'не найден в справочнике ОКТМО'
+
+
 class ReasonValidationError(VityaDescribedError, PydanticValueError):
     target = 'reason'
     target_ru = 'Основание платежа'
@@ -842,3 +880,18 @@ class ReceiverAccountValidationBudgetOtherPayerStatusError(ReceiverAccountValida
 class TaxPeriodValidationBOValueOnlyOneZeroAllowed(TaxPeriodValidationError, IncorrectData):
     description = 'for bo must contain only one "0"'
     description_ru = 'для иных платежей в бюджет значение не должно состоять из более чем одного "0"'
+
+
+class ReceiverBICValidationError(BICValidationError):
+    target = 'receiver bic'
+    target_ru = 'БИК банка получателя'
+
+
+class ReceiverBICValidationNotFoundError(ReceiverBICValidationError, IncorrectData):
+    description = 'not found in bic directory'
+    description_ru = 'не найден в справочнике БИК'
+
+
+class ReceiverBICValidationInactiveError(ReceiverBICValidationError, IncorrectData):
+    description = 'participant is not active in bic directory'
+    description_ru = 'участник не активен в справочнике БИК'
@@ -4,6 +4,7 @@ from typing import Any, Callable, Generator, Optional
 from vitya.payment_order.validators import (
     validate_account_number,
     validate_amount,
+    validate_amount_kopecks,
     validate_cbc,
     validate_customer,
     validate_document_date,
@@ -45,6 +46,18 @@ class Amount(FieldMixin, Decimal):
         return validate_amount(value)
 
 
+class AmountKopecks(FieldMixin, int):
+    """Сумма (7) в копейках"""
+
+    @classmethod
+    def _validate(cls, value: str) -> int:
+        return validate_amount_kopecks(value)
+
+    @property
+    def rubles(self) -> Decimal:
+        return Decimal(int(self)).scaleb(-2)
+
+
 class Customer(FieldMixin, str):
     """Общий класс для описания сущности владельца денег"""
 
@@ -0,0 +1,122 @@
+import json
+import os
+from decimal import Decimal
+from functools import partial
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from vitya.payment_order.ingest.mapping import (
+    IngestResult,
+    iter_batches,
+    validate_mapped,
+    validate_mapped_in_pool,
+)
+from vitya.payment_order.payments.batch import ProcessPoolBatchValidator, validate_rows
+from vitya.payment_order.payments.checkers import BaseModelChecker
+from vitya.payment_order.payments.reference import (
+    get_reference_data,
+    pin_reference_data,
+)
+from vitya.typing_helpers import PathLike
+
+JSONDecoder = Callable[[Union[str, bytes]], Any]
+
+JSON_DECODE_ERROR = 'JSONDecodeError'
+JSON_NOT_OBJECT_ERROR = 'JSONNotObjectError'
+
+# stdlib decoder keeps amounts exact
+stdlib_json_decoder: JSONDecoder = partial(json.loads, parse_float=Decimal)
+
+
+def get_json_decoder(name: str = 'json') -> JSONDecoder:
+    """
+    Returns decoder by name: "json" (default) or "orjson", which must be installed.
+    orjson decodes numbers with fraction as float, use it only if amounts are passed as strings.
+    """
+    if name == 'json':
+        return stdlib_json_decoder
+    if name == 'orjson':
+        import orjson
+        return orjson.loads
+    raise ValueError(f'unknown json decoder {name}')
+
+
+def _iter_lines(source: Union[PathLike, BinaryIO, Iterable[Union[str, bytes]]]) -> Iterator[Tuple[int, Union[str, bytes]]]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            yield from enumerate(f, 1)
+    else:
+        yield from enumerate(source, 1)
+
+
+def _decode_batch(
+    decoder: JSONDecoder,
+    lines: List[Tuple[int, Union[str, bytes]]],
+) -> Tuple[List[Tuple[int, Dict[str, Any]]], List[IngestResult]]:
+    rows = []
+    errors = []
+    for number, line in lines:
+        try:
+            row = decoder(line)
+        except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError are ValueError
+            errors.append(IngestResult(number, None, (JSON_DECODE_ERROR,)))
+            continue
+        if isinstance(row, dict):
+            rows.append((number, row))
+        else:
+            errors.append(IngestResult(number, None, (JSON_NOT_OBJECT_ERROR,)))
+    return rows, errors
+
+
+def _validate_errors_only(
+    model_cls: Type[BaseModelChecker],
+    rows: List[Tuple[int, Dict[str, Any]]],
+) -> Iterator[IngestResult]:
+    errors = {error.row: error.errors for error in validate_rows(model_cls, (row for _, row in rows))}
+    for index, (number, _) in enumerate(rows):
+        yield IngestResult(number, None, errors.get(index, ()))
+
+
+def iter_validate_jsonl(
+    model_cls: Type[BaseModelChecker],
+    source: Union[PathLike, BinaryIO, Iterable[Union[str, bytes]]],
+    decoder: Optional[JSONDecoder] = None,
+    batch_size: int = 1000,
+    validator: Optional[ProcessPoolBatchValidator] = None,
+    keep_models: bool = False,
+) -> Iterator[IngestResult]:
+    """
+    Lazily validates JSON Lines (one object with model_cls field names per line) batch by batch,
+    memory depends only on batch_size. Lines are decoded with stdlib_json_decoder unless decoder is passed.
+    Position of result is the line number, blank lines are skipped.
+    Results have no models unless keep_models is set; with validator batches are validated in its workers
+    and keep_models is not supported.
+    """
+    if validator is not None and keep_models:
+        raise ValueError('models are not returned from worker processes')
+    decoder = decoder or stdlib_json_decoder
+    lines = ((number, line) for number, line in _iter_lines(source) if line.strip())
+    reference = get_reference_data()
+    for batch in iter_batches(lines, batch_size):
+        rows, errors = _decode_batch(decoder, batch)
+        with pin_reference_data(reference):
+            if validator is not None:
+                results = list(validate_mapped_in_pool(validator, rows, batch_size))
+            elif keep_models:
+                results = list(validate_mapped(model_cls, rows))
+            else:
+                results = list(_validate_errors_only(model_cls, rows))
+        if errors:
+            results = sorted(results + errors, key=lambda result: result.position)
+        yield from results
@@ -0,0 +1,152 @@
+from decimal import Decimal
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import ValidationError
+
+from vitya.payment_order.enums import PaymentType
+from vitya.payment_order.fields import ReceiverAccountNumber, ReceiverBIC, ReceiverKPP
+from vitya.payment_order.payments.batch import (
+    ProcessPoolBatchValidator,
+    get_error_codes,
+)
+from vitya.payment_order.payments.checkers import BaseModelChecker
+from vitya.payment_order.payments.reference import (
+    get_reference_data,
+    pin_reference_data,
+)
+from vitya.payment_order.payments.tools import infer_payment_type
+from vitya.typing_helpers import normalize_type
+
+T = TypeVar('T')
+
+
+class IngestResult(NamedTuple):
+    position: int  # line number or document number in the source
+    model: Optional[BaseModelChecker]
+    errors: Tuple[str, ...]  # error class names, empty if model is valid
+
+
+def kopecks_to_rubles(value: str) -> str:
+    """
+    Sum in kopecks (ED101, QR) to rubles, non-digit value is left for the Amount validation
+    """
+    if not value.isdigit():
+        return value
+    return str(Decimal(value).scaleb(-2))
+
+
+@lru_cache(maxsize=None)
+def get_fields_by_type(model_cls: Type[BaseModelChecker]) -> Mapping[Any, str]:
+    """
+    Field name of model_cls for each field type, like checkers are wired.
+    Types used by several fields are ambiguous and are not mapped.
+    """
+    result: Dict[Any, str] = {}
+    ambiguous = set()
+    for field in model_cls.__fields__.values():
+        field_type = normalize_type(field.type_)
+        if field_type in result:
+            ambiguous.add(field_type)
+        result[field_type] = field.name
+    for field_type in ambiguous:
+        del result[field_type]
+    return result
+
+
+def _get_str(data: Mapping[str, Any], fields_by_type: Mapping[Any, str], field_type: Any) -> Optional[str]:
+    field_name = fields_by_type.get(field_type)
+    value = data.get(field_name) if field_name is not None else None
+    return value if isinstance(value, str) else None
+
+
+def map_to_model(
+    model_cls: Type[BaseModelChecker],
+    values: Mapping[str, Any],
+    source_types: Mapping[str, Any],
+) -> Dict[str, Any]:
+    """
+    Maps source keys to model fields through vitya field types: source_types maps key of the source to the type,
+    e.g. {'ПолучательСчет': ReceiverAccountNumber}. Keys unknown or absent in the model are skipped.
+    If the model has PaymentType field and it is not mapped, it is inferred from the receiver requisites.
+    """
+    fields_by_type = get_fields_by_type(model_cls)
+    data: Dict[str, Any] = {}
+    for key, value in values.items():
+        field_name = fields_by_type.get(source_types.get(key))
+        if field_name is not None:
+            data[field_name] = value
+
+    payment_type_field = fields_by_type.get(PaymentType)
+    if payment_type_field is not None and payment_type_field not in data:
+        receiver_account = _get_str(data, fields_by_type, ReceiverAccountNumber)
+        if receiver_account is not None:
+            data[payment_type_field] = infer_payment_type(
+                receiver_account,
+                _get_str(data, fields_by_type, ReceiverBIC),
+                _get_str(data, fields_by_type, ReceiverKPP),
+            )
+    return data
+
+
+def validate_one(model_cls: Type[BaseModelChecker], position: int, data: Mapping[str, Any]) -> IngestResult:
+    try:
+        model = model_cls(**data)
+    except ValidationError as e:
+        return IngestResult(position, None, get_error_codes(e))
+    return IngestResult(position, model, ())
+
+
+def validate_mapped(
+    model_cls: Type[BaseModelChecker],
+    items: Iterable[Tuple[int, Mapping[str, Any]]],
+) -> Iterator[IngestResult]:
+    """
+    Validates (position, model data) items lazily, all of them against one reference data snapshot
+    """
+    reference = get_reference_data()
+    for position, data in items:
+        with pin_reference_data(reference):
+            result = validate_one(model_cls, position, data)
+        yield result
+
+
+def iter_batches(items: Iterable[T], batch_size: int) -> Iterator[List[T]]:
+    if batch_size <= 0:
+        raise ValueError('batch_size must be positive')
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def validate_mapped_in_pool(
+    validator: ProcessPoolBatchValidator,
+    items: Iterable[Tuple[int, Mapping[str, Any]]],
+    batch_size: int = 10_000,
+) -> Iterator[IngestResult]:
+    """
+    Validates (position, model data) items in worker processes batch by batch, all of them against
+    one reference data snapshot. Workers return only errors, so model of every result is None.
+    """
+    reference = get_reference_data()
+    for batch in iter_batches(items, batch_size):
+        with pin_reference_data(reference):
+            errors = {error.row: error.errors for error in validator.validate([data for _, data in batch])}
+        for row, (position, _) in enumerate(batch):
+            yield IngestResult(position, None, errors.get(row, ()))
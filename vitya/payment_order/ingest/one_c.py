@@ -0,0 +1,191 @@
+import codecs
+import os
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from vitya.payment_order.fields import (
+    CBC,
+    UIN,
+    Amount,
+    DocumentDate,
+    DocumentNumber,
+    Number,
+    OperationKind,
+    Payer,
+    PayerAccountNumber,
+    PayerINN,
+    PayerKPP,
+    PayerStatus,
+    PaymentOrder,
+    Purpose,
+    PurposeCode,
+    Reason,
+    Receiver,
+    ReceiverAccountNumber,
+    ReceiverBIC,
+    ReceiverINN,
+    ReceiverKPP,
+    TaxPeriod,
+)
+from vitya.payment_order.ingest.mapping import IngestResult, map_to_model, validate_one
+from vitya.payment_order.payments.checkers import BaseModelChecker
+from vitya.payment_order.payments.reference import (
+    get_reference_data,
+    pin_reference_data,
+)
+from vitya.pydantic_fields import OKTMO
+from vitya.typing_helpers import PathLike
+
+# keys of 1CClientBankExchange document section and vitya field types they are mapped to
+ONE_C_FIELD_TYPES: Mapping[str, Any] = {
+    'Номер': Number,
+    'Сумма': Amount,
+    'ПлательщикСчет': PayerAccountNumber,
+    'ПлательщикИНН': PayerINN,
+    'ПлательщикКПП': PayerKPP,
+    'Плательщик1': Payer,
+    'ПолучательСчет': ReceiverAccountNumber,
+    'ПолучательБИК': ReceiverBIC,
+    'ПолучательИНН': ReceiverINN,
+    'ПолучательКПП': ReceiverKPP,
+    'Получатель1': Receiver,
+    'ВидОплаты': OperationKind,
+    'Код': UIN,
+    'КодНазПлатежа': PurposeCode,
+    'Очередность': PaymentOrder,
+    'НазначениеПлатежа': Purpose,
+    'СтатусСоставителя': PayerStatus,
+    'ПоказательКБК': CBC,
+    'ОКАТО': OKTMO,
+    'ПоказательОснования': Reason,
+    'ПоказательПериода': TaxPeriod,
+    'ПоказательНомера': DocumentNumber,
+    'ПоказательДаты': DocumentDate,
+}
+
+FILE_HEADER = '1CClientBankExchange'
+DOCUMENT_START = 'СекцияДокумент'
+DOCUMENT_END = 'КонецДокумента'
+ACCOUNT_SECTION_START = 'СекцияРасчСчет'
+ACCOUNT_SECTION_END = 'КонецРасчСчет'
+FILE_END = 'КонецФайла'
+
+ONE_C_FORMAT_ERROR = 'OneCFormatError'
+
+# "Кодировка" header is looked up in raw bytes, the key itself is written in the encoding of the file
+_ENCODING_KEYS = {'Кодировка='.encode(encoding): encoding for encoding in ('cp1251', 'cp866')}
+_ENCODINGS = {'Windows': 'cp1251', 'DOS': 'cp866'}
+
+
+class OneCFormatError(ValueError):
+    def __init__(self, line: int, message: str) -> None:
+        super().__init__(f'line {line}: {message}')
+        self.line = line
+
+
+class OneCDocument(NamedTuple):
+    line: int  # line number of СекцияДокумент
+    kind: str  # e.g. "Платежное поручение"
+    values: Dict[str, str]
+    error: Optional[OneCFormatError] = None  # set for malformed document, values are read up to the error
+
+
+def _iter_lines(source: BinaryIO, encoding: Optional[str]) -> Iterator[Tuple[int, str]]:
+    current_encoding = encoding or 'cp1251'
+    for number, raw_line in enumerate(source, 1):
+        raw_line = raw_line.rstrip(b'\r\n')
+        if number == 1 and raw_line.startswith(codecs.BOM_UTF8):
+            raw_line = raw_line[len(codecs.BOM_UTF8):]
+            current_encoding = encoding or 'utf-8'
+        if encoding is None:
+            for key, key_encoding in _ENCODING_KEYS.items():
+                if raw_line.startswith(key):
+                    value = raw_line[len(key):].decode(key_encoding).strip()
+                    current_encoding = _ENCODINGS.get(value, key_encoding)
+        yield number, raw_line.decode(current_encoding)
+
+
+def _iter_documents(source: BinaryIO, encoding: Optional[str]) -> Iterator[OneCDocument]:
+    lines = _iter_lines(source, encoding)
+    for number, line in lines:
+        if line.strip():
+            if line.strip() != FILE_HEADER:
+                raise OneCFormatError(number, f'file must start with {FILE_HEADER}')
+            break
+    else:
+        return
+
+    # after a malformed document the rest of its lines are skipped up to the next СекцияДокумент
+    document: Optional[OneCDocument] = None
+    in_account_section = False
+    for number, line in lines:
+        key, sep, value = line.partition('=')
+        key = key.strip()
+        if document is not None:
+            if key == DOCUMENT_END:
+                yield document
+                document = None
+            elif key == DOCUMENT_START:
+                yield document._replace(error=OneCFormatError(number, f'{DOCUMENT_START} without {DOCUMENT_END}'))
+                document = OneCDocument(number, value.strip(), {})
+            elif sep:
+                document.values[key] = value.strip()
+            elif key:
+                yield document._replace(error=OneCFormatError(number, f'expected "key=value" or {DOCUMENT_END}'))
+                document = None
+        elif in_account_section:
+            in_account_section = key != ACCOUNT_SECTION_END
+        elif key == DOCUMENT_START:
+            document = OneCDocument(number, value.strip(), {})
+        elif key == ACCOUNT_SECTION_START:
+            in_account_section = True
+        elif key == FILE_END:
+            return
+    if document is not None:
+        yield document._replace(error=OneCFormatError(document.line, f'{DOCUMENT_START} without {DOCUMENT_END}'))
+
+
+def iter_one_c_documents(
+    source: Union[PathLike, BinaryIO],
+    encoding: Optional[str] = None,
+) -> Iterator[OneCDocument]:
+    """
+    Lazily reads documents of 1CClientBankExchange file, keeping only the current document in memory.
+    Encoding is taken from "Кодировка" header (Windows - cp1251, DOS - cp866) if not passed.
+    Malformed documents are yielded with error and reading goes on, OneCFormatError is raised only for bad header.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            yield from _iter_documents(f, encoding)
+    else:
+        yield from _iter_documents(source, encoding)
+
+
+def iter_validate_one_c(
+    model_cls: Type[BaseModelChecker],
+    source: Union[PathLike, BinaryIO],
+    encoding: Optional[str] = None,
+    field_types: Mapping[str, Any] = ONE_C_FIELD_TYPES,
+) -> Iterator[IngestResult]:
+    """
+    Validates documents of 1CClientBankExchange file as model_cls, position of result is the document line number.
+    Malformed documents are reported with OneCFormatError error.
+    """
+    reference = get_reference_data()
+    for document in iter_one_c_documents(source, encoding):
+        if document.error is not None:
+            yield IngestResult(document.line, None, (ONE_C_FORMAT_ERROR,))
+            continue
+        with pin_reference_data(reference):
+            result = validate_one(model_cls, document.line, map_to_model(model_cls, document.values, field_types))
+        yield result
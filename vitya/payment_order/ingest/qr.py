@@ -0,0 +1,126 @@
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Type, Union
+
+from vitya.payment_order.fields import (
+    CBC,
+    UIN,
+    Amount,
+    DocumentDate,
+    DocumentNumber,
+    PayerAccountNumber,
+    PayerINN,
+    PayerStatus,
+    Purpose,
+    Reason,
+    Receiver,
+    ReceiverAccountNumber,
+    ReceiverBIC,
+    ReceiverINN,
+    ReceiverKPP,
+    TaxPeriod,
+)
+from vitya.payment_order.ingest.mapping import (
+    IngestResult,
+    kopecks_to_rubles,
+    map_to_model,
+    validate_one,
+)
+from vitya.payment_order.payments.checkers import BaseModelChecker
+from vitya.payment_order.payments.reference import (
+    get_reference_data,
+    pin_reference_data,
+)
+from vitya.pydantic_fields import OKTMO
+
+# GOST R 56042-2014 payload: "ST0001" + encoding digit + separator, then key=value pairs
+QR_FORMAT_ID = 'ST0001'
+QR_HEADER_LEN = len(QR_FORMAT_ID) + 2
+QR_ENCODINGS = {'1': 'cp1251', '2': 'utf-8', '3': 'koi8-r'}
+
+# keys are compared case-insensitively
+QR_FIELD_TYPES: Mapping[str, Any] = {
+    'name': Receiver,
+    'personalacc': ReceiverAccountNumber,
+    'bic': ReceiverBIC,
+    'payeeinn': ReceiverINN,
+    'kpp': ReceiverKPP,
+    'sum': Amount,
+    'purpose': Purpose,
+    'payerinn': PayerINN,
+    'payeraccount': PayerAccountNumber,
+    'cbc': CBC,
+    'oktmo': OKTMO,
+    'drawerstatus': PayerStatus,
+    'paytreason': Reason,
+    'taxperiod': TaxPeriod,
+    'docno': DocumentNumber,
+    'docdate': DocumentDate,
+    'uin': UIN,
+}
+
+_HEADER_ERROR = 'payload must start with ST0001, encoding digit 1, 2 or 3 and separator'
+
+
+class QRFormatError(ValueError):
+    pass
+
+
+def parse_qr_payload(payload: Union[str, bytes]) -> Dict[str, str]:
+    """
+    Splits ST00012 payload into {lowercased key: value}, Sum is converted from kopecks to rubles.
+    Bytes are decoded by the encoding digit of the header.
+    """
+    if isinstance(payload, bytes):
+        encoding = QR_ENCODINGS.get(payload[len(QR_FORMAT_ID):len(QR_FORMAT_ID) + 1].decode('latin-1'))
+        if encoding is None:
+            raise QRFormatError(_HEADER_ERROR)
+        try:
+            payload = payload.decode(encoding)
+        except UnicodeDecodeError as e:
+            raise QRFormatError(str(e))
+
+    if (
+        len(payload) < QR_HEADER_LEN
+        or not payload.startswith(QR_FORMAT_ID)
+        or payload[len(QR_FORMAT_ID)] not in QR_ENCODINGS
+    ):
+        raise QRFormatError(_HEADER_ERROR)
+
+    separator = payload[QR_HEADER_LEN - 1]
+    values: Dict[str, str] = {}
+    for item in payload[QR_HEADER_LEN:].split(separator):
+        key, sep, value = item.partition('=')
+        if not sep:
+            if item.strip():
+                raise QRFormatError(f'expected key=value, got {item!r}')
+            continue
+        values[key.strip().lower()] = value.strip()
+    if 'sum' in values:
+        values['sum'] = kopecks_to_rubles(values['sum'])
+    return values
+
+
+def iter_validate_qr(
+    model_cls: Type[BaseModelChecker],
+    payloads: Iterable[Union[str, bytes]],
+) -> Iterator[IngestResult]:
+    """
+    Validates payloads as model_cls lazily against one reference data snapshot, position of result
+    is the payload number starting from 1. Payload which is not ST0001 gives result with QRFormatError code.
+    """
+    reference = get_reference_data()
+    for number, payload in enumerate(payloads, 1):
+        try:
+            values = parse_qr_payload(payload)
+        except QRFormatError:
+            yield IngestResult(number, None, (QRFormatError.__name__,))
+            continue
+        with pin_reference_data(reference):
+            result = validate_one(model_cls, number, map_to_model(model_cls, values, QR_FIELD_TYPES))
+        yield result
+
+
+def validate_qr_payloads(
+    model_cls: Type[BaseModelChecker],
+    payloads: Iterable[Union[str, bytes]],
+) -> List[IngestResult]:
+    return list(iter_validate_qr(model_cls, payloads))
@@ -0,0 +1,188 @@
+import os
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+from xml.etree.ElementTree import Element, iterparse
+
+from vitya.payment_order.fields import (
+    CBC,
+    UIN,
+    Amount,
+    DocumentDate,
+    DocumentNumber,
+    Number,
+    Payer,
+    PayerAccountNumber,
+    PayerINN,
+    PayerKPP,
+    PayerStatus,
+    PaymentOrder,
+    Purpose,
+    Reason,
+    Receiver,
+    ReceiverAccountNumber,
+    ReceiverBIC,
+    ReceiverINN,
+    ReceiverKPP,
+    TaxPeriod,
+)
+from vitya.payment_order.ingest.mapping import (
+    IngestResult,
+    kopecks_to_rubles,
+    map_to_model,
+    validate_mapped,
+    validate_mapped_in_pool,
+)
+from vitya.payment_order.payments.batch import ProcessPoolBatchValidator
+from vitya.payment_order.payments.checkers import BaseModelChecker
+from vitya.pydantic_fields import OKTMO
+from vitya.typing_helpers import PathLike
+
+
+class XMLFieldSpec(NamedTuple):
+    path: str  # relative to the record element: "Payee/@PersonalAcc" - attribute, "Purpose" - text
+    field_type: Any
+    convert: Optional[Callable[[str], Any]] = None
+
+
+ED101_RECORD = 'ED101'
+ED101_FIELDS: Sequence[XMLFieldSpec] = [
+    XMLFieldSpec('AccDoc/@AccDocNo', Number),
+    XMLFieldSpec('@Sum', Amount, kopecks_to_rubles),
+    XMLFieldSpec('@Priority', PaymentOrder),
+    XMLFieldSpec('@PaymentID', UIN),
+    XMLFieldSpec('Payer/@PersonalAcc', PayerAccountNumber),
+    XMLFieldSpec('Payer/@INN', PayerINN),
+    XMLFieldSpec('Payer/@KPP', PayerKPP),
+    XMLFieldSpec('Payer/Name', Payer),
+    XMLFieldSpec('Payee/@PersonalAcc', ReceiverAccountNumber),
+    XMLFieldSpec('Payee/@INN', ReceiverINN),
+    XMLFieldSpec('Payee/@KPP', ReceiverKPP),
+    XMLFieldSpec('Payee/Name', Receiver),
+    XMLFieldSpec('Payee/Bank/@BIC', ReceiverBIC),
+    XMLFieldSpec('Purpose', Purpose),
+    XMLFieldSpec('DepartmentalInfo/@DrawerStatus', PayerStatus),
+    XMLFieldSpec('DepartmentalInfo/@CBC', CBC),
+    XMLFieldSpec('DepartmentalInfo/@OKATO', OKTMO),
+    XMLFieldSpec('DepartmentalInfo/@PaytReason', Reason),
+    XMLFieldSpec('DepartmentalInfo/@TaxPeriod', TaxPeriod),
+    XMLFieldSpec('DepartmentalInfo/@DocNo', DocumentNumber),
+    XMLFieldSpec('DepartmentalInfo/@DocDate', DocumentDate),
+]
+
+# pacs.008 has no common place for budget requisites, pass own specs to map them
+PACS008_RECORD = 'CdtTrfTxInf'
+PACS008_FIELDS: Sequence[XMLFieldSpec] = [
+    XMLFieldSpec('PmtId/EndToEndId', Number),
+    XMLFieldSpec('IntrBkSttlmAmt', Amount),
+    XMLFieldSpec('DbtrAcct/Id/Othr/Id', PayerAccountNumber),
+    XMLFieldSpec('Dbtr/Id/OrgId/Othr/Id', PayerINN),
+    XMLFieldSpec('Dbtr/Id/PrvtId/Othr/Id', PayerINN),
+    XMLFieldSpec('Dbtr/Nm', Payer),
+    XMLFieldSpec('Tax/Dbtr/TaxTp', PayerKPP),
+    XMLFieldSpec('CdtrAcct/Id/Othr/Id', ReceiverAccountNumber),
+    XMLFieldSpec('CdtrAgt/FinInstnId/ClrSysMmbId/MmbId', ReceiverBIC),
+    XMLFieldSpec('Cdtr/Id/OrgId/Othr/Id', ReceiverINN),
+    XMLFieldSpec('Cdtr/Id/PrvtId/Othr/Id', ReceiverINN),
+    XMLFieldSpec('Cdtr/Nm', Receiver),
+    XMLFieldSpec('Tax/Cdtr/TaxTp', ReceiverKPP),
+    XMLFieldSpec('RmtInf/Ustrd', Purpose),
+    XMLFieldSpec('RmtInf/Strd/CdtrRefInf/Ref', UIN),
+]
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _get_value(element: Element, path: str) -> Optional[str]:
+    *steps, last = path.split('/')
+    for step in steps:
+        for child in element:
+            if _local_name(child.tag) == step:
+                element = child
+                break
+        else:
+            return None
+    if last.startswith('@'):
+        return element.get(last[1:])
+    for child in element:
+        if _local_name(child.tag) == last:
+            return (child.text or '').strip()
+    return None
+
+
+def _iter_records(source: Union[PathLike, BinaryIO], record_tag: str) -> Iterator[Element]:
+    # open elements are kept on a stack, so every processed record is removed from its parent
+    # and the tree never grows beyond the current record
+    stack: List[Element] = []
+    for event, element in iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            stack.append(element)
+            continue
+        stack.pop()
+        if _local_name(element.tag) == record_tag:
+            yield element
+            if stack:
+                stack[-1].remove(element)
+            element.clear()
+
+
+def iter_xml_documents(
+    source: Union[PathLike, BinaryIO],
+    record_tag: str = ED101_RECORD,
+    fields: Sequence[XMLFieldSpec] = ED101_FIELDS,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily reads payment records (ED101 elements, including ones inside PacketEPD, or pacs.008 CdtTrfTxInf),
+    returns values by field spec path, absent values are skipped
+    """
+    if isinstance(source, (str, os.PathLike)):
+        source = os.fspath(source)
+    for element in _iter_records(source, record_tag):
+        values: Dict[str, Any] = {}
+        for spec in fields:
+            value = _get_value(element, spec.path)
+            if value is not None:
+                values[spec.path] = value if spec.convert is None else spec.convert(value)
+        yield values
+
+
+def _iter_mapped(
+    model_cls: Type[BaseModelChecker],
+    source: Union[PathLike, BinaryIO],
+    record_tag: str,
+    fields: Sequence[XMLFieldSpec],
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    source_types = {spec.path: spec.field_type for spec in fields}
+    for number, values in enumerate(iter_xml_documents(source, record_tag, fields), 1):
+        yield number, map_to_model(model_cls, values, source_types)
+
+
+def iter_validate_xml(
+    model_cls: Type[BaseModelChecker],
+    source: Union[PathLike, BinaryIO],
+    record_tag: str = ED101_RECORD,
+    fields: Sequence[XMLFieldSpec] = ED101_FIELDS,
+    validator: Optional[ProcessPoolBatchValidator] = None,
+    batch_size: int = 10_000,
+) -> Iterator[IngestResult]:
+    """
+    Validates payment records as model_cls, position of result is the record number starting from 1.
+    With validator records are validated in its worker processes by batches and models are not returned.
+    """
+    items = _iter_mapped(model_cls, source, record_tag, fields)
+    if validator is not None:
+        return validate_mapped_in_pool(validator, items, batch_size)
+    return validate_mapped(model_cls, items)
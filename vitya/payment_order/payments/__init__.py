@@ -0,0 +1,17 @@
+from vitya.lazy_import import lazy_attributes
+
+# submodules are imported on the first access
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {},
+    (
+        'aio',
+        'batch',
+        'cache',
+        'checkers',
+        'checks',
+        'constants',
+        'reference',
+        'tools',
+    ),
+)
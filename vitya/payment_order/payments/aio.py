@@ -0,0 +1,143 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Deque,
+    Generic,
+    Iterable,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import ValidationError
+
+from vitya.payment_order.payments.checkers import BaseModelChecker
+
+ModelT = TypeVar('ModelT', bound=BaseModelChecker)
+
+
+# generic NamedTuple needs python 3.11
+@dataclass(frozen=True)
+class AsyncValidationResult(Generic[ModelT]):
+    row: int
+    model: Optional[ModelT]
+    error: Optional[ValidationError]
+
+
+def _build_model(model_cls: Type[ModelT], data: Mapping[str, Any]) -> ModelT:
+    return model_cls(**data)
+
+
+async def validate_payment_async(
+    model_cls: Type[ModelT],
+    data: Mapping[str, Any],
+    executor: Optional[Executor] = None,
+) -> ModelT:
+    """
+    Builds model_cls from data in executor (default loop executor if None), raises pydantic.ValidationError
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(_build_model, model_cls, dict(data)))
+
+
+async def _aiter_rows(
+    rows: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+) -> AsyncIterator[Mapping[str, Any]]:
+    if isinstance(rows, AsyncIterable):
+        async for row in rows:
+            yield row
+    else:
+        for row in rows:
+            yield row
+
+
+class AsyncValidator(Generic[ModelT]):
+    """
+    Offloads model validation to executor keeping at most max_concurrency validations in flight.
+    Callers of validate wait for a free slot, iter_validate pulls next row only when a slot is free.
+    """
+
+    def __init__(
+        self,
+        model_cls: Type[ModelT],
+        executor: Optional[Executor] = None,
+        max_concurrency: int = 16,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be positive')
+        self.model_cls = model_cls
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # created lazily to bind to the running loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def validate(self, data: Mapping[str, Any]) -> ModelT:
+        async with self.semaphore:
+            return await validate_payment_async(self.model_cls, data, self.executor)
+
+    async def iter_validate(
+        self,
+        rows: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+    ) -> AsyncIterator[AsyncValidationResult[ModelT]]:
+        """
+        Yields results in the order of rows, invalid rows are yielded with error instead of raising.
+        Rows share slots of the semaphore with concurrent validate calls.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self.semaphore
+        pending: Deque['asyncio.Future[ModelT]'] = deque()
+        index = 0
+
+        def release(future: 'asyncio.Future[ModelT]') -> None:
+            semaphore.release()
+
+        async def pop_result() -> AsyncValidationResult[ModelT]:
+            future = pending.popleft()
+            row = index - len(pending) - 1
+            try:
+                return AsyncValidationResult(row, await future, None)
+            except ValidationError as e:
+                return AsyncValidationResult(row, None, e)
+
+        try:
+            async for data in _aiter_rows(rows):
+                if len(pending) >= self.max_concurrency:
+                    yield await pop_result()
+                await semaphore.acquire()
+                try:
+                    future = loop.run_in_executor(self.executor, partial(_build_model, self.model_cls, dict(data)))
+                except BaseException:
+                    semaphore.release()
+                    raise
+                future.add_done_callback(release)
+                pending.append(future)
+                index += 1
+            while pending:
+                yield await pop_result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def iter_validate_payments_async(
+    model_cls: Type[ModelT],
+    rows: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+    executor: Optional[Executor] = None,
+    max_concurrency: int = 16,
+) -> AsyncIterator[AsyncValidationResult[ModelT]]:
+    async for result in AsyncValidator(model_cls, executor, max_concurrency).iter_validate(rows):
+        yield result
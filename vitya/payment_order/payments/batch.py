@@ -0,0 +1,302 @@
+import json
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, wait
+from decimal import Decimal
+from enum import Enum
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from pydantic import ValidationError
+
+from vitya.error_description import flatten_error_wrappers
+from vitya.payment_order.payments.checkers import BaseModelChecker, CheckerError
+from vitya.payment_order.payments.reference import (
+    ReferenceData,
+    get_reference_data,
+    pin_reference_data,
+)
+from vitya.pydantic_fields import BoolWrapper
+
+
+class BatchRowError(NamedTuple):
+    row: int
+    errors: Tuple[str, ...]  # error class names, e.g. ('ReceiverAccountValidationBICValueError',)
+
+
+class ScalingPoint(NamedTuple):
+    workers: int
+    seconds: float
+    speedup: float
+    efficiency: float
+
+
+def get_error_codes(exc: ValidationError) -> Tuple[str, ...]:
+    codes: List[str] = []
+    for error_wrapper in flatten_error_wrappers(exc.raw_errors):
+        if isinstance(error_wrapper.exc, CheckerError):
+            codes.extend(type(sub_error).__name__ for sub_error in error_wrapper.exc.errors)
+        else:
+            codes.append(type(error_wrapper.exc).__name__)
+    return tuple(codes)
+
+
+def validate_rows(
+    model_cls: Type[BaseModelChecker],
+    rows: Iterable[Mapping[str, Any]],
+    start: int = 0,
+) -> Iterator[BatchRowError]:
+    # the whole batch is validated against one reference data snapshot, even if it is reloaded meanwhile
+    reference = get_reference_data()
+    for index, row in enumerate(rows, start):
+        try:
+            with pin_reference_data(reference):
+                model_cls(**row)
+        except ValidationError as e:
+            yield BatchRowError(index, get_error_codes(e))
+
+
+def validate_batch(
+    model_cls: Type[BaseModelChecker],
+    rows: Iterable[Mapping[str, Any]],
+) -> List[BatchRowError]:
+    return list(validate_rows(model_cls, rows))
+
+
+# Rows travel to the workers as JSON arrays of values in the model field order,
+# so field names are not repeated per row and no per-row pickling happens.
+# The first item of array is a bit mask of fields absent from the row, their values are null.
+# Row which cannot be encoded is sent as null and reported with ROW_ENCODING_ERROR.
+
+ROW_ENCODING_ERROR = 'RowEncodingError'
+
+_ABSENT = object()
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, BoolWrapper):
+        return bool(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f'cannot encode {type(value)}')
+
+
+def _encode_row(field_names: Sequence[str], row: Mapping[str, Any]) -> List[Any]:
+    absent = 0
+    encoded: List[Any] = [0]
+    for index, name in enumerate(field_names):
+        value = row.get(name, _ABSENT)
+        if value is _ABSENT:
+            absent |= 1 << index
+            value = None
+        encoded.append(value)
+    encoded[0] = absent
+    return encoded
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=_encode_value)
+
+
+def encode_rows(
+    field_names: Sequence[str],
+    rows: Iterable[Mapping[str, Any]],
+    start: int = 0,
+) -> Tuple[bytes, List[BatchRowError]]:
+    """
+    Encodes rows in one json.dumps call, rows with values JSON cannot hold (e.g. date) are sent as null
+    and returned as errors
+    """
+    encoded = [_encode_row(field_names, row) for row in rows]
+    try:
+        return _dumps(encoded).encode(), []
+    except (TypeError, ValueError):
+        pass
+
+    items = []
+    errors = []
+    for index, row in enumerate(encoded, start):
+        try:
+            items.append(_dumps(row))
+        except (TypeError, ValueError):
+            items.append('null')
+            errors.append(BatchRowError(index, (ROW_ENCODING_ERROR,)))
+    return f'[{",".join(items)}]'.encode(), errors
+
+
+def decode_rows(field_names: Sequence[str], payload: bytes) -> List[Optional[Dict[str, Any]]]:
+    return [
+        None if row is None else {
+            name: value for index, (name, value) in enumerate(zip(field_names, row[1:])) if not row[0] >> index & 1
+        }
+        for row in json.loads(payload)
+    ]
+
+
+_worker_model_cls: Optional[Type[BaseModelChecker]] = None
+
+
+def _init_worker(model_cls: Type[BaseModelChecker]) -> None:
+    global _worker_model_cls
+    # unpickling model_cls imports its module, which builds the checker wiring once per worker
+    _worker_model_cls = model_cls
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _validate_chunk(
+    shm_name: str,
+    offset: int,
+    size: int,
+    start: int,
+    reference: ReferenceData,
+) -> List[BatchRowError]:
+    assert _worker_model_cls is not None
+    shm = SharedMemory(name=shm_name)
+    try:
+        assert shm.buf is not None
+        payload = bytes(shm.buf[offset:offset + size])
+    finally:
+        shm.close()
+    field_names = list(_worker_model_cls.__fields__)
+    rows = decode_rows(field_names, payload)
+    # workers do not see reloads of the parent registry, chunks are validated against the parent snapshot
+    with pin_reference_data(reference):
+        if None not in rows:
+            return list(validate_rows(_worker_model_cls, rows, start))  # type: ignore[arg-type]
+        errors: List[BatchRowError] = []
+        for index, row in enumerate(rows, start):
+            if row is not None:  # rows which were not encoded are reported by the parent
+                errors.extend(validate_rows(_worker_model_cls, [row], index))
+        return errors
+
+
+class ProcessPoolBatchValidator:
+    """
+    Validates batches of rows against model_cls in a pool of worker processes.
+    Model class must be importable by workers (defined at module level).
+    """
+
+    def __init__(
+        self,
+        model_cls: Type[BaseModelChecker],
+        max_workers: Optional[int] = None,
+        chunk_size: int = 1000,
+        mp_context: Any = None,
+    ) -> None:
+        self.model_cls = model_cls
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._field_names = list(model_cls.__fields__)
+        self._executor: Optional[Executor] = None
+        self._mp_context = mp_context
+
+    def start(self) -> None:
+        if self._executor is not None:
+            return
+        # workers attach to shared memory blocks, they must share the tracker of this process,
+        # otherwise a tracker started by a worker reports the blocks as leaked
+        resource_tracker.ensure_running()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=self._mp_context,
+            initializer=_init_worker,
+            initargs=(self.model_cls,),
+        )
+        # spawn and initialize every worker now instead of on the first batch
+        for future in [self._executor.submit(_ping) for _ in range(self.max_workers)]:
+            future.result()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> 'ProcessPoolBatchValidator':
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def validate(self, rows: Sequence[Mapping[str, Any]]) -> List[BatchRowError]:
+        if not rows:
+            return []
+        self.start()
+        assert self._executor is not None
+
+        reference = get_reference_data()
+        chunks = []
+        encoding_errors: List[BatchRowError] = []
+        for start in range(0, len(rows), self.chunk_size):
+            payload, errors = encode_rows(self._field_names, rows[start:start + self.chunk_size], start)
+            chunks.append((start, payload))
+            encoding_errors.extend(errors)
+        shm = SharedMemory(create=True, size=sum(len(payload) for _, payload in chunks))
+        try:
+            assert shm.buf is not None
+            tasks = []
+            offset = 0
+            for start, payload in chunks:
+                shm.buf[offset:offset + len(payload)] = payload
+                tasks.append((offset, len(payload), start))
+                offset += len(payload)
+
+            futures = [
+                self._executor.submit(_validate_chunk, shm.name, offset, size, start, reference)
+                for offset, size, start in tasks
+            ]
+            try:
+                result: List[BatchRowError] = []
+                for future in futures:
+                    result.extend(future.result())
+                if encoding_errors:
+                    result = sorted(result + encoding_errors, key=lambda error: error.row)
+                return result
+            except BaseException:
+                # other chunks may still be reading the block, it is unlinked only when all of them are done
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+                raise
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+def measure_scaling(
+    model_cls: Type[BaseModelChecker],
+    rows: Sequence[Mapping[str, Any]],
+    max_workers: Optional[int] = None,
+    chunk_size: int = 1000,
+) -> List[ScalingPoint]:
+    max_workers = max_workers or os.cpu_count() or 1
+    result: List[ScalingPoint] = []
+    base_seconds = 0.0
+    for workers in range(1, max_workers + 1):
+        with ProcessPoolBatchValidator(model_cls, max_workers=workers, chunk_size=chunk_size) as validator:
+            started = time.perf_counter()
+            validator.validate(rows)
+            seconds = time.perf_counter() - started
+        if workers == 1:
+            base_seconds = seconds
+        speedup = base_seconds / seconds if seconds else 0.0
+        result.append(ScalingPoint(workers, seconds, speedup, speedup / workers))
+    return result
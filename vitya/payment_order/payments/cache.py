@@ -0,0 +1,95 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, NamedTuple, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CounterpartyCache(Generic[T]):
+    """
+    LRU cache of validation verdicts with TTL.
+    Entries are expired lazily on access, the least recently used entry is evicted when maxsize is reached.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 100_000,
+        ttl: Optional[float] = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError('maxsize must be positive')
+        if ttl is not None and ttl <= 0:
+            raise ValueError('ttl must be positive or None')
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._data: 'OrderedDict[Hashable, Tuple[float, T]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[T]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < self._clock():
+                del self._data[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: T) -> None:
+        expires_at = float('inf') if self._ttl is None else self._clock() + self._ttl
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self) -> None:
+        """
+        Drops all entries, call it when rules used by cached checkers change
+        """
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._data),
+            )
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = self._misses = self._evictions = self._expirations = 0
@@ -1,11 +1,15 @@
+import json
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from functools import lru_cache
+from importlib import import_module
 from typing import (
     AbstractSet,
     Any,
     ClassVar,
     DefaultDict,
     Dict,
+    Iterable,
     List,
     Mapping,
     Optional,
@@ -37,12 +41,15 @@ from vitya.payment_order.fields import (
     ReceiverKPP,
     TaxPeriod,
 )
+from vitya.payment_order.payments.cache import CounterpartyCache
 from vitya.payment_order.payments.checks import (
     check_cbc,
+    check_cbc_with_directory,
     check_document_date,
     check_document_date_with_reason,
     check_document_number,
     check_oktmo,
+    check_oktmo_in_directory,
     check_oktmo_with_payer_status,
     check_oktmo_with_receiver_account_number,
     check_operation_kind,
@@ -57,13 +64,19 @@ from vitya.payment_order.payments.checks import (
     check_receiver_account,
     check_receiver_account_with_payment_type,
     check_receiver_account_with_payment_type_and_payer_status,
+    check_receiver_bic_in_directory,
     check_receiver_inn,
+    check_receiver_inn_screening,
     check_receiver_kpp,
     check_tax_period,
     check_uin,
 )
+from vitya.payment_order.payments.reference import (
+    get_reference_data,
+    pin_reference_data,
+)
 from vitya.pydantic_fields import OKTMO
-from vitya.typing_helpers import is_union, normalize_type
+from vitya.typing_helpers import NoneType, PathLike, is_union, normalize_type
 
 
 class CheckerError(ValueError):
@@ -91,6 +104,16 @@ class ReceiverAccountChecker(BaseChecker):
         check_receiver_account(value=self.account_number, payment_type=self.payment_type, receiver_bic=self.bic)
 
 
+class ReceiverBICDirectoryChecker(BaseChecker):
+    """Not wired automatically, requires directory set by set_bic_directory"""
+
+    def __init__(self, bic: ReceiverBIC) -> None:
+        self.bic = bic
+
+    def check(self) -> None:
+        check_receiver_bic_in_directory(value=self.bic)
+
+
 class ReceiverAccountCheckerWithPaymentType(BaseChecker):
     def __init__(self, account_number: ReceiverAccountNumber, payment_type: PaymentType) -> None:
         self.account_number = account_number
@@ -226,6 +249,16 @@ class ReceiverINNChecker(BaseChecker):
         check_receiver_inn(value=self.receiver_inn, payment_type=self.payment_type)
 
 
+class ReceiverINNScreeningChecker(BaseChecker):
+    """Not wired automatically, requires list set by set_inn_screening"""
+
+    def __init__(self, receiver_inn: Optional[ReceiverINN]) -> None:
+        self.receiver_inn = receiver_inn
+
+    def check(self) -> None:
+        check_receiver_inn_screening(value=self.receiver_inn)
+
+
 class PayerStatusChecker(BaseChecker):
     def __init__(
         self,
@@ -325,6 +358,21 @@ class CBCChecker(BaseChecker):
         check_cbc(value=self.cbc, payment_type=self.payment_type)
 
 
+class CBCDirectoryChecker(BaseChecker):
+    """Not wired automatically, uses directory set by set_cbc_directory if any"""
+
+    def __init__(
+        self,
+        cbc: Optional[CBC],
+        payment_type: PaymentType,
+    ) -> None:
+        self.cbc = cbc
+        self.payment_type = payment_type
+
+    def check(self) -> None:
+        check_cbc_with_directory(value=self.cbc, payment_type=self.payment_type)
+
+
 class OKTMOChecker(BaseChecker):
     def __init__(
         self,
@@ -338,6 +386,21 @@ class OKTMOChecker(BaseChecker):
         check_oktmo(value=self.oktmo, payment_type=self.payment_type)
 
 
+class OKTMODirectoryChecker(BaseChecker):
+    """Not wired automatically, requires directory set by set_oktmo_directory"""
+
+    def __init__(
+        self,
+        oktmo: Optional[OKTMO],
+        payment_type: PaymentType,
+    ) -> None:
+        self.oktmo = oktmo
+        self.payment_type = payment_type
+
+    def check(self) -> None:
+        check_oktmo_in_directory(value=self.oktmo, payment_type=self.payment_type)
+
+
 class OKTMOWithPayerStatusChecker(BaseChecker):
     def __init__(
         self,
@@ -457,6 +520,72 @@ class DocumentDateWithReasonChecker(BaseChecker):
 
 
 WiredChecker = Tuple[Type[BaseChecker], Sequence[str]]
+# error class, args and attributes of a cached error, a new instance is raised on every cache hit
+CachedError = Tuple[Type[Exception], Tuple[Any, ...], Dict[str, Any]]
+CounterpartyVerdict = Tuple[Optional[CachedError], ...]
+
+# checkers having only parameters of these types depend only on the receiver and payment type,
+# so their verdicts can be cached per counterparty
+COUNTERPARTY_TYPES = frozenset({ReceiverAccountNumber, ReceiverBIC, ReceiverINN, ReceiverKPP, PaymentType})
+# checkers reading directories that can be replaced at runtime, their verdicts are never cached
+DIRECTORY_CHECKERS = (ReceiverBICDirectoryChecker, ReceiverINNScreeningChecker, CBCDirectoryChecker, OKTMODirectoryChecker)
+
+# (auto checkers, (field name, field type) of each model field) -> wired auto checkers
+WiringKey = Tuple[Tuple[Type[BaseChecker], ...], Tuple[Tuple[str, Any], ...]]
+_wiring_plans: Dict[WiringKey, List[WiredChecker]] = {}
+# plans loaded by load_wiring_plans, keyed by _get_plan_key
+_loaded_wiring_plans: Dict[str, List[Tuple[str, List[str]]]] = {}
+
+
+@lru_cache(maxsize=None)
+def get_checker_parameters(checker_cls: Type[BaseChecker]) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Names and types of checker __init__ parameters, resolved once per checker class
+    """
+    return tuple(
+        (param_name, param_type)
+        for param_name, param_type in get_type_hints(checker_cls.__init__).items()  # strips Annotated by default
+        if param_name != 'return'
+    )
+
+
+@lru_cache(maxsize=None)
+def is_counterparty_checker(checker_cls: Type[BaseChecker]) -> bool:
+    if issubclass(checker_cls, DIRECTORY_CHECKERS):
+        return False
+    for _, param_type in get_checker_parameters(checker_cls):
+        param_types = param_type.__args__ if is_union(param_type) else (param_type,)
+        if any(tp is not NoneType and tp not in COUNTERPARTY_TYPES for tp in param_types):
+            return False
+    return True
+
+
+def _describe(obj: Any) -> str:
+    if isinstance(obj, type):
+        return f'{obj.__module__}:{obj.__qualname__}'
+    return repr(obj)
+
+
+def _get_plan_key(key: WiringKey) -> str:
+    checkers, fields = key
+    return json.dumps([
+        [_describe(checker_cls) for checker_cls in checkers],
+        [[field_name, _describe(field_type)] for field_name, field_type in fields],
+    ])
+
+
+def _import_checker(path: str) -> Type[BaseChecker]:
+    module_name, qualname = path.split(':')
+    obj: Any = import_module(module_name)
+    for name in qualname.split('.'):
+        obj = getattr(obj, name)
+    return obj  # type: ignore[no-any-return]
+
+
+def _resolve_wiring_plan(plan: Optional[List[Tuple[str, List[str]]]]) -> Optional[List[WiredChecker]]:
+    if plan is None:
+        return None
+    return [(_import_checker(checker_path), list(field_names)) for checker_path, field_names in plan]
 
 
 class BaseModelChecker(BaseModel):
@@ -491,6 +620,16 @@ class BaseModelChecker(BaseModel):
 
     __final_wired_checkers__: ClassVar[Sequence[WiredChecker]]  # this value is computed at __init_subclass__
 
+    # opt-in cache of counterparty checkers verdicts shared between validations
+    __counterparty_cache__: ClassVar[Optional[CounterpartyCache[CounterpartyVerdict]]] = None
+    __counterparty_checkers__: ClassVar[Sequence[bool]]  # computed at __init_subclass__
+    __counterparty_fields__: ClassVar[Sequence[str]]  # computed at __init_subclass__
+
+    def __init__(__pydantic_self__, **data: Any) -> None:
+        # field validators and checkers of one model see the same reference data snapshot
+        with pin_reference_data():
+            super().__init__(**data)
+
     def __init_subclass__(cls, **kwargs: Dict[str, Any]) -> None:  # pragma: no cover
         # built error
         errors = []
@@ -502,16 +641,41 @@ class BaseModelChecker(BaseModel):
             raise ValueError(errors)
 
         cls.__final_wired_checkers__ = list(cls.__extra_wired_checkers__) + list(cls._wire_auto_checkers())
+        cls.__counterparty_checkers__ = [
+            is_counterparty_checker(checker) for checker, _ in cls.__final_wired_checkers__
+        ]
+        cls.__counterparty_fields__ = sorted({
+            field_name
+            for (_, fields_names), is_counterparty in zip(cls.__final_wired_checkers__, cls.__counterparty_checkers__)
+            if is_counterparty
+            for field_name in fields_names
+        })
 
     @classmethod
     def _wire_auto_checkers(cls) -> Sequence[WiredChecker]:
         if not cls.__wire_auto_checkers__:
             return []
-        auto_checkers = [
+        key = cls._get_wiring_key()
+        result = _wiring_plans.get(key)
+        if result is None and _loaded_wiring_plans:
+            result = _resolve_wiring_plan(_loaded_wiring_plans.get(_get_plan_key(key)))
+        if result is None:
+            result = cls._resolve_auto_checkers(key[0])
+        _wiring_plans[key] = result
+        return result
+
+    @classmethod
+    def _get_wiring_key(cls) -> WiringKey:
+        # wiring depends only on checkers and field types, so model variants share it
+        auto_checkers = tuple(
             checker_cls
             for checker_cls in cls.__auto_checkers__
             if checker_cls not in cls.__excluded_auto_checkers__
-        ]
+        )
+        return auto_checkers, tuple((field.name, normalize_type(field.type_)) for field in cls.__fields__.values())
+
+    @classmethod
+    def _resolve_auto_checkers(cls, auto_checkers: Sequence[Type[BaseChecker]]) -> List[WiredChecker]:
         type_to_fields: DefaultDict[Any, List[ModelField]] = defaultdict(list)
         for field in cls.__fields__.values():
             type_to_fields[normalize_type(field.type_)].append(field)
@@ -531,12 +695,8 @@ class BaseModelChecker(BaseModel):
         type_to_fields: Mapping[Any, Sequence[ModelField]],
         checker_cls: Type[BaseChecker],
     ) -> Optional[WiredChecker]:
-        parameters = get_type_hints(checker_cls.__init__)  # by default get_type_hints strips Annotated
         field_names: List[str] = []
-        for param_name, param_type in parameters.items():
-            if param_name == 'return':
-                continue
-
+        for _, param_type in get_checker_parameters(checker_cls):
             fields = cls._get_matching_fields_by_type(type_to_fields, param_type)
             if len(fields) == 0:
                 return None
@@ -572,6 +732,8 @@ class BaseModelChecker(BaseModel):
 
     @root_validator(pre=False)
     def run_checkers(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        if cls.__counterparty_cache__ is not None and cls.__counterparty_fields__:
+            return cls._run_checkers_cached(values, cls.__counterparty_cache__)
         errors = []
         for checker, fields_names in cls.__final_wired_checkers__:
             try:
@@ -586,3 +748,107 @@ class BaseModelChecker(BaseModel):
         if errors:
             raise CheckerError(errors)
         return values
+
+    @classmethod
+    def _run_checkers_cached(
+        cls,
+        values: Dict[str, Any],
+        cache: CounterpartyCache[CounterpartyVerdict],
+    ) -> Dict[str, Any]:
+        cache_key = None
+        verdict: Optional[CounterpartyVerdict] = None
+        try:
+            cache_key = (
+                cls,
+                # the snapshot itself, not its version: pinned custom snapshots have version 0 too
+                get_reference_data(),
+                *(values[field_name] for field_name in cls.__counterparty_fields__),
+            )
+        except KeyError:
+            pass
+        else:
+            verdict = cache.get(cache_key)
+        new_verdict: List[Optional[CachedError]] = []
+
+        errors = []
+        counterparty_index = 0
+        for (checker, fields_names), is_counterparty in zip(cls.__final_wired_checkers__, cls.__counterparty_checkers__):
+            if verdict is not None and is_counterparty:
+                cached_error = verdict[counterparty_index]
+                counterparty_index += 1
+                if cached_error is not None:
+                    errors.append(_restore_error(cached_error))
+                continue
+            try:
+                args = [values[field_name] for field_name in fields_names]
+            except KeyError:  # pragma: no cover
+                continue
+            else:
+                try:
+                    checker(*args).check()
+                except Exception as e:
+                    errors.append(e)
+                    if is_counterparty:
+                        new_verdict.append((type(e), e.args, dict(vars(e))))
+                else:
+                    if is_counterparty:
+                        new_verdict.append(None)
+        if cache_key is not None and verdict is None:
+            cache.put(cache_key, tuple(new_verdict))
+        if errors:
+            raise CheckerError(errors)
+        return values
+
+
+def _restore_error(cached_error: CachedError) -> Exception:
+    # the way pickle restores exceptions
+    error_cls, args, attributes = cached_error
+    error = error_cls(*args)
+    vars(error).update(attributes)
+    return error
+
+
+def export_wiring_plans(model_classes: Iterable[Type[BaseModelChecker]]) -> List[Dict[str, Any]]:
+    """
+    Returns JSON-serializable auto wiring plans of model classes to be loaded by load_wiring_plans,
+    e.g. at build time, so that services skip resolving checkers signatures against model fields at start.
+    Plans are keyed by auto checkers and field types, model classes with the same fields share a plan.
+    """
+    plans: Dict[str, Dict[str, Any]] = {}
+    for model_cls in model_classes:
+        if not model_cls.__wire_auto_checkers__:
+            continue
+        plan_key = _get_plan_key(model_cls._get_wiring_key())
+        plans[plan_key] = {
+            'key': plan_key,
+            'wired_checkers': [
+                [_describe(checker_cls), list(field_names)]
+                for checker_cls, field_names in model_cls._wire_auto_checkers()
+            ],
+        }
+    return list(plans.values())
+
+
+def dump_wiring_plans(model_classes: Iterable[Type[BaseModelChecker]], path: PathLike) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(export_wiring_plans(model_classes), f, ensure_ascii=False, indent=1)
+
+
+def load_wiring_plans(plans: Iterable[Mapping[str, Any]]) -> None:
+    """
+    Loads plans from export_wiring_plans, model classes created after that use them instead of wiring
+    """
+    for plan in plans:
+        _loaded_wiring_plans[plan['key']] = [
+            (checker_path, list(field_names)) for checker_path, field_names in plan['wired_checkers']
+        ]
+
+
+def load_wiring_plans_file(path: PathLike) -> None:
+    with open(path, encoding='utf-8') as f:
+        load_wiring_plans(json.load(f))
+
+
+def clear_wiring_plans() -> None:
+    _wiring_plans.clear()
+    _loaded_wiring_plans.clear()
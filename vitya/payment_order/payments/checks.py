@@ -1,12 +1,21 @@
 import re
 from datetime import date
-from typing import Optional
+from itertools import repeat
+from typing import List, NamedTuple, Optional, Sequence, Union
 
+from vitya.payment_order.directories.bic import get_bic_directory
+from vitya.payment_order.directories.cbc import get_cbc_directory
+from vitya.payment_order.directories.oktmo import get_oktmo_directory
+from vitya.payment_order.directories.screening import get_inn_screening
 from vitya.payment_order.enums import PaymentType
 from vitya.payment_order.errors import (  # DocumentNumberValidationBOValueError,
     AccountValidationBICValueError,
     BudgetPaymentForThirdPersonError,
+    CBCValidationAdministratorNotFoundError,
+    CBCValidationCustomsAdministratorError,
     CBCValidationEmptyNotAllowed,
+    CBCValidationFNSAdministratorError,
+    CBCValidationNotFoundError,
     DocumentDateValidationBOLenError,
     DocumentDateValidationCustomsLenError,
     DocumentDateValidationCustomsReasonValueError,
@@ -23,6 +32,7 @@ from vitya.payment_order.errors import (  # DocumentNumberValidationBOValueError
     OKTMOValidationEmptyNotAllowed,
     OKTMOValidationFNSEmptyNotAllowed,
     OKTMOValidationFTS,
+    OKTMOValidationNotFoundError,
     OKTMOValidationZerosNotAllowed,
     OperationKindValidationBudgetValueError,
     PayerINNValidationCustomsLen10Error,
@@ -50,11 +60,14 @@ from vitya.payment_order.errors import (  # DocumentNumberValidationBOValueError
     ReceiverAccountValidationBudgetPayerStatusError,
     ReceiverAccountValidationCustomsValueError,
     ReceiverAccountValidationFNSValueError,
+    ReceiverBICValidationInactiveError,
+    ReceiverBICValidationNotFoundError,
     ReceiverINNValidationChameleonLenError,
     ReceiverINNValidationFLLenError,
     ReceiverINNValidationIPLenError,
     ReceiverINNValidationLELenError,
     ReceiverINNValidationNonEmptyError,
+    ReceiverINNValidationScreeningError,
     ReceiverKPPValidationEmptyNotAllowed,
     ReceiverKPPValidationFNS,
     ReceiverKPPValidationFTS,
@@ -96,32 +109,119 @@ from vitya.payment_order.fields import (
 )
 from vitya.payment_order.payments.constants import (
     CHANGE_YEAR,
-    CUSTOMS_REASONS,
     CUSTOMS_RECEIVER_ACCOUNT_NUMBER,
-    DOCUMENT_NUMBERS,
-    FNS_KPP,
+    FNS_CBC_ADMINISTRATOR,
     FNS_RECEIVER_ACCOUNT_NUMBER,
-    FNS_TAX_PAYER_STATUSES,
-    FTS_KPP,
-    FTS_OKTMO,
-    FTS_TAX_PAYER_STATUSES,
-    OTHER_OKTMO_RECEIVER_ACCOUNT_PREFIXES,
-    OTHER_OKTMO_RECEIVER_ACCOUNT_PREFIXES_2,
+    FTS_CBC_ADMINISTRATOR,
 )
+from vitya.payment_order.payments.reference import get_reference_data
 from vitya.pydantic_fields import BIC, OKTMO
+from vitya.validators import validate_inn
+
+# "INN//name//rest" format, parsed by single char class scans instead of
+# r'^\d+\/\/[a-zA-Zа-яА-ЯёЁ\s\W]+\/\/[а-яА-ЯёЁ\s!-~№]*$' which backtracks over overlapping classes
+_THIRD_PERSON_NAME_DISALLOWED_RE = re.compile(r'[^a-zA-Zа-яА-ЯёЁ\s\W]')
+_THIRD_PERSON_REST_DISALLOWED_RE = re.compile(r'[^а-яА-ЯёЁ\s!-~№]')
+
+
+class ThirdPersonPurpose(NamedTuple):
+    inn: str
+    name: str
+    rest: str
+
+
+def parse_third_person_purpose(value: str, check_inn: bool = False) -> Optional[ThirdPersonPurpose]:
+    """
+    Parses purpose of payment for third person "INN//name//rest" in O(n), returns None if it has other format.
+    Name ends at the first "//" followed by valid rest. With check_inn INN is validated by validate_inn.
+    """
+    name_start = value.find('//') + 2
+    inn = value[:name_start - 2]
+    if name_start == 1 or not inn.isdecimal():
+        return None
+
+    name_end = name_start
+    separator = value.find('//', name_start + 1)
+    while separator != -1:
+        if _THIRD_PERSON_NAME_DISALLOWED_RE.search(value, name_end, separator) is not None:
+            return None
+        name_end = separator
+        rest_error = _THIRD_PERSON_REST_DISALLOWED_RE.search(value, separator + 2)
+        if rest_error is None:
+            if check_inn:
+                validate_inn(inn)
+            return ThirdPersonPurpose(inn, value[name_start:separator], value[separator + 2:])
+        # rest must start after the char not allowed in it, so every char is scanned once
+        separator = value.find('//', rest_error.start() - 1)
+    return None
+
+
+def get_bic_key_digits(bic: str, rkc: bool = False) -> str:
+    """
+    Digits of BIC used in account control key. For accounts opened in RKC (division of the Bank of Russia),
+    e.g. treasury single accounts "40102...", it is "0" and 5-6 digits of BIC, otherwise last 3 digits
+    """
+    if rkc:
+        return '0' + bic[4:6]
+    return bic[-3:]
 
 
 def check_account_by_bic(
     account_number: AccountNumber,
     bic: BIC,
+    rkc: bool = False,
 ) -> None:
     _sum = 0
-    for c, v in zip(bic[-3:] + account_number, [7, 1, 3] * 8):
+    for c, v in zip(get_bic_key_digits(bic, rkc) + account_number, [7, 1, 3] * 8):
         _sum += int(c) * v
     if _sum % 10 != 0:
         raise AccountValidationBICValueError
 
 
+def _is_ascii_digits(value: str, length: int) -> bool:
+    return len(value) == length and value.isascii() and value.isdigit()
+
+
+def check_account_by_bic_many(
+    account_numbers: Sequence[str],
+    bics: Sequence[str],
+    rkc: Union[bool, Sequence[bool]] = False,
+) -> List[bool]:
+    """
+    Batch form of check_account_by_bic, returns mask of accounts valid for bic.
+    Accounts and bics that are not 20 and 9 ascii digits are considered invalid.
+    """
+    if len(account_numbers) != len(bics):
+        raise ValueError('account_numbers and bics must have equal length')
+    rkc_flags = repeat(rkc) if isinstance(rkc, bool) else rkc
+
+    result = []
+    for account_number, bic, is_rkc in zip(account_numbers, bics, rkc_flags):
+        if not (_is_ascii_digits(account_number, 20) and _is_ascii_digits(bic, 9)):
+            result.append(False)
+            continue
+        # weights 7, 1, 3 repeat every 3 chars, so key is a weighted sum of three byte slices;
+        # ascii code of digit is digit + 48 and the 48 terms of all 23 chars add up to 4080, i.e. 0 mod 10
+        codes = (get_bic_key_digits(bic, is_rkc) + account_number).encode('ascii')
+        result.append((7 * sum(codes[0::3]) + sum(codes[1::3]) + 3 * sum(codes[2::3])) % 10 == 0)
+    return result
+
+
+def check_receiver_bic_in_directory(
+    value: ReceiverBIC,
+) -> ReceiverBIC:
+    directory = get_bic_directory()
+    if directory is None:
+        return value
+
+    info = directory.get(value)
+    if info is None:
+        raise ReceiverBICValidationNotFoundError
+    if not info.is_active:
+        raise ReceiverBICValidationInactiveError
+    return value
+
+
 def check_receiver_account(
     value: ReceiverAccountNumber,
     payment_type: PaymentType,
@@ -294,6 +394,18 @@ def check_payer_inn_with_uin_and_receiver_account(
     return None
 
 
+def check_receiver_inn_screening(
+    value: Optional[ReceiverINN],
+) -> Optional[ReceiverINN]:
+    screening = get_inn_screening()
+    if screening is None or value is None:
+        return value
+
+    if screening.contains(value):
+        raise ReceiverINNValidationScreeningError
+    return value
+
+
 def check_receiver_inn(
     value: Optional[ReceiverINN],
     payment_type: PaymentType,
@@ -342,7 +454,7 @@ def check_purpose_for_third_person(
     if not for_third_person:
         return value
 
-    if not value or not re.match(r'^\d+\/\/[a-zA-Zа-яА-ЯёЁ\s\W]+\/\/[а-яА-ЯёЁ\s!-~№]*$', value):
+    if not value or parse_third_person_purpose(value) is None:
         raise PurposeValidationForThirdPersonError
 
     return value
@@ -359,13 +471,16 @@ def check_payer_status(
     if value is None:
         raise PayerStatusValidationNullNotAllowedError
 
-    if payment_type == PaymentType.FNS and value not in FNS_TAX_PAYER_STATUSES:
+    reference = get_reference_data()
+    if payment_type == PaymentType.FNS and value not in reference.fns_tax_payer_statuses:
         raise PayerStatusValidationFNSIncorrectDataError
 
-    if payment_type == PaymentType.CUSTOMS and value not in FTS_TAX_PAYER_STATUSES:
+    if payment_type == PaymentType.CUSTOMS and value not in reference.fts_tax_payer_statuses:
         raise PayerStatusValidationCustomsIncorrectDataError
 
-    if payment_type == PaymentType.BUDGET_OTHER and value in FNS_TAX_PAYER_STATUSES + FTS_TAX_PAYER_STATUSES:
+    if payment_type == PaymentType.BUDGET_OTHER and (
+        value in reference.fns_tax_payer_statuses or value in reference.fts_tax_payer_statuses
+    ):
         raise PayerStatusValidationOtherIncorrectDataError
 
     if payment_type == PaymentType.CUSTOMS and for_third_person == False and value == '06':  # noqa
@@ -406,9 +521,10 @@ def check_receiver_kpp(
         raise ReceiverKPPValidationEmptyNotAllowed
     if value.startswith('00'):
         raise ReceiverKPPValidationStartsWithZeros
-    if payment_type == PaymentType.FNS and value != FNS_KPP:
+    reference = get_reference_data()
+    if payment_type == PaymentType.FNS and value != reference.fns_kpp:
         raise ReceiverKPPValidationFNS
-    if payment_type == PaymentType.CUSTOMS and value != FTS_KPP:
+    if payment_type == PaymentType.CUSTOMS and value != reference.fts_kpp:
         raise ReceiverKPPValidationFTS
     return value
 
@@ -429,6 +545,28 @@ def check_cbc(
     return value
 
 
+def check_cbc_with_directory(
+    value: Optional[CBC],
+    payment_type: PaymentType,
+) -> Optional[CBC]:
+    if value is None or not payment_type.is_budget:
+        return value
+
+    if payment_type == PaymentType.FNS and value[:3] != FNS_CBC_ADMINISTRATOR:
+        raise CBCValidationFNSAdministratorError
+    if payment_type == PaymentType.CUSTOMS and value[:3] != FTS_CBC_ADMINISTRATOR:
+        raise CBCValidationCustomsAdministratorError
+
+    directory = get_cbc_directory()
+    if directory is None:
+        return value
+    if not directory.has_administrator(value[:3]):
+        raise CBCValidationAdministratorNotFoundError
+    if value not in directory:
+        raise CBCValidationNotFoundError
+    return value
+
+
 def check_oktmo(
     value: Optional[OKTMO],
     payment_type: PaymentType,
@@ -436,7 +574,7 @@ def check_oktmo(
     if not payment_type.is_budget:
         return None
 
-    if payment_type == PaymentType.CUSTOMS and value != FTS_OKTMO:
+    if payment_type == PaymentType.CUSTOMS and value != get_reference_data().fts_oktmo:
         raise OKTMOValidationFTS
 
     if payment_type in {PaymentType.FNS, PaymentType.BUDGET_OTHER} and value is None:
@@ -450,6 +588,19 @@ def check_oktmo(
     return value
 
 
+def check_oktmo_in_directory(
+    value: Optional[OKTMO],
+    payment_type: PaymentType,
+) -> Optional[OKTMO]:
+    directory = get_oktmo_directory()
+    if directory is None or value is None or value == '0' or not payment_type.is_budget:
+        return value
+
+    if value not in directory:
+        raise OKTMOValidationNotFoundError
+    return value
+
+
 def check_oktmo_with_payer_status(
     value: Optional[OKTMO],
     payment_type: PaymentType,
@@ -475,10 +626,11 @@ def check_oktmo_with_receiver_account_number(
     receiver_account_number: ReceiverAccountNumber,
 ) -> Optional[OKTMO]:
     if payment_type == PaymentType.BUDGET_OTHER and (value is None or value == '0'):
+        reference = get_reference_data()
         if (
-            receiver_account_number[:5] in OTHER_OKTMO_RECEIVER_ACCOUNT_PREFIXES
+            receiver_account_number[:5] in reference.other_oktmo_receiver_account_prefixes
             or (
-                receiver_account_number[:5] in OTHER_OKTMO_RECEIVER_ACCOUNT_PREFIXES_2
+                receiver_account_number[:5] in reference.other_oktmo_receiver_account_prefixes_2
                 and receiver_account_number[13] == '4'
             )
         ):
@@ -497,7 +649,7 @@ def check_reason(
 
     if payment_type.is_budget and (value is None or value == '0'):
         return None
-    if payment_type == PaymentType.CUSTOMS and value not in CUSTOMS_REASONS:
+    if payment_type == PaymentType.CUSTOMS and value not in get_reference_data().customs_reasons:
         raise ReasonValidationValueErrorCustoms
     if payment_type == PaymentType.FNS and value and value != '0':
         raise ReasonValidationValueErrorFNS
@@ -575,7 +727,7 @@ def check_document_number(
                 raise DocumentNumberValidationBOValueLenError
             if (
                 payer_status == '24' and (
-                    len(value) < 3 or value[2] != ';' or value[:2] not in DOCUMENT_NUMBERS
+                    len(value) < 3 or value[2] != ';' or value[:2] not in get_reference_data().document_numbers
                 )
             ):
                 raise DocumentNumberValidationBOValueError
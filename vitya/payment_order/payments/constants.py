@@ -89,6 +89,8 @@ DOCUMENT_NUMBERS = {
 FNS_KPP = '770701001'
 FTS_KPP = '773001001'
 FTS_OKTMO = '45328000'
+FNS_CBC_ADMINISTRATOR = '182'
+FTS_CBC_ADMINISTRATOR = '153'
 CHANGE_YEAR = 2024
 
 OTHER_OKTMO_RECEIVER_ACCOUNT_PREFIXES = [
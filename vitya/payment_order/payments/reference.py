@@ -0,0 +1,151 @@
+import json
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, FrozenSet, Iterator, NamedTuple, Optional
+
+from vitya.payment_order.payments.constants import (
+    CUSTOMS_REASONS,
+    DOCUMENT_NUMBERS,
+    FNS_KPP,
+    FNS_TAX_PAYER_STATUSES,
+    FTS_KPP,
+    FTS_OKTMO,
+    FTS_TAX_PAYER_STATUSES,
+    OTHER_OKTMO_RECEIVER_ACCOUNT_PREFIXES,
+    OTHER_OKTMO_RECEIVER_ACCOUNT_PREFIXES_2,
+    PAYER_STATUSES,
+    PAYER_STATUSES_AFTER_2024,
+)
+from vitya.typing_helpers import PathLike
+
+
+class ReferenceData(NamedTuple):
+    version: int
+    payer_statuses: FrozenSet[str]
+    payer_statuses_after_2024: FrozenSet[str]
+    customs_reasons: FrozenSet[str]
+    document_numbers: FrozenSet[str]
+    fns_kpp: str
+    fts_kpp: str
+    fts_oktmo: str
+    other_oktmo_receiver_account_prefixes: FrozenSet[str]
+    other_oktmo_receiver_account_prefixes_2: FrozenSet[str]
+    fns_tax_payer_statuses: FrozenSet[str]
+    fts_tax_payer_statuses: FrozenSet[str]
+
+
+DEFAULT_REFERENCE_DATA = ReferenceData(
+    version=0,
+    payer_statuses=frozenset(PAYER_STATUSES),
+    payer_statuses_after_2024=frozenset(PAYER_STATUSES_AFTER_2024),
+    customs_reasons=frozenset(CUSTOMS_REASONS),
+    document_numbers=frozenset(DOCUMENT_NUMBERS),
+    fns_kpp=FNS_KPP,
+    fts_kpp=FTS_KPP,
+    fts_oktmo=FTS_OKTMO,
+    other_oktmo_receiver_account_prefixes=frozenset(OTHER_OKTMO_RECEIVER_ACCOUNT_PREFIXES),
+    other_oktmo_receiver_account_prefixes_2=frozenset(OTHER_OKTMO_RECEIVER_ACCOUNT_PREFIXES_2),
+    fns_tax_payer_statuses=frozenset(FNS_TAX_PAYER_STATUSES),
+    fts_tax_payer_statuses=frozenset(FTS_TAX_PAYER_STATUSES),
+)
+
+_FIELD_TYPES: Dict[str, Any] = {
+    name: type(getattr(DEFAULT_REFERENCE_DATA, name))
+    for name in ReferenceData._fields
+    if name != 'version'
+}
+
+
+def build_reference_data(base: ReferenceData, values: Dict[str, Any], version: int) -> ReferenceData:
+    """
+    Builds new snapshot from base replacing passed values, sets are passed as lists
+    """
+    unknown = values.keys() - _FIELD_TYPES.keys()
+    if unknown:
+        raise ValueError(f'unknown reference data keys {sorted(unknown)}')
+
+    replaced: Dict[str, Any] = {}
+    for name, value in values.items():
+        if _FIELD_TYPES[name] is frozenset:
+            if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+                raise ValueError(f'{name} must be a list of strings')
+            replaced[name] = frozenset(value)
+        elif not isinstance(value, str):
+            raise ValueError(f'{name} must be a string')
+        else:
+            replaced[name] = value
+    return base._replace(version=version, **replaced)
+
+
+class ReferenceRegistry:
+    """
+    Holds current immutable ReferenceData snapshot.
+    Readers only read one attribute, writers build a new snapshot and replace it in one assignment,
+    so readers never lock and never see a half-updated snapshot.
+    """
+
+    def __init__(self, initial: ReferenceData = DEFAULT_REFERENCE_DATA) -> None:
+        self._current = initial
+        self._write_lock = threading.Lock()
+
+    @property
+    def current(self) -> ReferenceData:
+        return self._current
+
+    def update(self, values: Dict[str, Any]) -> ReferenceData:
+        with self._write_lock:
+            data = build_reference_data(self._current, values, self._current.version + 1)
+            self._current = data
+        return data
+
+    def reload(self, path: PathLike) -> ReferenceData:
+        """
+        Loads json object with ReferenceData fields (except version), missing fields keep current values
+        """
+        with open(path, encoding='utf-8') as f:
+            values = json.load(f)
+        if not isinstance(values, dict):
+            raise ValueError('reference data file must contain json object')
+        return self.update(values)
+
+    def reset(self) -> ReferenceData:
+        with self._write_lock:
+            data = DEFAULT_REFERENCE_DATA._replace(version=self._current.version + 1)
+            self._current = data
+        return data
+
+
+reference_registry = ReferenceRegistry()
+
+_pinned_reference_data: ContextVar[Optional[ReferenceData]] = ContextVar('vitya_reference_data', default=None)
+
+
+def get_reference_data() -> ReferenceData:
+    """
+    Returns snapshot pinned by pin_reference_data in the current context or the current one
+    """
+    pinned = _pinned_reference_data.get()
+    if pinned is not None:
+        return pinned
+    return reference_registry.current
+
+
+@contextmanager
+def pin_reference_data(data: Optional[ReferenceData] = None) -> Iterator[ReferenceData]:
+    """
+    All reads of reference data inside the block see the same snapshot.
+    Without explicit data nested blocks reuse the outer snapshot, otherwise the current one is pinned.
+    """
+    if data is None:
+        pinned = _pinned_reference_data.get()
+        if pinned is not None:
+            yield pinned
+            return
+        data = reference_registry.current
+
+    token = _pinned_reference_data.set(data)
+    try:
+        yield data
+    finally:
+        _pinned_reference_data.reset(token)
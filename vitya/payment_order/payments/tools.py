@@ -1,5 +1,14 @@
-from vitya.payment_order.enums import AccountKind
+from itertools import repeat
+from typing import Iterable, List, Optional, Sequence
+
+from vitya.payment_order.enums import AccountKind, PaymentType
 from vitya.payment_order.fields import AccountNumber
+from vitya.payment_order.payments.constants import (
+    CUSTOMS_RECEIVER_ACCOUNT_NUMBER,
+    FNS_KPP,
+    FNS_RECEIVER_ACCOUNT_NUMBER,
+    FTS_KPP,
+)
 
 IP_ACCOUNTS_PREFIXES_5 = {
     '40802', '45914', '47610', '47611', '47832',
@@ -32,8 +41,127 @@ PREFIX_3_TO_ACCOUNT_KIND = {
 }
 
 
-def get_account_kind(account_number: AccountNumber) -> AccountKind:
+_ACCOUNT_KINDS = tuple(AccountKind)
+
+
+def _build_account_kind_table() -> bytes:
+    # index is int value of the first 5 digits, value is index in _ACCOUNT_KINDS
+    table = bytearray([_ACCOUNT_KINDS.index(AccountKind.LE)]) * 100_000
+    for prefix_3, kind in PREFIX_3_TO_ACCOUNT_KIND.items():
+        start = int(prefix_3) * 100
+        table[start:start + 100] = bytes([_ACCOUNT_KINDS.index(kind)]) * 100
+    for prefix_5, kind in PREFIX_5_TO_ACCOUNT_KIND.items():
+        table[int(prefix_5)] = _ACCOUNT_KINDS.index(kind)
+    return bytes(table)
+
+
+ACCOUNT_KIND_TABLE = _build_account_kind_table()
+
+
+def _get_account_kind_by_dicts(account_number: str) -> AccountKind:
     try:
         return PREFIX_5_TO_ACCOUNT_KIND[account_number[:5]]
     except KeyError:
         return PREFIX_3_TO_ACCOUNT_KIND.get(account_number[:3], AccountKind.LE)
+
+
+def _is_table_prefix(prefix: str) -> bool:
+    # int() also accepts signs, spaces and underscores, so the prefix is checked before indexing the table
+    return len(prefix) == 5 and prefix.isascii() and prefix.isdigit()
+
+
+def _get_account_kind(account_number: str) -> AccountKind:
+    prefix = account_number[:5]
+    if _is_table_prefix(prefix):
+        return _ACCOUNT_KINDS[ACCOUNT_KIND_TABLE[int(prefix)]]
+    return _get_account_kind_by_dicts(account_number)
+
+
+def get_account_kind(account_number: AccountNumber) -> AccountKind:
+    return _get_account_kind(account_number)
+
+
+def get_account_kind_many(account_numbers: Iterable[str]) -> List[AccountKind]:
+    prefixes = [account_number[:5] for account_number in account_numbers]
+    joined = ''.join(prefixes)
+    if len(joined) == 5 * len(prefixes) and joined.isascii() and joined.isdigit():
+        return [_ACCOUNT_KINDS[ACCOUNT_KIND_TABLE[int(prefix)]] for prefix in prefixes]
+    return [
+        _ACCOUNT_KINDS[ACCOUNT_KIND_TABLE[int(prefix)]] if _is_table_prefix(prefix) else _get_account_kind_by_dicts(prefix)
+        for prefix in prefixes
+    ]
+
+
+TREASURY_ACCOUNT_PREFIX = '03'
+TREASURY_TAX_ACCOUNT_PREFIX = '03100'
+TOFK_BIC_PREFIX = '00'  # БИК территориальных органов Федерального казначейства
+
+_PAYMENT_TYPES = tuple(PaymentType)
+_TAX_ACCOUNT = len(_PAYMENT_TYPES)  # resolved by account number and receiver kpp
+
+
+def _build_payment_type_table() -> bytes:
+    # same index as ACCOUNT_KIND_TABLE, value is index in _PAYMENT_TYPES or _TAX_ACCOUNT
+    kind_to_payment_type = bytearray(256)
+    for kind_index, kind in enumerate(_ACCOUNT_KINDS):
+        kind_to_payment_type[kind_index] = _PAYMENT_TYPES.index(PaymentType(kind.value))
+    table = bytearray(ACCOUNT_KIND_TABLE.translate(kind_to_payment_type))
+
+    treasury_start = int(TREASURY_ACCOUNT_PREFIX.ljust(5, '0'))
+    table[treasury_start:treasury_start + 1000] = bytes([_PAYMENT_TYPES.index(PaymentType.BUDGET_OTHER)]) * 1000
+    table[int(TREASURY_TAX_ACCOUNT_PREFIX)] = _TAX_ACCOUNT
+    return bytes(table)
+
+
+PAYMENT_TYPE_TABLE = _build_payment_type_table()
+
+
+def _resolve_tax_account(receiver_account: str, receiver_kpp: Optional[str]) -> PaymentType:
+    if receiver_account == FNS_RECEIVER_ACCOUNT_NUMBER:
+        return PaymentType.FNS
+    if receiver_account == CUSTOMS_RECEIVER_ACCOUNT_NUMBER:
+        return PaymentType.CUSTOMS
+    if receiver_kpp == FNS_KPP:
+        return PaymentType.FNS
+    if receiver_kpp == FTS_KPP:
+        return PaymentType.CUSTOMS
+    return PaymentType.BUDGET_OTHER
+
+
+def infer_payment_type(
+    receiver_account: str,
+    receiver_bic: Optional[str] = None,
+    receiver_kpp: Optional[str] = None,
+) -> PaymentType:
+    """
+    Treasury accounts "03..." are budget payments: "03100" accounts are resolved to FNS or customs
+    by account number or receiver kpp, accounts in TOFK (bic starts with "00") are budget too.
+    Other accounts are classified by get_account_kind.
+    """
+    prefix = receiver_account[:5]
+    if _is_table_prefix(prefix):
+        code = PAYMENT_TYPE_TABLE[int(prefix)]
+        if code == _TAX_ACCOUNT:
+            return _resolve_tax_account(receiver_account, receiver_kpp)
+        payment_type = _PAYMENT_TYPES[code]
+    else:
+        payment_type = PaymentType(_get_account_kind_by_dicts(receiver_account).value)
+
+    if receiver_bic is not None and receiver_bic.startswith(TOFK_BIC_PREFIX) and not payment_type.is_budget:
+        return PaymentType.BUDGET_OTHER
+    return payment_type
+
+
+def infer_payment_type_many(
+    receiver_accounts: Sequence[str],
+    receiver_bics: Optional[Sequence[Optional[str]]] = None,
+    receiver_kpps: Optional[Sequence[Optional[str]]] = None,
+) -> List[PaymentType]:
+    return [
+        infer_payment_type(receiver_account, receiver_bic, receiver_kpp)
+        for receiver_account, receiver_bic, receiver_kpp in zip(
+            receiver_accounts,
+            repeat(None) if receiver_bics is None else receiver_bics,
+            repeat(None) if receiver_kpps is None else receiver_kpps,
+        )
+    ]
@@ -1,7 +1,11 @@
 import re
+import sys
+from array import array
 from datetime import date
 from decimal import Decimal, InvalidOperation
-from typing import Optional, Union
+from functools import lru_cache
+from operator import mul
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from vitya.errors import (
     PayerKPPValidationValueCannotZerosStarts,
@@ -14,8 +18,10 @@ from vitya.payment_order.errors import (
     AccountNumberValidationSizeError,
     AccountNumberValidationTypeError,
     AmountNotANumber,
+    AmountValidationError,
     AmountValidationLengthError,
     AmountValidationLessOrEqualZeroError,
+    AmountValidationScaleError,
     CBCValidationTypeError,
     CBCValidationValueCannotZerosOnly,
     CBCValidationValueDigitsOnlyError,
@@ -53,10 +59,14 @@ from vitya.payment_order.errors import (
 from vitya.payment_order.payments.constants import (
     CHANGE_YEAR,
     CHARS_FOR_PURPOSE,
-    PAYER_STATUSES,
-    PAYER_STATUSES_AFTER_2024,
     REPLACE_CHARS_FOR_SPACE,
 )
+from vitya.payment_order.payments.reference import get_reference_data
+
+_ACCOUNT_IN_NAME_RE = re.compile('4[0-9]{19}')
+_DIGITS_RE = re.compile(r'^[0-9]+$')
+_AMOUNT_RE = re.compile(r'([+-]?)([0-9]+)(?:[.,]([0-9]+))?')
+_ZERO_AMOUNT = Decimal(0)
 
 
 def validate_number(
@@ -76,12 +86,85 @@ def validate_amount(amount: str) -> Decimal:
         value = Decimal(amount)
     except InvalidOperation:
         raise AmountNotANumber
-    if value <= Decimal(0.0):
+    if value <= _ZERO_AMOUNT:
         raise AmountValidationLessOrEqualZeroError
 
     return value
 
 
+def _decimal_to_kopecks(value: Decimal) -> int:
+    if not value.is_finite():
+        raise AmountNotANumber
+    if value <= _ZERO_AMOUNT:
+        raise AmountValidationLessOrEqualZeroError
+    numerator, denominator = value.as_integer_ratio()
+    if numerator * 100 % denominator != 0:
+        raise AmountValidationScaleError
+    return numerator * 100 // denominator
+
+
+def validate_amount_kopecks(amount: Union[str, int, float, Decimal]) -> int:
+    """
+    Amount as int number of kopecks. String is rubles with optional sign and optional fraction
+    after "." or ",", e.g. "1000", "1000.5", "1000,50"; exponents, spaces and thousand separators are not allowed.
+    Fraction digits after kopecks must be zeros, numbers (float by its repr) are converted exactly.
+    """
+    if isinstance(amount, str):
+        if len(amount) > 18:
+            raise AmountValidationLengthError
+        digits = amount[:-3] + amount[-2:] if len(amount) > 3 and amount[-3] in '.,' else ''
+        if amount.isascii() and amount.isdigit():
+            kopecks = int(amount) * 100
+        elif digits.isascii() and digits.isdigit():  # the most common "rubles.kopecks"
+            kopecks = int(digits)
+        else:
+            match = _AMOUNT_RE.fullmatch(amount)
+            if match is None:
+                raise AmountNotANumber
+            sign, rubles, fraction = match.groups()
+            if sign == '-':
+                raise AmountValidationLessOrEqualZeroError
+            if fraction is None:
+                fraction = '00'
+            elif len(fraction) < 2:
+                fraction += '0'
+            elif fraction[2:].strip('0'):
+                raise AmountValidationScaleError
+            kopecks = int(rubles + fraction[:2])
+    elif isinstance(amount, bool):
+        raise AmountNotANumber
+    elif isinstance(amount, int):
+        kopecks = amount * 100
+    elif isinstance(amount, float):
+        kopecks = _decimal_to_kopecks(Decimal(repr(amount)))
+    elif isinstance(amount, Decimal):
+        kopecks = _decimal_to_kopecks(amount)
+    else:
+        raise AmountNotANumber
+
+    if kopecks <= 0:
+        raise AmountValidationLessOrEqualZeroError
+    return kopecks
+
+
+def validate_amount_kopecks_many(
+    amounts: Iterable[Union[str, int, float, Decimal]],
+) -> Tuple[List[int], Dict[int, AmountValidationError]]:
+    """
+    Batch form of validate_amount_kopecks for column of amounts,
+    returns kopecks (0 for invalid amounts) and errors by index
+    """
+    result = []
+    errors: Dict[int, AmountValidationError] = {}
+    for index, amount in enumerate(amounts):
+        try:
+            result.append(validate_amount_kopecks(amount))
+        except AmountValidationError as e:
+            errors[index] = e
+            result.append(0)
+    return result, errors
+
+
 def validate_customer(value: str) -> str:
     len_value = len(value)
     if len_value < 1 or len_value > 160:
@@ -102,11 +185,32 @@ def validate_receiver(value: str) -> str:
         validate_customer(value)
     except CustomerValidationSizeError as e:
         raise ReceiverValidationSizeError from e
-    if bool(re.match('(.*)(4)[0-9]{19}', value)):
+    if find_account_in_name(value) != -1:
         raise ReceiverValidationNameError
     return value
 
 
+def find_account_in_name(value: str) -> int:
+    """
+    Position of account number (20 digits starting with 4) in the first line of name or -1.
+    Fixed length pattern is tried at every "4", so each char is scanned at most 20 times.
+    """
+    end = value.find('\n')
+    match = _ACCOUNT_IN_NAME_RE.search(value, 0, len(value) if end == -1 else end)
+    return -1 if match is None else match.start()
+
+
+def find_account_in_name_many(values: Iterable[str]) -> List[int]:
+    """
+    Batch form of find_account_in_name, column of single line names without accounts is scanned at once
+    """
+    values = list(values)
+    joined = ' '.join(values)
+    if '\n' not in joined and _ACCOUNT_IN_NAME_RE.search(joined) is None:
+        return [-1] * len(values)
+    return [find_account_in_name(value) for value in values]
+
+
 def validate_payment_order(value: Optional[Union[int, str]]) -> int:
     if value is None or value == '':
         return 5
@@ -151,42 +255,103 @@ def validate_operation_kind(value: str) -> str:
     return value
 
 
+# both weighted sums of UIN control digit are accumulated in one pass as sum_1 + sum_2 * _UIN_SUMS_SCALE
+_UIN_SUMS_SCALE = 10_000  # greater than any sum of 24 digits with weights up to 10
+
+
+@lru_cache(maxsize=None)
+def _get_uin_weights(length: int) -> Tuple[Tuple[int, ...], int]:
+    """
+    Combined weights for UIN digits: 1..10 repeated for the first sum and 3..10, 1..10 repeated for the second,
+    and the weighted sum of ascii code of "0", to get sums from ascii codes of digits without converting them
+    """
+    weights = tuple(i % 10 + 1 + ((i + 2) % 10 + 1) * _UIN_SUMS_SCALE for i in range(length))
+    return weights, ord('0') * sum(weights)
+
+
+def _get_uin_control_digit(codes: bytes) -> int:
+    weights, zero_sum = _get_uin_weights(len(codes))
+    sums: int = sum(map(mul, codes, weights)) - zero_sum
+    sum_1 = sums % _UIN_SUMS_SCALE
+    if sum_1 == 0:
+        raise UINValidationOnlyZeroError
+
+    mod_11 = sum_1 % 11
+    if mod_11 != 10:
+        return mod_11
+    mod_11 = sums // _UIN_SUMS_SCALE % 11
+    return 0 if mod_11 == 10 else mod_11
+
+
+def get_uin_control_digit(value: str) -> int:
+    """
+    Control digit of UIN for its ascii digits without the control one
+    """
+    return _get_uin_control_digit(value.encode('ascii'))
+
+
+def _is_ascii_digits(value: str) -> bool:
+    return value.isascii() and value.isdigit()
+
+
 def validate_uin_control_sum(
     value: str
 ) -> None:
-    if not only_digits(value):
+    if not _is_ascii_digits(value):
         raise UINValidationDigitsOnlyError
     if len(value) != 20 and len(value) != 25:
         return
 
-    count = 1
-    sum_ = 0
-    for c in value[:-1:]:
-        if count > 10:
-            count = 1
-        sum_ += int(c) * count
-        count += 1
-
-    if sum_ == 0:
-        raise UINValidationOnlyZeroError
+    codes = value.encode('ascii')
+    if _get_uin_control_digit(codes[:-1]) != codes[-1] - 48:
+        raise UINValidationControlSumError
 
-    mod_11 = sum_ % 11
-    if mod_11 != 10:
-        if mod_11 != int(value[-1]):
-            raise UINValidationControlSumError
-        return
 
-    count = 3
-    sum_ = 0
-    for c in value[:-1:]:
-        if count > 10:
-            count = 1
-        sum_ += int(c) * count
-        count += 1
-    mod_11 = sum_ % 11
-    mod_11 = 0 if mod_11 == 10 else mod_11
-    if mod_11 != int(value[-1]):
-        raise UINValidationControlSumError
+# combined weighted sums are less than 24 * ord('9') * 100_010 < 2 ** 32 and fit in a lane of unsigned int
+_UIN_LANE_SIZE = array('I').itemsize
+_UIN_LANE_OFFSET = 0 if sys.byteorder == 'little' else _UIN_LANE_SIZE - 1  # offset of the lowest byte
+
+
+def _get_uin_sums_many(values: Sequence[str], length: int) -> List[int]:
+    """
+    Combined weighted sums of UINs of ascii digits of the same length, without the control digit.
+    Computed for all values at once: each digit position is a column of bytes spread to lanes
+    of one big int, so sums take one big int multiplication and addition per position.
+    """
+    codes = ''.join(values).encode('ascii')
+    weights, zero_sum = _get_uin_weights(length - 1)
+    lanes = bytearray(_UIN_LANE_SIZE * len(values))
+    total = 0
+    for position, weight in enumerate(weights):
+        lanes[_UIN_LANE_OFFSET::_UIN_LANE_SIZE] = codes[position::length]
+        total += weight * int.from_bytes(lanes, sys.byteorder)
+    sums = memoryview(total.to_bytes(len(lanes), sys.byteorder)).cast('I')
+    return [value - zero_sum for value in sums]
+
+
+def validate_uin_control_sum_many(values: Sequence[str]) -> List[bool]:
+    """
+    Batch form of validate_uin_control_sum, returns mask of values it accepts
+    """
+    result = []
+    indexes_by_length: Dict[int, List[int]] = {20: [], 25: []}
+    for index, value in enumerate(values):
+        is_digits = _is_ascii_digits(value)
+        result.append(is_digits)
+        if is_digits and len(value) in indexes_by_length:
+            indexes_by_length[len(value)].append(index)
+
+    for length, indexes in indexes_by_length.items():
+        if not indexes:
+            continue
+        sums = _get_uin_sums_many([values[index] for index in indexes], length)
+        for index, combined_sum in zip(indexes, sums):
+            sum_1 = combined_sum % _UIN_SUMS_SCALE
+            mod_11 = sum_1 % 11
+            if mod_11 == 10:
+                mod_11 = combined_sum // _UIN_SUMS_SCALE % 11 % 10
+            result[index] = sum_1 != 0 and mod_11 == ord(values[index][-1]) - 48
+    return result
 
 
 def validate_uin(value: str) -> Optional[str]:
@@ -203,7 +368,7 @@ def validate_uin(value: str) -> Optional[str]:
 
 
 def only_digits(value: str) -> bool:
-    return re.match(r'^[0-9]+$', value) is not None
+    return _DIGITS_RE.match(value) is not None
 
 
 def validate_purpose_code(value: int) -> int:
@@ -214,7 +379,34 @@ def validate_purpose_code(value: int) -> int:
     return value
 
 
-_PURPOSE_TRANS_TABLE = str.maketrans({char: ' ' for char in REPLACE_CHARS_FOR_SPACE})
+# every char not allowed in purpose, replaced by space if it is whitespace or deleted otherwise
+_PURPOSE_DISALLOWED_RE = re.compile('[^' + ''.join(re.escape(char) for char in sorted(CHARS_FOR_PURPOSE)) + ']')
+_PURPOSE_REPLACEMENTS = {char: ' ' for char in REPLACE_CHARS_FOR_SPACE}
+
+
+def _replace_purpose_chars(match: 're.Match[str]') -> str:
+    return _PURPOSE_REPLACEMENTS.get(match.group(), '')
+
+
+def sanitize_purpose(value: str) -> str:
+    """
+    Replaces whitespace by spaces and deletes chars not allowed in purpose in one pass,
+    clean text (printable ASCII or allowed chars only) is returned as is
+    """
+    if value.isascii() and value.isprintable():
+        return value
+    return _PURPOSE_DISALLOWED_RE.sub(_replace_purpose_chars, value)
+
+
+def sanitize_purpose_many(values: Iterable[str]) -> List[str]:
+    """
+    Batch form of sanitize_purpose, checks clean batch of printable ASCII texts at once
+    """
+    values = list(values)
+    joined = ' '.join(values)
+    if joined.isascii() and joined.isprintable():
+        return values
+    return [sanitize_purpose(value) for value in values]
 
 
 def validate_purpose(value: str) -> Optional[str]:
@@ -224,7 +416,7 @@ def validate_purpose(value: str) -> Optional[str]:
     if value == '':
         return None
 
-    value = ''.join(c for c in value.translate(_PURPOSE_TRANS_TABLE) if c in CHARS_FOR_PURPOSE)
+    value = sanitize_purpose(value)
     if len(value) > 210:
         raise PurposeValidationMaxLenError
     return value
@@ -233,7 +425,8 @@ def validate_purpose(value: str) -> Optional[str]:
 def validate_payer_status(value: str) -> str:
     if not isinstance(value, str):
         raise PayerStatusValidationTypeError
-    elif value not in (PAYER_STATUSES if date.today().year < CHANGE_YEAR else PAYER_STATUSES_AFTER_2024):
+    reference = get_reference_data()
+    if value not in (reference.payer_statuses if date.today().year < CHANGE_YEAR else reference.payer_statuses_after_2024):
         raise PayerStatusValidationValueError
     return value
 
@@ -0,0 +1,52 @@
+import gc
+from importlib import import_module
+from typing import Iterable, Type
+
+from vitya.canonicalize import KINDS, get_translate_table
+from vitya.payment_order.ingest.mapping import get_fields_by_type
+from vitya.payment_order.payments.checkers import (
+    BaseModelChecker,
+    get_checker_parameters,
+    is_counterparty_checker,
+)
+from vitya.payment_order.payments.reference import get_reference_data
+
+# importing these modules compiles their regexes and builds prefix tables
+WARMUP_MODULES = (
+    'vitya.validators',
+    'vitya.payment_order.validators',
+    'vitya.payment_order.fields',
+    'vitya.payment_order.payments.checks',
+    'vitya.payment_order.payments.tools',
+    'vitya.payment_order.payments.batch',
+    'vitya.error_description',
+)
+
+
+def warmup(model_classes: Iterable[Type[BaseModelChecker]] = (), freeze: bool = True) -> None:
+    """
+    Prepares vitya state in the master process before forking workers: imports modules, resolves checker
+    signatures and wirings of model_classes, builds translate tables and reference data. With freeze
+    all objects are moved to the permanent generation by gc.freeze(), so garbage collection in workers
+    does not write to these pages and they stay shared.
+    """
+    for module_name in WARMUP_MODULES:
+        import_module(module_name)
+
+    model_classes = list(model_classes)
+    checker_classes = {*BaseModelChecker.__auto_checkers__}
+    for model_cls in model_classes:
+        model_cls._wire_auto_checkers()
+        get_fields_by_type(model_cls)
+        checker_classes.update(checker_cls for checker_cls, _ in model_cls.__final_wired_checkers__)
+    for checker_cls in checker_classes:
+        get_checker_parameters(checker_cls)
+        is_counterparty_checker(checker_cls)
+
+    for kind in KINDS:
+        get_translate_table(kind)
+    get_reference_data()
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
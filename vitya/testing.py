@@ -0,0 +1,364 @@
+import random
+from datetime import date
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from vitya.errors import INNValidationControlSumError
+from vitya.payment_order.enums import PaymentType
+from vitya.payment_order.errors import (
+    AmountValidationLessOrEqualZeroError,
+    CBCValidationEmptyNotAllowed,
+    OKTMOValidationFTS,
+    PayerKPPValidationINN12OnlyEmptyError,
+    PayerStatusValidationNullNotAllowedError,
+    PurposeValidationValueEmptyErrorForNonFNS,
+    ReceiverAccountValidationBICValueError,
+    ReceiverAccountValidationFNSValueError,
+    ReceiverINNValidationIPLenError,
+    ReceiverINNValidationLELenError,
+    ReceiverKPPValidationFNS,
+    ReceiverKPPValidationOnlyEmptyError,
+    UINValidationControlSumError,
+    UINValidationFNSOrFTSLenError,
+)
+from vitya.payment_order.payments.checks import get_bic_key_digits
+from vitya.payment_order.payments.constants import (
+    CHANGE_YEAR,
+    CUSTOMS_RECEIVER_ACCOUNT_NUMBER,
+    FNS_CBC_ADMINISTRATOR,
+    FNS_RECEIVER_ACCOUNT_NUMBER,
+    FTS_CBC_ADMINISTRATOR,
+)
+from vitya.payment_order.payments.reference import get_reference_data
+from vitya.payment_order.payments.tools import (
+    CHAMELEON_PREFIXES_5,
+    FL_ACCOUNTS_PREFIXES_5,
+    IP_ACCOUNTS_PREFIXES_5,
+)
+from vitya.payment_order.validators import get_uin_control_digit
+from vitya.validators import get_inn_control_digits, get_snils_checksum
+
+ACCOUNT_PREFIXES = {
+    PaymentType.IP: sorted(IP_ACCOUNTS_PREFIXES_5),
+    PaymentType.FL: sorted(FL_ACCOUNTS_PREFIXES_5),
+    PaymentType.LE: ['40701', '40702', '40703'],
+    PaymentType.CHAMELEON: sorted(CHAMELEON_PREFIXES_5),
+}
+
+PURPOSES = [
+    'Оплата по счету № {number}',
+    'Оплата по договору {number} НДС не облагается',
+    'Возврат займа по договору {number}',
+    'Перевод собственных средств',
+    'Заработная плата за {month} {year} г.',
+]
+
+PAYMENT_FIELDS = (
+    'payment_type',
+    'amount',
+    'receiver_account_number',
+    'receiver_bic',
+    'receiver_inn',
+    'receiver_kpp',
+    'payer_inn',
+    'payer_kpp',
+    'payer_status',
+    'purpose',
+    'uin',
+    'cbc',
+    'oktmo',
+    'reason',
+    'tax_period',
+    'document_number',
+    'document_date',
+    'operation_kind',
+    'for_third_person',
+)
+
+
+def _digits(rng: random.Random, count: int) -> str:
+    return str(rng.randrange(10 ** count)).zfill(count)
+
+
+def _break_digit(rng: random.Random, digit: str) -> str:
+    return str((int(digit) + rng.randint(1, 9)) % 10)
+
+
+def make_inn(rng: random.Random, length: int = 10, valid: bool = True) -> str:
+    """
+    INN of legal entity (10 digits) or individual (12 digits), with wrong last control digit if not valid
+    """
+    if length == 10:
+        inn = str(rng.randint(10, 99)) + _digits(rng, 7)
+    elif length == 12:
+        inn = str(rng.randint(10, 99)) + _digits(rng, 8)
+    else:
+        raise ValueError('inn length must be 10 or 12')
+    inn += get_inn_control_digits(inn)
+    return inn if valid else inn[:-1] + _break_digit(rng, inn[-1])
+
+
+def make_ogrn(rng: random.Random, is_ip: bool = False, valid: bool = True) -> str:
+    """
+    OGRN (13 digits) or OGRNIP (15 digits) with control digit
+    """
+    if is_ip:
+        ogrn = '3' + _digits(rng, 13)
+        ogrn += str(int(ogrn) % 13 % 10)
+    else:
+        ogrn = str(rng.choice('15')) + _digits(rng, 11)
+        ogrn += str(int(ogrn) % 11 % 10)
+    return ogrn if valid else ogrn[:-1] + _break_digit(rng, ogrn[-1])
+
+
+def make_snils(rng: random.Random, valid: bool = True) -> str:
+    number = str(rng.randint(1001999, 999999999)).zfill(9)
+    checksum = get_snils_checksum(number)
+    if not valid:
+        # checksum 100 is written as '00', so the broken one is picked among two digit suffixes
+        checksum = f'{(int(checksum) + rng.randint(1, 99)) % 100:02d}'
+    return number + checksum
+
+
+def make_uin(rng: random.Random, valid: bool = True) -> str:
+    uin = str(rng.randint(1, 9)) + _digits(rng, 18)
+    uin += str(get_uin_control_digit(uin))
+    return uin if valid else uin[:-1] + _break_digit(rng, uin[-1])
+
+
+def make_bic(rng: random.Random) -> str:
+    return '04' + _digits(rng, 4) + str(rng.randint(50, 999)).zfill(3)
+
+
+def make_account(rng: random.Random, bic: str, prefix: str = '40702', valid: bool = True) -> str:
+    """
+    Account number of 20 digits with control key (9th digit) for bic
+    """
+    account = prefix + '810' + '0' + _digits(rng, 20 - len(prefix) - 4)
+    # weights 7, 1, 3 of key check (see check_account_by_bic), the key digit has weight 3 and 3 * 7 = 1 mod 10
+    key_sum = sum(int(c) * w for c, w in zip(get_bic_key_digits(bic) + account, [7, 1, 3] * 8))
+    key = -key_sum * 7 % 10
+    if not valid:
+        key = (key + rng.randint(1, 9)) % 10
+    return account[:8] + str(key) + account[9:]
+
+
+def make_kpp(rng: random.Random) -> str:
+    return str(rng.randint(1000, 9999)) + rng.choice(['01', '43', '45']) + str(rng.randint(1, 999)).zfill(3)
+
+
+def make_oktmo(rng: random.Random) -> str:
+    return str(rng.randint(1, 9)) + _digits(rng, 7)
+
+
+class GeneratedPayment(NamedTuple):
+    values: Dict[str, Any]  # model data by PAYMENT_FIELDS
+    error: Optional[Type[Exception]]  # error the payment is broken with, None for valid payment
+
+
+class PaymentBreaker(NamedTuple):
+    payment_types: FrozenSet[PaymentType]
+    apply: Callable[[random.Random, Dict[str, Any]], None]
+
+
+def _set(**values: Any) -> Callable[[random.Random, Dict[str, Any]], None]:
+    def apply(rng: random.Random, payment: Dict[str, Any]) -> None:
+        payment.update({
+            field_name: value(rng, payment) if callable(value) else value for field_name, value in values.items()
+        })
+    return apply
+
+
+_BUDGET = frozenset(PaymentType.budget_types())
+_NOT_BUDGET = frozenset(PaymentType) - _BUDGET
+
+# each breaker makes valid payment fail with exactly one error
+PAYMENT_BREAKERS: Dict[Type[Exception], PaymentBreaker] = {
+    AmountValidationLessOrEqualZeroError: PaymentBreaker(frozenset(PaymentType), _set(amount='0')),
+    INNValidationControlSumError: PaymentBreaker(
+        frozenset(PaymentType),
+        _set(receiver_inn=lambda rng, p: p['receiver_inn'][:-1] + _break_digit(rng, p['receiver_inn'][-1])),
+    ),
+    ReceiverAccountValidationBICValueError: PaymentBreaker(
+        _NOT_BUDGET,
+        _set(receiver_account_number=lambda rng, p: make_account(
+            rng, p['receiver_bic'], p['receiver_account_number'][:5], valid=False,
+        )),
+    ),
+    ReceiverAccountValidationFNSValueError: PaymentBreaker(
+        frozenset({PaymentType.FNS}),
+        _set(receiver_account_number=CUSTOMS_RECEIVER_ACCOUNT_NUMBER),
+    ),
+    ReceiverINNValidationIPLenError: PaymentBreaker(
+        frozenset({PaymentType.IP}),
+        _set(receiver_inn=lambda rng, p: make_inn(rng, 10)),
+    ),
+    ReceiverINNValidationLELenError: PaymentBreaker(
+        _BUDGET | {PaymentType.LE},
+        _set(receiver_inn=lambda rng, p: make_inn(rng, 12)),
+    ),
+    ReceiverKPPValidationOnlyEmptyError: PaymentBreaker(
+        frozenset({PaymentType.IP, PaymentType.FL}),
+        _set(receiver_kpp=lambda rng, p: make_kpp(rng)),
+    ),
+    ReceiverKPPValidationFNS: PaymentBreaker(
+        frozenset({PaymentType.FNS}),
+        _set(receiver_kpp=lambda rng, p: get_reference_data().fts_kpp),
+    ),
+    PurposeValidationValueEmptyErrorForNonFNS: PaymentBreaker(
+        frozenset(PaymentType) - {PaymentType.FNS},
+        _set(purpose=None),
+    ),
+    PayerStatusValidationNullNotAllowedError: PaymentBreaker(_BUDGET, _set(payer_status=None)),
+    PayerKPPValidationINN12OnlyEmptyError: PaymentBreaker(
+        _BUDGET,
+        _set(payer_inn=lambda rng, p: make_inn(rng, 12), payer_kpp=lambda rng, p: make_kpp(rng)),
+    ),
+    UINValidationControlSumError: PaymentBreaker(_BUDGET, _set(uin=lambda rng, p: make_uin(rng, valid=False))),
+    UINValidationFNSOrFTSLenError: PaymentBreaker(
+        frozenset({PaymentType.FNS, PaymentType.CUSTOMS}),
+        _set(uin=lambda rng, p: _digits(rng, 3) + str(rng.randint(1, 9))),
+    ),
+    CBCValidationEmptyNotAllowed: PaymentBreaker(frozenset({PaymentType.FNS, PaymentType.CUSTOMS}), _set(cbc=None)),
+    OKTMOValidationFTS: PaymentBreaker(frozenset({PaymentType.CUSTOMS}), _set(oktmo=lambda rng, p: make_oktmo(rng))),
+}
+
+
+def _get_payer_statuses(payment_type: PaymentType) -> List[str]:
+    reference = get_reference_data()
+    statuses = reference.payer_statuses if date.today().year < CHANGE_YEAR else reference.payer_statuses_after_2024
+    if payment_type == PaymentType.FNS:
+        return sorted(statuses & reference.fns_tax_payer_statuses)
+    if payment_type == PaymentType.CUSTOMS:
+        return sorted(statuses & reference.fts_tax_payer_statuses - {'06'})  # '06' is only for third person
+    return sorted(statuses - reference.fns_tax_payer_statuses - reference.fts_tax_payer_statuses)
+
+
+def _make_purpose(rng: random.Random) -> str:
+    return rng.choice(PURPOSES).format(
+        number=rng.randint(1, 99999), month=rng.randint(1, 12), year=rng.randint(2020, 2030),
+    )
+
+
+def make_payment(rng: random.Random, payment_type: PaymentType) -> Dict[str, Any]:
+    """
+    Values of valid payment of payment_type with all PAYMENT_FIELDS
+    """
+    payment: Dict[str, Any] = dict.fromkeys(PAYMENT_FIELDS)
+    bic = make_bic(rng)
+    payment.update(
+        payment_type=payment_type.value,
+        amount=f'{rng.randint(1, 10 ** 7)}.{rng.randint(0, 99):02d}',
+        receiver_bic=bic,
+        purpose=_make_purpose(rng),
+        operation_kind='01',
+        for_third_person=False,
+    )
+    if not payment_type.is_budget:
+        payment['receiver_account_number'] = make_account(rng, bic, rng.choice(ACCOUNT_PREFIXES[payment_type]))
+        if payment_type == PaymentType.LE or (payment_type == PaymentType.CHAMELEON and rng.random() < 0.5):
+            payment['receiver_inn'] = make_inn(rng, 10)
+            payment['receiver_kpp'] = make_kpp(rng)
+        else:
+            payment['receiver_inn'] = make_inn(rng, 12)
+        return payment
+
+    reference = get_reference_data()
+    payer_status = rng.choice(_get_payer_statuses(payment_type))
+    payment.update(
+        payer_status=payer_status,
+        receiver_inn=make_inn(rng, 10),
+        uin=make_uin(rng),
+        oktmo=make_oktmo(rng),
+    )
+    if payer_status in {'13', '16', '17'} or (payer_status != '01' and rng.random() < 0.5):
+        payment['payer_inn'] = make_inn(rng, 12)
+    else:
+        payment['payer_inn'] = make_inn(rng, 10)
+        payment['payer_kpp'] = make_kpp(rng)
+
+    if payment_type == PaymentType.FNS:
+        payment.update(
+            receiver_account_number=FNS_RECEIVER_ACCOUNT_NUMBER,
+            receiver_kpp=reference.fns_kpp,
+            cbc=FNS_CBC_ADMINISTRATOR + _digits(rng, 17),
+        )
+    elif payment_type == PaymentType.CUSTOMS:
+        payment.update(
+            receiver_account_number=CUSTOMS_RECEIVER_ACCOUNT_NUMBER,
+            receiver_kpp=reference.fts_kpp,
+            cbc=FTS_CBC_ADMINISTRATOR + _digits(rng, 17),
+            oktmo=reference.fts_oktmo,
+            tax_period=_digits(rng, 8),
+        )
+    else:
+        # payer status 31 requires treasury account of the budget receiver
+        prefix = '03212643' if payer_status == '31' else '03100643'
+        payment.update(
+            receiver_account_number=prefix + _digits(rng, 12),
+            receiver_kpp=make_kpp(rng),
+        )
+    return payment
+
+
+def _get_cumulative_ratios(error_ratios: Mapping[Type[Exception], float]) -> List[Tuple[float, Type[Exception]]]:
+    result = []
+    total = 0.0
+    for error_cls, ratio in error_ratios.items():
+        if error_cls not in PAYMENT_BREAKERS:
+            raise ValueError(f'generating payments with {error_cls.__name__} is not supported')
+        if ratio < 0:
+            raise ValueError('error ratio must not be negative')
+        total += ratio
+        result.append((total, error_cls))
+    if total > 1:
+        raise ValueError('sum of error ratios must not exceed 1')
+    return result
+
+
+def iter_payments(
+    seed: Optional[int] = None,
+    error_ratios: Optional[Mapping[Type[Exception], float]] = None,
+    payment_types: Sequence[PaymentType] = tuple(PaymentType),
+    count: Optional[int] = None,
+) -> Iterator[GeneratedPayment]:
+    """
+    Streams generated payments (endless if count is None), the same seed gives the same payments.
+    error_ratios is a share of payments broken with each error class of PAYMENT_BREAKERS, payment type
+    of broken payment is chosen among payment_types the error is possible for.
+    """
+    rng = random.Random(seed)
+    cumulative_ratios = _get_cumulative_ratios(error_ratios or {})
+    generated = 0
+    while count is None or generated < count:
+        generated += 1
+        error_cls = None
+        point = rng.random()
+        for total, cls in cumulative_ratios:
+            if point < total:
+                error_cls = cls
+                break
+
+        if error_cls is None:
+            yield GeneratedPayment(make_payment(rng, rng.choice(payment_types)), None)
+            continue
+
+        breaker = PAYMENT_BREAKERS[error_cls]
+        allowed_types = [payment_type for payment_type in payment_types if payment_type in breaker.payment_types]
+        if not allowed_types:
+            raise ValueError(f'{error_cls.__name__} is not possible for payment types {payment_types}')
+        payment = make_payment(rng, rng.choice(allowed_types))
+        breaker.apply(rng, payment)
+        yield GeneratedPayment(payment, error_cls)
@@ -1,3 +1,4 @@
+import os
 from typing import Any, Union, get_origin
 
 try:
@@ -18,3 +19,6 @@ def normalize_type(tp: Any) -> Any:
     if tp == NoneType or tp is None:
         return None
     return tp
+
+
+PathLike = Union[str, 'os.PathLike[str]']
@@ -18,6 +18,16 @@ from .errors import (
     OKTMOValidationValueLenError,
 )
 
+_DIGITS_RE = re.compile(r'[0-9]+')
+_KPP_RE = re.compile(r'[0-9]{4}[0-9A-Z]{2}[0-9]{3}')
+_OGRN_RE = re.compile(r'[1-9][0-9]+')
+_SNILS_RE = re.compile(r'[0-9]{11}')
+_OKTMO_RE = re.compile(r'([0-9]{11}|[0-9]{8})')
+
+_INN_COEFS_10 = [2, 4, 10, 3, 5, 9, 4, 6, 8]
+_INN_COEFS_11 = [7] + _INN_COEFS_10
+_INN_COEFS_12 = [3] + _INN_COEFS_11
+
 
 class ValidationError(ValueError):
     """
@@ -32,6 +42,27 @@ def _count_inn_checksum(inn: str, coefficients: List[int]) -> int:
     return n % 11 % 10
 
 
+def get_inn_control_digits(value: str) -> str:
+    """
+    Control digits of INN for its digits without the control ones: one for 9 digits (legal entity),
+    two for 10 digits (individual)
+    """
+    if len(value) == 9:
+        return str(_count_inn_checksum(value, _INN_COEFS_10))
+    if len(value) == 10:
+        n11 = _count_inn_checksum(value, _INN_COEFS_11)
+        return f'{n11}{_count_inn_checksum(value + str(n11), _INN_COEFS_12)}'
+    raise ValueError('inn without control digits must be of 9 or 10 digits')
+
+
+def get_snils_checksum(value: str) -> str:
+    """
+    Two digits checksum of SNILS for its first 9 digits
+    """
+    checksum = sum(int(digit) * (9 - i) for i, digit in enumerate(value)) % 101
+    return '00' if checksum == 100 else f'{checksum:02d}'
+
+
 def validate_inn(inn: str, is_ip: Optional[bool] = None) -> Optional[str]:
     """
     Source:
@@ -44,27 +75,23 @@ def validate_inn(inn: str, is_ip: Optional[bool] = None) -> Optional[str]:
     if inn in {'', '0'}:
         return None
 
-    if not re.fullmatch(r'[0-9]+', inn):
+    if not _DIGITS_RE.fullmatch(inn):
         raise INNValidationDigitsOnlyError
 
     if inn.startswith('00'):
         raise INNValidationStartsWithZerosError
 
-    coefs10 = [2, 4, 10, 3, 5, 9, 4, 6, 8]
-    coefs11 = [7] + coefs10
-    coefs12 = [3] + coefs11
-
     if len(inn) == 10 and is_ip is not True:
-        n10 = _count_inn_checksum(inn[:9], coefs10)
+        n10 = _count_inn_checksum(inn[:9], _INN_COEFS_10)
         if n10 != int(inn[9]):
             raise INNValidationControlSumError
         return inn
     elif len(inn) == 12 and is_ip is not False:
-        n11 = _count_inn_checksum(inn[:10], coefs11)
+        n11 = _count_inn_checksum(inn[:10], _INN_COEFS_11)
         if n11 != int(inn[10]):
             raise INNValidationControlSumError
 
-        n12 = _count_inn_checksum(inn[:11], coefs12)
+        n12 = _count_inn_checksum(inn[:11], _INN_COEFS_12)
         if n12 != int(inn[11]):
             raise INNValidationControlSumError
         return inn
@@ -94,7 +121,7 @@ def validate_kpp(kpp: str) -> Optional[str]:
     if len(kpp) != 9:
         raise KPPValidationValueLenError
 
-    if not re.fullmatch(r'[0-9]{4}[0-9A-Z]{2}[0-9]{3}', kpp):
+    if not _KPP_RE.fullmatch(kpp):
         raise KPPValidationValueError
     return kpp
 
@@ -111,7 +138,7 @@ def validate_bic(bic: str) -> str:
     if len(bic) != 9:
         raise BICValidationLenError
 
-    if not re.fullmatch(r'[0-9]+', bic):
+    if not _DIGITS_RE.fullmatch(bic):
         raise BICValidationValueDigitsOnlyError
     return bic
 
@@ -127,7 +154,7 @@ def validate_ogrn(ogrn: str, is_ip: Optional[bool] = None) -> None:
     if len(ogrn) != 13 and len(ogrn) != 15:
         raise ValidationError('wrong size of ogrn, it can be 13 chars only')
 
-    if not re.fullmatch(r'[1-9][0-9]+', ogrn):
+    if not _OGRN_RE.fullmatch(ogrn):
         raise ValidationError('wrong ogrn')
 
     if len(ogrn) == 13 and is_ip is not True:
@@ -157,28 +184,13 @@ def validate_snils(snils: str) -> None:
     if not isinstance(snils, str):
         raise ValidationError('snils should be passed as string')
 
-    if not re.fullmatch(r'[0-9]{11}', snils):
+    if not _SNILS_RE.fullmatch(snils):
         raise ValidationError('wrong snils')
 
     if int(snils[:9]) < 1001998:  # less than 001-001-998
         raise ValidationError('snils must be more than "001-001-998" ')
 
-    numbers = []
-    parts = [snils[0:3], snils[3:6], snils[6:9]]
-    for part in parts:
-        numbers.extend([int(num) for num in part])
-
-    results = [numbers[i - 1] * (10 - i) for i in range(1, 10)]
-    checksum = sum(results)
-
-    checksum = checksum % 101
-    if checksum == 100:
-        checksum_str = '00'
-    elif checksum < 10:
-        checksum_str = f'0{checksum}'
-    else:
-        checksum_str = str(checksum)
-
+    checksum_str = get_snils_checksum(snils[:9])
     if checksum_str != snils[-2:]:
         raise ValidationError(f'wrong checksum: {snils[-2:]}; expected: {checksum_str}')
 
@@ -194,6 +206,6 @@ def validate_oktmo(oktmo: str) -> Optional[str]:
         return None
     elif len(oktmo) not in {8, 11}:
         raise OKTMOValidationValueLenError
-    if not re.fullmatch(r'([0-9]{11}|[0-9]{8})', oktmo):
+    if not _OKTMO_RE.fullmatch(oktmo):
         raise OKTMOValidationValueError
     return oktmo